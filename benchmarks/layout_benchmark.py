@@ -0,0 +1,61 @@
+"""
+Compare the computation of the layout of large grids with Python loops and with NumPy arrays.
+
+Usage: python benchmarks/layout_benchmark.py [number_rows] [number_columns]
+"""
+
+import random
+import sys
+import timeit
+
+from pygamepopup import layout
+from pygamepopup.constants import DEFAULT_MARGIN_TOP, MARGIN_BOX
+
+POPUP_WIDTH = 1200
+REPETITIONS = 5
+
+
+def generate_metrics(number_rows: int, number_columns: int) -> layout.GridMetrics:
+    random_generator = random.Random(42)
+    row_lengths = [
+        random_generator.randint(1, number_columns) for _ in range(number_rows)
+    ]
+    number_elements = sum(row_lengths)
+    return layout.GridMetrics(
+        row_lengths,
+        [random_generator.randint(1, 2) for _ in range(number_elements)],
+        [random_generator.randint(20, 200) for _ in range(number_elements)],
+        [random_generator.randint(10, 60) for _ in range(number_elements)],
+        [random_generator.randint(0, 10) for _ in range(number_elements)],
+        [random_generator.randint(0, 20) for _ in range(number_elements)],
+    )
+
+
+def measure(metrics: layout.GridMetrics, vectorize: bool) -> float:
+    def compute() -> None:
+        layout.compute_text_container_widths(metrics, POPUP_WIDTH - 20, vectorize)
+        layout.compute_grid_layout(
+            metrics, POPUP_WIDTH, DEFAULT_MARGIN_TOP, MARGIN_BOX, vectorize
+        )
+
+    return min(timeit.repeat(compute, number=1, repeat=REPETITIONS))
+
+
+def main() -> None:
+    number_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    number_columns = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+    metrics = generate_metrics(number_rows, number_columns)
+    print(f"{len(metrics)} elements in {number_rows} rows")
+
+    loop_duration = measure(metrics, vectorize=False)
+    print(f"Python loops: {loop_duration * 1000:.2f} ms")
+    if not layout.is_vectorization_available():
+        print("NumPy is not installed, vectorized layout can't be measured")
+        return
+    vectorized_duration = measure(metrics, vectorize=True)
+    print(f"NumPy arrays: {vectorized_duration * 1000:.2f} ms")
+    print(f"Speedup: {loop_duration / vectorized_duration:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
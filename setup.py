@@ -25,4 +25,5 @@ setuptools.setup(
     package_data={"": ["images/*.png"]},
     python_requires=">=3.12",
     install_requires=["pygame-ce>=2.0.0"],
+    extras_require={"numpy": ["numpy>=1.20"]},
 )
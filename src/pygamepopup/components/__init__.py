@@ -1,6 +1,9 @@
 from .box_element import BoxElement
 from .button import Button
 from .dynamic_button import DynamicButton
+from .gauge import Gauge
 from .image_button import ImageButton
 from .info_box import InfoBox
+from .live_text_element import LiveTextElement
+from .rich_text_element import RichTextElement, TextSpan
 from .text_element import TextElement
@@ -5,12 +5,14 @@ All other components that should be drawn on a popup inherit from this class.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Optional, Union
 
 import pygame
 
 from .. import initialization
 from .._exceptions.wrong_initialization_exception import WrongInitializationException
+from ..memory import get_surfaces_memory_usage
+from ..render_backends import RenderBackend, refresh
 from ..type_definitions import Position, Margin
 
 
@@ -32,6 +34,7 @@ class BoxElement:
         size (tuple[int, int]): the size of the content following the format "(width, height)"
         margin (dict[str, int]): a dict containing all the values for margins TOP, BOTTOM, LEFT and RIGHT.
         column_span (int): the number of columns the element should span.
+        is_dirty (bool): whether the element changed since the last time it was displayed.
     """
 
     def __new__(cls, *args, **kwargs):
@@ -49,8 +52,14 @@ class BoxElement:
         margin: Margin = (0, 0, 0, 0),
         column_span: int = 1,
     ) -> None:
-        self.position: Position = position
-        self.content: pygame.Surface = content
+        self.is_dirty: bool = True
+        self.__dirty_area: Optional[pygame.Rect] = None
+        # Part of the content modified in place since the last display
+        self.__modified_area: Optional[pygame.Rect] = None
+        self._invalidation_listener: Optional[Callable[[BoxElement], None]] = None
+        self._content: Optional[pygame.Surface] = None
+        self._position: Position = position
+        self.content = content
         self.size: tuple[int, int] = (0, 0)
         if self.content:
             self.size = (self.content.get_width(), self.content.get_height())
@@ -62,6 +71,96 @@ class BoxElement:
         }
         self.column_span = column_span
 
+    @property
+    def content(self) -> Optional[pygame.Surface]:
+        """
+        Returns:
+            Optional[pygame.Surface]: the element wrapped in the box.
+        """
+        return self._content
+
+    @content.setter
+    def content(self, content: Optional[pygame.Surface]) -> None:
+        if content is self._content:
+            return
+        self._content = content
+        self.__modified_area = None
+        self.invalidate()
+
+    @property
+    def position(self) -> Position:
+        """
+        Returns:
+            Position: the position of the box on the screen.
+        """
+        return self._position
+
+    @position.setter
+    def position(self, position: Position) -> None:
+        self._position = position
+        self.invalidate()
+
+    def invalidate(self, area: Optional[pygame.Rect] = None) -> None:
+        """
+        Mark the element as changed so that it is redrawn on the next display.
+
+        The container of the element, if any, is notified of the change.
+
+        Keyword arguments:
+            area (Optional[pygame.Rect]): the part of the content that changed, relative to the top left corner
+                of the content. The whole element is considered as changed if not provided.
+        """
+        if area is not None:
+            self.__modified_area = (
+                pygame.Rect(area)
+                if self.__modified_area is None
+                else self.__modified_area.union(area)
+            )
+        if area is None:
+            self.__dirty_area = None
+        elif not self.is_dirty:
+            self.__dirty_area = pygame.Rect(area)
+        elif self.__dirty_area is not None:
+            self.__dirty_area = self.__dirty_area.union(area)
+        self.is_dirty = True
+        if self._invalidation_listener:
+            self._invalidation_listener(self)
+
+    def get_dirty_area(self) -> Optional[pygame.Rect]:
+        """
+        Returns:
+            Optional[pygame.Rect]: the part of the content that changed since the last display, relative to the
+            top left corner of the content, None if the whole element should be redrawn.
+        """
+        return self.__dirty_area if self.is_dirty else None
+
+    def _get_surfaces(self) -> list[Optional[pygame.Surface]]:
+        """
+        Returns:
+            list[Optional[pygame.Surface]]: all the surfaces held by the element.
+        """
+        return [self.content]
+
+    def get_memory_usage(self) -> int:
+        """
+        Returns:
+            int: the number of bytes taken by the surfaces held by the element.
+        """
+        return get_surfaces_memory_usage(self._get_surfaces())
+
+    def release_render_resources(self) -> None:
+        """
+        Drop the surfaces of the element that can be rendered again, to free memory.
+
+        The element should not be displayed until rebuild_render_resources is called.
+        The content of a raw BoxElement is given by the user, so it is kept.
+        """
+
+    def rebuild_render_resources(self) -> None:
+        """
+        Render again the surfaces dropped by release_render_resources, if any.
+        """
+
     def get_width(self) -> int:
         """
         Returns:
@@ -116,17 +215,47 @@ class BoxElement:
             self.size[1],
         )
 
-    def display(self, screen: pygame.Surface) -> None:
+    def finalize(self) -> None:
+        """
+        Convert the surfaces of the element rendered while the display was not available
+        to the pixel format of the display, to make their drawing faster.
+
+        Should be called from the main thread, once the display mode is set.
+        """
+
+    def _refresh_render_target(
+        self, screen: Union[pygame.Surface, RenderBackend]
+    ) -> None:
+        """
+        Notify the render target of the parts of the content that have been modified in place
+        since the last display.
+
+        Keyword arguments:
+            screen (Union[pygame.Surface, RenderBackend]): the screen on which the content of the box is drawn
+        """
+        if self.__modified_area is not None:
+            refresh(screen, self.content, self.__modified_area)
+            self.__modified_area = None
+
+    def display(self, screen: Union[pygame.Surface, RenderBackend]) -> None:
         """
         Display the content of the box, following the margins that should be added around it.
 
         Keyword arguments:
-            screen (pygame.Surface): the screen on which the content of the box should be drawn
-        """
-        screen.blit(
-            self.content,
-            (
-                self.position[0] + self.margin["LEFT"],
-                self.position[1] + self.margin["TOP"],
-            ),
+            screen (Union[pygame.Surface, RenderBackend]): the screen on which the content of the box should
+                be drawn
+        """
+        self.is_dirty = False
+        self._refresh_render_target(screen)
+        screen.blit(*self.get_blit())
+
+    def get_blit(self) -> tuple[pygame.Surface, Position]:
+        """
+        Returns:
+            tuple[pygame.Surface, Position]: the content of the box and the position at which it should be drawn,
+            following the margins that should be added around it.
+        """
+        return self.content, (
+            self.position[0] + self.margin["LEFT"],
+            self.position[1] + self.margin["TOP"],
         )
@@ -6,16 +6,21 @@ from __future__ import annotations
 
 import os.path
 from enum import Enum
-from typing import Union, Callable, Sequence
-from importlib import resources
+from typing import Union, Callable, Sequence, Optional, TYPE_CHECKING
 
 import pygame
 
 from .box_element import BoxElement
 from ..configuration import _default_sprites, _default_fonts, _default_colors
 from ..constants import BUTTON_SIZE
+from ..finalization import _convert_alpha, _finalize_surface, is_display_available
+from ..fonts import _get_font_signature
+from ..sprite_cache import _get_file_signature, _load_image, _load_or_render
 from ..type_definitions import Position, Margin
 
+if TYPE_CHECKING:
+    from ..glyph_atlas import GlyphAtlas
+
 
 class Button(BoxElement):
     """
@@ -26,6 +31,9 @@ class Button(BoxElement):
 
     Mouse motion is also handled: the button appearance can change according to current focus.
 
+    The callback can be a coroutine function, it is then scheduled by the MenuManager on its event loop
+    and the button can be put in a pending state until the coroutine is done.
+
     Keyword arguments:
         callback (Callable): the reference to the function that should be call after a click.
         size (tuple[int, int]): the size of the button following the format "(width, height)", defaults to BUTTON_SIZE.
@@ -38,10 +46,11 @@ class Button(BoxElement):
         margin (Margin): a tuple containing the margins of the box,
             should be in the form "(top_margin, right_margin, bottom_margin, left_margin)", defaults to (0, 0, 0, 0).
         disabled (bool): a boolean indicating if it is not possible to interact with the button, defaults to False.
-        font (pygame.font.Font): the font that should be used to render the text content.
+        font (pygame.font.Font): the font that should be used to render the text content, a GlyphAtlas can also
+            be given.
         text_color (pygame.Color): the color of the text content, defaults to value from configuration.
         font_hover (pygame.font.Font): the font that should be used to render the text content when the mouse is over
-            the button.
+            the button, a GlyphAtlas can also be given.
         text_hover_color (pygame.Color): the color of the text content when the mouse is over the button,
             defaults to value from configuration.
         complementary_text_lines (str): the other text lines that should be displayed in addition of
@@ -53,6 +62,8 @@ class Button(BoxElement):
         sprite (pygame.Surface): the pygame Surface corresponding to the sprite of the element.
         sprite_hover (pygame.Surface): the pygame Surface corresponding to the sprite of the element
             when it has the focus.
+        disabled (bool): whether it is not possible to interact with the button.
+        is_pending (bool): whether the coroutine started by the last click on the button is still running.
     """
 
     def __init__(
@@ -85,12 +96,9 @@ class Button(BoxElement):
             font = _default_fonts["button_title"]
         if not text_color:
             text_color = _default_colors["button_text_color"]["inactive"]
-        rendered_text_lines = Button.render_text_lines(text_lines, text_color, font)
         if no_background:
-            self.size = (
-                rendered_text_lines[0].get_width(),
-                rendered_text_lines[0].get_height() * len(rendered_text_lines),
-            )
+            title_width, title_height = font.size(text_lines[0])
+            self.size = (title_width, title_height * len(text_lines))
 
         if no_background:
             background_path = None
@@ -98,28 +106,86 @@ class Button(BoxElement):
             background_path = os.path.abspath(background_path)
         else:
             background_path = _default_sprites["button_background"]["inactive"]
-        self.sprite = self.render_sprite(background_path, rendered_text_lines)
+        self.__sprite_parameters = (background_path, text_lines, text_color, font)
 
         if not font_hover:
             font_hover = font
         if not text_hover_color:
             text_hover_color = _default_colors["button_text_color"]["active"]
-        rendered_text_lines_hover = Button.render_text_lines(
-            text_lines, text_hover_color, font_hover
-        )
-
         if no_background:
             background_hover_path = None
         elif background_hover_path:
             background_hover_path = os.path.abspath(background_hover_path)
         else:
             background_hover_path = _default_sprites["button_background"]["active"]
-        self.sprite_hover = self.render_sprite(
-            background_hover_path, rendered_text_lines_hover
+        self.__sprite_hover_parameters = (
+            background_hover_path,
+            text_lines,
+            text_hover_color,
+            font_hover,
+        )
+
+        self.sprite: Optional[pygame.Surface] = None
+        self.sprite_hover: Optional[pygame.Surface] = None
+        self._is_hovered: bool = False
+        self.__is_mouse_over: bool = False
+        self._render_sprites()
+        self._are_sprites_finalized: bool = is_display_available()
+        self.content = self.sprite_hover if self._is_hovered else self.sprite
+        self.disabled: bool = disabled
+        self.is_pending: bool = False
+        self.__is_disabled_before_pending: bool = disabled
+
+    def _render_sprites(self) -> None:
+        """
+        Compute the rendering of the sprites of the button, for when the mouse is over it or not.
+        """
+        self.sprite = self._render_sprite_with_cache(*self.__sprite_parameters)
+        self.sprite_hover = self._render_sprite_with_cache(
+            *self.__sprite_hover_parameters
         )
 
-        self.content = self.sprite
-        self.disabled = disabled
+    def _get_surfaces(self) -> list[Optional[pygame.Surface]]:
+        """
+        Returns:
+            list[Optional[pygame.Surface]]: all the surfaces held by the button.
+        """
+        return super()._get_surfaces() + [self.sprite, self.sprite_hover]
+
+    def release_render_resources(self) -> None:
+        """
+        Drop the sprites of the button, to free memory.
+
+        The button should not be displayed until rebuild_render_resources is called.
+        """
+        self.sprite = None
+        self.sprite_hover = None
+        self.content = None
+
+    def rebuild_render_resources(self) -> None:
+        """
+        Render again the sprites dropped by release_render_resources, if any.
+        """
+        if self.sprite is not None:
+            return
+        is_hovered = self._is_hovered
+        self._render_sprites()
+        self._are_sprites_finalized = is_display_available()
+        self.set_hover(is_hovered)
+
+    def finalize(self) -> None:
+        """
+        Convert the sprites of the button rendered while the display was not available
+        to the pixel format of the display, to make their drawing faster.
+
+        Should be called from the main thread, once the display mode is set.
+        """
+        if self._are_sprites_finalized or self.sprite is None:
+            return
+        self.sprite = _finalize_surface(self.sprite)
+        self.sprite_hover = _finalize_surface(self.sprite_hover)
+        self._are_sprites_finalized = True
+        self.set_hover(self._is_hovered)
 
     @staticmethod
     def render_text_lines(
@@ -140,6 +206,109 @@ class Button(BoxElement):
         """
         return [font.render(text_line, True, text_color) for text_line in text_lines]
 
+    def _render_sprite_with_cache(
+        self,
+        background_path: str,
+        text_lines: Sequence[str],
+        text_color: pygame.Color,
+        font: pygame.font.Font,
+    ) -> pygame.Surface:
+        """
+        Compute the rendering of the button with the given background and text lines, or load it from
+        the sprite cache if one is configured and already contains it.
+        If the font is a GlyphAtlas, the text lines are drawn directly on the sprite,
+        unless render_sprite has been overridden.
+
+        Returns:
+             pygame.Surface: the generated surface.
+
+        Keyword arguments:
+            background_path (str): the path to the image corresponding to the sprite of the button.
+            text_lines (Sequence[str]): the sequence in order of text lines to be rendered.
+            text_color (pygame.Color): the color of the text.
+            font (pygame.font.Font): the font that should be used to render the text.
+        """
+        return _load_or_render(
+            lambda: (
+                type(self).__name__,
+                tuple(text_lines),
+                tuple(text_color),
+                _get_font_signature(font),
+                _get_file_signature(background_path),
+                tuple(self.size),
+            ),
+            lambda: (
+                self.__render_sprite_with_atlas(
+                    background_path, text_lines, text_color, font
+                )
+                if hasattr(font, "render_into")
+                and type(self).render_sprite is Button.render_sprite
+                else self.render_sprite(
+                    background_path,
+                    Button.render_text_lines(text_lines, text_color, font),
+                )
+            ),
+        )
+
+    def __render_sprite_with_atlas(
+        self,
+        background_path: str,
+        text_lines: Sequence[str],
+        text_color: pygame.Color,
+        font: GlyphAtlas,
+    ) -> pygame.Surface:
+        """
+        Compute the rendering of the button with the given background, drawing the text lines on it
+        from the glyphs of the atlas without rendering each line on its own surface.
+        The text lines are placed as render_sprite does, following _get_text_line_position.
+
+        Returns:
+             pygame.Surface: the generated surface.
+
+        Keyword arguments:
+            background_path (str): the path to the image corresponding to the sprite of the button.
+            text_lines (Sequence[str]): the sequence in order of text lines to be rendered.
+            text_color (pygame.Color): the color of the text.
+            font (GlyphAtlas): the atlas from which the text should be drawn.
+        """
+        sprite = self.render_sprite(background_path, [])
+        for index, text_line in enumerate(text_lines):
+            font.render_into(
+                sprite,
+                text_line,
+                self._get_text_line_position(
+                    sprite.get_size(), font.size(text_line), index, len(text_lines)
+                ),
+                text_color,
+            )
+        return sprite
+
+    def _get_text_line_position(
+        self,
+        sprite_size: tuple[int, int],
+        text_line_size: tuple[int, int],
+        index: int,
+        text_lines_count: int,
+    ) -> tuple[int, int]:
+        """
+        Compute where a text line should be drawn on the sprite, the lines being horizontally centered
+        and evenly spread vertically.
+
+        Returns:
+            tuple[int, int]: the position of the top left corner of the text line on the sprite.
+
+        Keyword arguments:
+            sprite_size (tuple[int, int]): the size of the sprite.
+            text_line_size (tuple[int, int]): the size of the rendered text line.
+            index (int): the index of the text line.
+            text_lines_count (int): the number of text lines.
+        """
+        return (
+            sprite_size[0] // 2 - text_line_size[0] // 2,
+            (2 * index + 1) * sprite_size[1] // (2 * text_lines_count)
+            - text_line_size[1] // 2,
+        )
+
     def render_sprite(
         self, background_path: str, rendered_text_lines: Sequence[pygame.Surface]
     ) -> pygame.Surface:
@@ -156,20 +325,19 @@ class Button(BoxElement):
                 on the surface.
         """
         if background_path:
-            with resources.as_file(background_path) as path:
-                raw_sprite = pygame.image.load(path)
+            raw_sprite = _load_image(background_path)
         else:
             raw_sprite = pygame.Surface((0, 0))
-        sprite = pygame.transform.scale(raw_sprite.convert_alpha(), self.size)
-        text_lines_count = len(rendered_text_lines)
+        sprite = pygame.transform.scale(_convert_alpha(raw_sprite), self.size)
 
         for index, rendered_text_line in enumerate(rendered_text_lines):
             sprite.blit(
                 rendered_text_line,
-                (
-                    sprite.get_width() // 2 - rendered_text_line.get_width() // 2,
-                    (2 * index + 1) * sprite.get_height() // (2 * text_lines_count)
-                    - rendered_text_line.get_height() // 2,
+                self._get_text_line_position(
+                    sprite.get_size(),
+                    rendered_text_line.get_size(),
+                    index,
+                    len(rendered_text_lines),
                 ),
             )
         return sprite
@@ -182,8 +350,40 @@ class Button(BoxElement):
         Keyword arguments:
             is_mouse_hover (bool): a boolean value indicating if the mouse is over the element or not
         """
+        self._is_hovered = is_mouse_hover
         self.content = self.sprite_hover if is_mouse_hover else self.sprite
 
+    def set_mouse_over(self, is_mouse_over: bool) -> None:
+        """
+        Take into account whether the mouse is over the button, the button being highlighted
+        only if it is not disabled.
+
+        Keyword arguments:
+            is_mouse_over (bool): whether the mouse is over the button
+        """
+        self.__is_mouse_over = is_mouse_over
+        self.set_hover(is_mouse_over and not self.disabled)
+
+    def set_pending(self, is_pending: bool) -> None:
+        """
+        Put the button in a pending state while the coroutine started by its callback is running,
+        the button being disabled and not highlighted, or restore it once it is done,
+        highlighted again if the mouse is over it.
+
+        Keyword arguments:
+            is_pending (bool): whether the coroutine started by the callback is running
+        """
+        if is_pending == self.is_pending:
+            return
+        self.is_pending = is_pending
+        if is_pending:
+            self.__is_disabled_before_pending = self.disabled
+            self.disabled = True
+            self.set_hover(False)
+        else:
+            self.disabled = self.__is_disabled_before_pending
+            self.set_mouse_over(self.__is_mouse_over)
+
     def action_triggered(self) -> Callable:
         """
         Method that should be called after a click.
@@ -6,12 +6,13 @@ Generally use as a parameter button.
 
 from __future__ import annotations
 
-from typing import Sequence, Callable
+from typing import Any, Sequence, Callable, Optional
 
 import pygame
 
 from ..configuration import _default_fonts
 from ..constants import WHITE, BUTTON_SIZE
+from ..finalization import _finalize_surface
 from ..type_definitions import Position, Margin
 from .button import Button
 
@@ -30,7 +31,7 @@ class DynamicButton(Button):
 
     Keyword arguments:
         callback (Callable): the reference to the function that should be call after a click.
-        values (Sequence[any]): the sequence of values that will be iterated to determine the next inner value.
+        values (Sequence[Any]): the sequence of values that will be iterated to determine the next inner value.
         current_value_index (int): the index of the initial value of the button.
         base_title (str): the common prefix of all the different labels
             (it could be the name of the dynamic button in a way).
@@ -46,7 +47,7 @@ class DynamicButton(Button):
         column_span (int): the number of columns the element should span, defaults to 1.
 
     Attributes:
-        values (Sequence[any]): the sequence of values that will be iterated to determine the next inner value.
+        values (Sequence[Any]): the sequence of values that will be iterated to determine the next inner value.
         current_value_index (int): the index of the current value of the button.
         base_title (str): the common prefix of all the different labels
             (it could be the name of the dynamic button in a way).
@@ -56,7 +57,7 @@ class DynamicButton(Button):
     def __init__(
         self,
         callback: Callable,
-        values: Sequence[any],
+        values: Sequence[Any],
         current_value_index: int,
         base_title: str,
         size: tuple[int, int] = BUTTON_SIZE,
@@ -68,6 +69,9 @@ class DynamicButton(Button):
         disabled: bool = False,
         column_span: int = 1,
     ) -> None:
+        self.values: Sequence[Any] = values
+        self.current_value_index: int = current_value_index
+        self.base_title: str = base_title
         # TODO: default background for dynamic button should be used instead of
         #  letting the ascendant init takes the default one for generic button
         super().__init__(
@@ -82,13 +86,46 @@ class DynamicButton(Button):
             disabled,
             column_span=column_span,
         )
-        self.values: Sequence[any] = values
-        self.current_value_index: int = current_value_index
-        self.base_title: str = base_title
-        self.__base_sprite: pygame.Surface = self.sprite
-        self.__base_sprite_hover: pygame.Surface = self.sprite_hover
+
+    def _render_sprites(self) -> None:
+        """
+        Compute the rendering of the sprites of the button, including the label of the current value.
+        """
+        super()._render_sprites()
+        self.__base_sprite: Optional[pygame.Surface] = self.sprite
+        self.__base_sprite_hover: Optional[pygame.Surface] = self.sprite_hover
         self.__update_sprite()
 
+    def _get_surfaces(self) -> list[Optional[pygame.Surface]]:
+        """
+        Returns:
+            list[Optional[pygame.Surface]]: all the surfaces held by the button, including the sprites without label.
+        """
+        return super()._get_surfaces() + [
+            self.__base_sprite,
+            self.__base_sprite_hover,
+        ]
+
+    def finalize(self) -> None:
+        """
+        Convert the sprites of the button rendered while the display was not available
+        to the pixel format of the display, including the sprites without label.
+        """
+        if not self._are_sprites_finalized and self.sprite is not None:
+            self.__base_sprite = _finalize_surface(self.__base_sprite)
+            self.__base_sprite_hover = _finalize_surface(self.__base_sprite_hover)
+        super().finalize()
+
+    def release_render_resources(self) -> None:
+        """
+        Drop the sprites of the button, to free memory.
+
+        The button should not be displayed until rebuild_render_resources is called.
+        """
+        super().release_render_resources()
+        self.__base_sprite = None
+        self.__base_sprite_hover = None
+
     def __update_sprite(self) -> None:
         """
         Update the render of the button to display the updated dynamic value.
@@ -0,0 +1,300 @@
+"""
+Defines Gauge class, a BoxElement displaying a progress bar or a gauge (loading progress,
+health points...) whose value can change at each frame.
+"""
+
+from __future__ import annotations
+
+import os.path
+from typing import Optional
+
+import pygame
+from pygame.constants import SRCALPHA
+
+from .box_element import BoxElement
+from ..configuration import _default_sprites
+from ..constants import GAUGE_SIZE, GAUGE_FRAME_BORDER, GAUGE_PADDING, FOREST_GREEN
+from ..finalization import _convert_alpha, _finalize_surface, is_display_available
+from ..sprite_cache import _get_file_signature, _load_image, _load_or_render
+from ..type_definitions import Position, Margin
+
+
+def _render_nine_slice(
+    sprite: pygame.Surface, size: tuple[int, int], border: int
+) -> pygame.Surface:
+    """
+    Scale a sprite to the given size keeping its corners intact: the corners are copied, the edges are
+    stretched along their length and the center is stretched in both directions.
+
+    Returns:
+        pygame.Surface: the scaled sprite.
+
+    Keyword arguments:
+        sprite (pygame.Surface): the sprite to be scaled
+        size (tuple[int, int]): the size of the scaled sprite
+        border (int): the thickness of the corners and edges, the sprite is simply scaled if it is 0
+    """
+    width, height = sprite.get_size()
+    border = min(border, width // 2, height // 2, size[0] // 2, size[1] // 2)
+    if border <= 0:
+        return pygame.transform.scale(sprite, size)
+    scaled_sprite = pygame.Surface(size, SRCALPHA)
+    source_slices = [
+        (0, border),
+        (border, width - 2 * border),
+        (width - border, border),
+    ]
+    target_slices = [
+        (0, border),
+        (border, size[0] - 2 * border),
+        (size[0] - border, border),
+    ]
+    source_rows = [
+        (0, border),
+        (border, height - 2 * border),
+        (height - border, border),
+    ]
+    target_rows = [
+        (0, border),
+        (border, size[1] - 2 * border),
+        (size[1] - border, border),
+    ]
+    for (source_y, source_height), (target_y, target_height) in zip(
+        source_rows, target_rows
+    ):
+        for (source_x, source_width), (target_x, target_width) in zip(
+            source_slices, target_slices
+        ):
+            if min(source_width, source_height, target_width, target_height) <= 0:
+                continue
+            piece = sprite.subsurface(source_x, source_y, source_width, source_height)
+            if (source_width, source_height) != (target_width, target_height):
+                piece = pygame.transform.scale(piece, (target_width, target_height))
+            scaled_sprite.blit(piece, (target_x, target_y))
+    return scaled_sprite
+
+
+class Gauge(BoxElement):
+    """
+    This class is representing a horizontal gauge, filled from the left according to its value.
+
+    The frame and the fill are rendered once, nine-sliced so that their borders are not stretched, and kept.
+    When the value changes, only the part of the gauge between the previous and the new end of the fill
+    is redrawn, and reported as the dirty area of the element so that display_invalidated only redraws it.
+
+    Keyword arguments:
+        value (float): the initial value, defaults to 0.
+        minimum (float): the value for which the gauge is empty, defaults to 0.
+        maximum (float): the value for which the gauge is full, defaults to 1.
+        size (tuple[int, int]): the size of the gauge following the format "(width, height)", defaults to GAUGE_SIZE.
+        position (Position): the position of the element on the screen.
+        frame_path (str): the path to the image corresponding to the frame of the gauge, defaults to the
+            background of the buttons.
+        frame_border (int): the thickness of the border of the frame image that should not be stretched,
+            defaults to GAUGE_FRAME_BORDER.
+        fill_color (pygame.Color): the color of the fill, defaults to FOREST_GREEN.
+        fill_path (Optional[str]): the path to the image corresponding to the fill, used instead of the fill color
+            if provided.
+        padding (int): the space between the frame and the fill, defaults to GAUGE_PADDING.
+        margin (Margin): a tuple containing the margins of the box,
+            should be in the form "(top_margin, right_margin, bottom_margin, left_margin)", defaults to (0, 0, 0, 0).
+        column_span (int): the number of columns the element should span, defaults to 1.
+
+    Attributes:
+        value (float): the current value, between minimum and maximum.
+        minimum (float): the value for which the gauge is empty.
+        maximum (float): the value for which the gauge is full.
+    """
+
+    def __init__(
+        self,
+        value: float = 0,
+        minimum: float = 0,
+        maximum: float = 1,
+        size: tuple[int, int] = GAUGE_SIZE,
+        position: Position = pygame.Vector2(0, 0),
+        frame_path: str = None,
+        frame_border: int = GAUGE_FRAME_BORDER,
+        fill_color: pygame.Color = FOREST_GREEN,
+        fill_path: Optional[str] = None,
+        padding: int = GAUGE_PADDING,
+        margin: Margin = (0, 0, 0, 0),
+        column_span: int = 1,
+    ) -> None:
+        if maximum <= minimum:
+            raise ValueError(
+                "The maximum of a gauge should be greater than its minimum"
+            )
+        self.minimum: float = minimum
+        self.maximum: float = maximum
+        self.value: float = min(max(value, minimum), maximum)
+        self.__frame_path: str = (
+            os.path.abspath(frame_path)
+            if frame_path
+            else _default_sprites["button_background"]["inactive"]
+        )
+        self.__frame_border: int = frame_border
+        self.__fill_color: pygame.Color = pygame.Color(fill_color)
+        self.__fill_path: Optional[str] = (
+            os.path.abspath(fill_path) if fill_path else None
+        )
+        self.__fill_area: pygame.Rect = pygame.Rect(
+            padding, padding, size[0] - 2 * padding, size[1] - 2 * padding
+        )
+        self.__frame: Optional[pygame.Surface] = None
+        self.__fill: Optional[pygame.Surface] = None
+        self.__fill_width: int = 0
+        self._are_sprites_finalized: bool = is_display_available()
+        self.size = tuple(size)
+        super().__init__(position, self.__render_content(), margin, column_span)
+
+    def set_value(self, value: float) -> None:
+        """
+        Change the value of the gauge, redrawing only the part of the fill that changed.
+
+        Keyword arguments:
+            value (float): the new value, clamped between minimum and maximum
+        """
+        self.value = min(max(value, self.minimum), self.maximum)
+        if self.content is None:
+            return
+        fill_width = self.__compute_fill_width()
+        if fill_width == self.__fill_width:
+            return
+        changed_area = pygame.Rect(
+            self.__fill_area.x + min(fill_width, self.__fill_width),
+            self.__fill_area.y,
+            abs(fill_width - self.__fill_width),
+            self.__fill_area.height,
+        )
+        self.__fill_width = fill_width
+        self.__draw_area(self.content, changed_area)
+        self.invalidate(changed_area)
+
+    def __compute_fill_width(self) -> int:
+        """
+        Returns:
+            int: the width of the fill matching the current value.
+        """
+        ratio = (self.value - self.minimum) / (self.maximum - self.minimum)
+        return round(self.__fill_area.width * ratio)
+
+    def __render_sprites(self) -> None:
+        """
+        Render the frame and the fill of the gauge, or load them from the sprite cache.
+        """
+        self.__frame = _load_or_render(
+            lambda: (
+                type(self).__name__,
+                "frame",
+                _get_file_signature(self.__frame_path),
+                self.size,
+                self.__frame_border,
+            ),
+            lambda: _render_nine_slice(
+                _convert_alpha(_load_image(self.__frame_path)),
+                self.size,
+                self.__frame_border,
+            ),
+        )
+        self.__fill = _load_or_render(
+            lambda: (
+                type(self).__name__,
+                "fill",
+                _get_file_signature(self.__fill_path),
+                tuple(self.__fill_color),
+                self.__fill_area.size,
+                self.__frame_border,
+            ),
+            self.__render_fill,
+        )
+
+    def __render_fill(self) -> pygame.Surface:
+        """
+        Returns:
+            pygame.Surface: the fill of the full gauge, from its image if any or plain otherwise.
+        """
+        if self.__fill_path:
+            return _render_nine_slice(
+                _convert_alpha(_load_image(self.__fill_path)),
+                self.__fill_area.size,
+                self.__frame_border,
+            )
+        fill = _convert_alpha(pygame.Surface(self.__fill_area.size, SRCALPHA))
+        fill.fill(self.__fill_color)
+        return fill
+
+    def __render_content(self) -> pygame.Surface:
+        """
+        Render the sprites of the gauge and compose the gauge for its current value.
+
+        Returns:
+            pygame.Surface: the rendered gauge.
+        """
+        self.__render_sprites()
+        self.__fill_width = self.__compute_fill_width()
+        content = _convert_alpha(pygame.Surface(self.size, SRCALPHA))
+        self.__draw_area(content, content.get_rect())
+        return content
+
+    def __draw_area(self, target: pygame.Surface, area: pygame.Rect) -> None:
+        """
+        Draw the given part of the gauge, the frame and the fill over it up to the current value.
+
+        Keyword arguments:
+            target (pygame.Surface): the surface holding the rendered gauge
+            area (pygame.Rect): the part of the gauge to be drawn
+        """
+        target.fill((0, 0, 0, 0), area)
+        target.blit(self.__frame, area, area)
+        filled_area = area.clip(
+            pygame.Rect(
+                self.__fill_area.topleft, (self.__fill_width, self.__fill_area.height)
+            )
+        )
+        if filled_area.width:
+            target.blit(
+                self.__fill,
+                filled_area,
+                filled_area.move(-self.__fill_area.x, -self.__fill_area.y),
+            )
+
+    def _get_surfaces(self) -> list[Optional[pygame.Surface]]:
+        """
+        Returns:
+            list[Optional[pygame.Surface]]: all the surfaces held by the gauge.
+        """
+        return super()._get_surfaces() + [self.__frame, self.__fill]
+
+    def release_render_resources(self) -> None:
+        """
+        Drop the sprites of the gauge, to free memory.
+
+        The gauge should not be displayed until rebuild_render_resources is called.
+        """
+        self.__frame = None
+        self.__fill = None
+        self.content = None
+
+    def rebuild_render_resources(self) -> None:
+        """
+        Render again the sprites dropped by release_render_resources, if any.
+        """
+        if self.content is not None:
+            return
+        self.content = self.__render_content()
+        self._are_sprites_finalized = is_display_available()
+
+    def finalize(self) -> None:
+        """
+        Convert the sprites of the gauge rendered while the display was not available
+        to the pixel format of the display, to make their drawing faster.
+
+        Should be called from the main thread, once the display mode is set.
+        """
+        if self._are_sprites_finalized or self.content is None:
+            return
+        self.__frame = _finalize_surface(self.__frame)
+        self.__fill = _finalize_surface(self.__fill)
+        self.content = _finalize_surface(self.content)
+        self._are_sprites_finalized = True
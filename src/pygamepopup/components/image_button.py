@@ -7,13 +7,14 @@ from __future__ import annotations
 
 import os
 from typing import Callable, Sequence
-from importlib import resources
 
 import pygame
 
 from .button import Button
 from ..configuration import _default_sprites
 from ..constants import WHITE, MIDNIGHT_BLUE, IMAGE_BUTTON_SIZE
+from ..finalization import _convert_alpha
+from ..sprite_cache import _load_image
 from ..type_definitions import Position, Margin
 
 
@@ -67,6 +68,17 @@ class ImageButton(Button):
         image_path: str = None,
         column_span: int = 1,
     ) -> None:
+        self.__frame_background_path: str = (
+            os.path.abspath(frame_background_path)
+            if frame_background_path
+            else _default_sprites["button_background"]["inactive"]
+        )
+        self.__frame_background_hover_path: str = (
+            os.path.abspath(frame_background_hover_path)
+            if frame_background_hover_path
+            else _default_sprites["button_background"]["active"]
+        )
+        self.__image_path: str = image_path
         super().__init__(
             callback,
             size,
@@ -85,74 +97,58 @@ class ImageButton(Button):
             column_span,
         )
 
-        padding: int = size[1] // 10
+    def _render_sprites(self) -> None:
+        """
+        Compute the rendering of the sprites of the button, including the frame containing the image.
+        """
+        super()._render_sprites()
+        padding: int = self.size[1] // 10
         frame_position: Position = pygame.Vector2(padding, padding)
         frame_size: tuple[int, int] = (
             self.size[1] - padding * 2,
             self.size[1] - padding * 2,
         )
 
-        frame_background_path = (
-            os.path.abspath(frame_background_path)
-            if frame_background_path
-            else _default_sprites["button_background"]["inactive"]
-        )
-        with resources.as_file(frame_background_path) as path:
-            raw_frame = pygame.image.load(path)
-        frame = pygame.transform.scale(raw_frame.convert_alpha(), frame_size)
+        raw_frame = _load_image(self.__frame_background_path)
+        frame = pygame.transform.scale(_convert_alpha(raw_frame), frame_size)
 
-        frame_background_hover_path = (
-            os.path.abspath(frame_background_hover_path)
-            if frame_background_hover_path
-            else _default_sprites["button_background"]["active"]
-        )
-        with resources.as_file(frame_background_hover_path) as path:
-            raw_frame_hover = pygame.image.load(path)
+        raw_frame_hover = _load_image(self.__frame_background_hover_path)
         frame_hover = pygame.transform.scale(
-            raw_frame_hover.convert_alpha(), frame_size
+            _convert_alpha(raw_frame_hover), frame_size
         )
 
-        if image_path:
-            with resources.as_file(image_path) as path:
-                image = pygame.transform.scale(
-                    pygame.image.load(path),
-                    (frame_size[0] - padding * 2, frame_size[1] - padding * 2),
-                )
+        if self.__image_path:
+            image = pygame.transform.scale(
+                _load_image(self.__image_path),
+                (frame_size[0] - padding * 2, frame_size[1] - padding * 2),
+            )
             frame.blit(image, (padding, padding))
             frame_hover.blit(image, (padding, padding))
 
         self.sprite.blit(frame, frame_position)
         self.sprite_hover.blit(frame_hover, frame_position)
 
-    def render_sprite(
-        self, background_path: str, rendered_text_lines: Sequence[pygame.Surface]
-    ) -> pygame.Surface:
+    def _get_text_line_position(
+        self,
+        sprite_size: tuple[int, int],
+        text_line_size: tuple[int, int],
+        index: int,
+        text_lines_count: int,
+    ) -> tuple[int, int]:
         """
-        Compute the rendering of the image button with the given background and text lines.
-
-        Render the text lines next to the image frame.
+        Compute where a text line should be drawn on the sprite, next to the image frame.
 
         Returns:
-            pygame.Surface: the generated surface.
+            tuple[int, int]: the position of the top left corner of the text line on the sprite.
 
         Keyword arguments:
-            background_path (str): the path to the image corresponding to the sprite of the button
-            rendered_text_lines (Sequence[pygame.Surface]): the sequence of text lines in order that should be clipped
-                on the surface
+            sprite_size (tuple[int, int]): the size of the sprite.
+            text_line_size (tuple[int, int]): the size of the rendered text line.
+            index (int): the index of the text line.
+            text_lines_count (int): the number of text lines.
         """
-        with resources.as_file(background_path) as path:
-            raw_sprite = pygame.image.load(path)
-        sprite = pygame.transform.scale(raw_sprite.convert_alpha(), self.size)
-
-        text_lines_count = len(rendered_text_lines)
-
-        for index, rendered_text_line in enumerate(rendered_text_lines):
-            sprite.blit(
-                rendered_text_line,
-                (
-                    self.size[1],
-                    (2 * index + 1) * sprite.get_height() // (2 * text_lines_count)
-                    - rendered_text_line.get_height() // 2,
-                ),
-            )
-        return sprite
+        return (
+            self.size[1],
+            (2 * index + 1) * sprite_size[1] // (2 * text_lines_count)
+            - text_line_size[1] // 2,
+        )
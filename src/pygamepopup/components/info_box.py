@@ -5,34 +5,72 @@ Defines InfoBox class, a helper to draw any kind of popup (menu or informative m
 from __future__ import annotations
 
 import os.path
-from typing import Union, Sequence, Callable, Optional
-from importlib import resources
+import time
+from typing import Any, Union, Sequence, Callable, Optional, TYPE_CHECKING
 
 import pygame
+from pygame.constants import SRCALPHA
 
+from .. import instrumentation
 from ..configuration import _default_sprites, _default_fonts, _default_texts
 from ..constants import (
     WHITE,
     CLOSE_BUTTON_MARGIN_TOP,
     MARGIN_BOX,
+    MARGIN_BOX_HORIZONTAL,
     DEFAULT_MARGIN_TOP,
     CLOSE_BUTTON_SIZE,
     MARGIN_LINKED_ELEMENT,
     DEFAULT_POPUP_WIDTH,
 )
 from .box_element import BoxElement
+from .live_text_element import LiveTextElement
 from .text_element import TextElement
 from .button import Button
+from ..culling import CullingStatistics, compute_opaque_rect, is_occluded
+from ..finalization import _convert_alpha, _finalize_surface, is_display_available
+from ..layout import (
+    GridLayout,
+    GridMetrics,
+    compute_grid_layout,
+    compute_text_container_widths,
+)
+from ..memory import get_surfaces_memory_usage
+from ..render_backends import Blit, RenderBackend, blits
+from ..sprite_cache import _get_file_signature, _load_image, _load_or_render
 from ..type_definitions import Position
 
+if TYPE_CHECKING:
+    from ..declarative import LayoutCache
+
 
 class _Row:
     def __init__(self, elements: list[BoxElement], height: int = 0):
         self.elements: list[BoxElement] = elements
         self.height = height
+        self.element_offsets: list[tuple[int, int]] = []
+
+
+def _clip_blit(blit: Blit, clip_rect: pygame.Rect) -> Optional[Blit]:
+    """
+    Returns:
+        Optional[Blit]: the blit restricted to the part of its source drawn inside the given area,
+        None if nothing would be drawn.
 
-    def compute_number_columns(self):
-        return sum(element.column_span for element in self.elements)
+    Keyword arguments:
+        blit (Blit): the (source, dest) pair to be restricted
+        clip_rect (pygame.Rect): the area outside of which nothing should be drawn
+    """
+    source, destination = blit[0], blit[1]
+    drawn_area = pygame.Rect(destination, source.get_size())
+    visible_area = drawn_area.clip(clip_rect)
+    if not visible_area.width or not visible_area.height:
+        return None
+    return (
+        source,
+        visible_area.topleft,
+        visible_area.move(-drawn_area.x, -drawn_area.y),
+    )
 
 
 class InfoBox:
@@ -64,6 +102,10 @@ class InfoBox:
         has_vertical_separator (bool): whether there should be a line splitting the infoBox in two at middle width or
             not, defaults to False
         identifier (str): a string permitting to identify the menu among others if needed
+        follow_element_linked (bool): whether the infoBox should follow the linked element when it moves,
+            defaults to False
+        grid_layout (Optional[GridLayout]): the column definitions the element grid should follow,
+            the width is split evenly between the elements of each row if not provided
 
     Attributes:
         title (str): the title of the infoBox
@@ -75,6 +117,11 @@ class InfoBox:
         sprite (pygame.Surface): the pygame Surface corresponding to the sprite of the infoBox
         visible_on_background (bool): whether the popup is visible on background or not
         identifier (str): a string permitting to identify the menu among others if needed
+        grid_layout (Optional[GridLayout]): the column definitions the element grid follows if any
+        is_dirty (bool): whether something in the infoBox changed since the last time it was displayed
+        last_display_time (float): the moment of the last display of the infoBox, in seconds as given by
+            time.perf_counter, 0 if it has never been displayed
+        are_render_resources_released (bool): whether the regenerable surfaces of the infoBox have been dropped
     """
 
     def __init__(
@@ -93,6 +140,8 @@ class InfoBox:
         visible_on_background: bool = True,
         has_vertical_separator: bool = False,
         identifier: str = "",
+        follow_element_linked: bool = False,
+        grid_layout: Optional[GridLayout] = None,
     ) -> None:
         self.title: str = title
         self.element_linked: pygame.Rect = element_linked
@@ -109,8 +158,8 @@ class InfoBox:
             if background_path
             else _default_sprites["info_box_background"]
         )
-        with resources.as_file(background_path) as path:
-            self.sprite: pygame.Surface = pygame.image.load(path)
+        self.__background_path: str = background_path
+        self.sprite: pygame.Surface = _load_image(background_path)
         self.close_button_text: str = (
             close_button_text
             if close_button_text is not None
@@ -120,9 +169,35 @@ class InfoBox:
         self.__close_button_background_hover_path: str = (
             close_button_background_hover_path
         )
+        self.__is_fully_invalidated: bool = True
+        self.__is_layout_computed: bool = False
+        self.__is_background_finalized: bool = True
+        # Part of the background in which every pixel is opaque, known once the layout is computed
+        self.__opaque_area: Optional[pygame.Rect] = None
+        self.__layout_cache: Optional[LayoutCache] = None
+        self.__layout_cache_key: Optional[str] = None
+        self.__invalidated_elements: list[BoxElement] = []
+        # Blits drawing the infoBox in order, compiled when the infoBox is fully invalidated and updated in place
+        # when an element changes, with the area of the screen covered by each element
+        self.__draw_list: Optional[list[Blit]] = None
+        self.__draw_list_rects: list[Optional[pygame.Rect]] = []
+        self.__draw_list_indices: dict[BoxElement, int] = {}
+        # Separator line rendered once, with its area relative to the top left corner of the infoBox
+        self.__separator_sprite: Optional[tuple[pygame.Surface, pygame.Rect]] = None
         self.__elements: list[_Row] = self.init_elements()
+        self.__live_elements: list[LiveTextElement] = [
+            element
+            for row in self.__elements
+            for element in row.elements
+            if isinstance(element, LiveTextElement)
+        ]
+        self.grid_layout: Optional[GridLayout] = grid_layout
         self.buttons: Sequence[Button] = []
         self.__size: tuple[int, int] = (width, 0)
+        if self.grid_layout is not None:
+            # Automatic widths are measured once texts are wrapped
+            self.__resize_elements()
+            self.grid_layout.measure(self.__gather_grid_metrics())
         self.__is_position_static: bool = position is not None
         if self.__is_position_static:
             self.position: Optional[Position] = pygame.Vector2(position)
@@ -130,12 +205,160 @@ class InfoBox:
             self.position = None
         self.visible_on_background: bool = visible_on_background
         self.identifier: str = identifier
+        self.__is_following_element_linked: bool = follow_element_linked
+        self.last_display_time: float = 0
+        self.are_render_resources_released: bool = False
+        self.__last_element_linked_rect: Optional[pygame.Rect] = None
+        self.__screen_size: tuple[int, int] = (0, 0)
+        self.__to_menu_position: Optional[Callable[[Position], Position]] = None
 
     def __repr__(self):
         return f"InfoBox with identifier '{self.identifier}'"
 
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Returns:
+            bool: whether the infoBox or any of its elements changed since the last display,
+            or whether the element the infoBox follows moved.
+        """
+        return (
+            self.__is_fully_invalidated
+            or len(self.__invalidated_elements) > 0
+            or self.__has_element_linked_moved()
+        )
+
+    def invalidate(self) -> None:
+        """
+        Mark the whole infoBox as changed so that it is entirely redrawn on the next display.
+        """
+        self.__is_fully_invalidated = True
+        self.__draw_list = None
+
+    def __on_element_invalidated(self, element: BoxElement) -> None:
+        """
+        Keep track of an element that changed since the last display, and update its blit
+        in the compiled draw list.
+
+        Keyword arguments:
+            element (BoxElement): the element that has been invalidated
+        """
+        if self.__draw_list is not None:
+            if element.content is None:
+                self.__draw_list = None
+            else:
+                index = self.__draw_list_indices[element]
+                self.__draw_list[index] = element.get_blit()
+                self.__draw_list_rects[index] = element.get_rect()
+        if (
+            not self.__is_fully_invalidated
+            and element not in self.__invalidated_elements
+        ):
+            self.__invalidated_elements.append(element)
+
+    def get_size(self) -> tuple[int, int]:
+        """
+        Returns:
+            tuple[int, int]: the size of the infoBox following the format "(width, height)",
+            the height is only known once the rendering has been initialized.
+        """
+        return self.__size
+
+    def get_memory_usage(self) -> int:
+        """
+        Returns:
+            int: the number of bytes taken by the surfaces held by the infoBox and all its elements.
+        """
+        return get_surfaces_memory_usage(
+            [self.sprite]
+            + [
+                surface
+                for row in self.__elements
+                for element in row.elements
+                for surface in element._get_surfaces()
+            ]
+        )
+
+    def release_render_resources(self) -> None:
+        """
+        Drop the surfaces of the infoBox and of its elements that can be rendered again, to free memory.
+        Only the layout is kept.
+
+        The surfaces are automatically rendered again the next time the infoBox is displayed.
+        """
+        if self.are_render_resources_released:
+            return
+        self.sprite = None
+        for row in self.__elements:
+            for element in row.elements:
+                element.release_render_resources()
+        self.are_render_resources_released = True
+        self.invalidate()
+
+    def rebuild_render_resources(self) -> None:
+        """
+        Render again the surfaces dropped by release_render_resources, if any.
+
+        The duration of the rebuild is measured by the instrumentation under the name "rebuild_render_resources".
+        """
+        if not self.are_render_resources_released:
+            return
+        with instrumentation.measure("rebuild_render_resources", menu=self.identifier):
+            self.sprite = _load_or_render(
+                lambda: (
+                    type(self).__name__,
+                    _get_file_signature(self.__background_path),
+                    self.__size,
+                ),
+                self.__render_background,
+            )
+            self.__is_background_finalized = is_display_available()
+            for row in self.__elements:
+                for element in row.elements:
+                    element.rebuild_render_resources()
+        self.are_render_resources_released = False
+        self.invalidate()
+
+    def __render_background(self) -> pygame.Surface:
+        """
+        Returns:
+            pygame.Surface: the background of the infoBox loaded from its image and scaled to the infoBox size.
+        """
+        raw_sprite = _load_image(self.__background_path)
+        return pygame.transform.scale(_convert_alpha(raw_sprite), self.__size)
+
+    def get_rect(self) -> Optional[pygame.Rect]:
+        """
+        Returns:
+            Optional[pygame.Rect]: the area covered by the infoBox on the screen,
+            None if its position is not known yet.
+        """
+        if self.position is None:
+            return None
+        return pygame.Rect(self.position, self.__size)
+
+    def get_opaque_rect(self) -> Optional[pygame.Rect]:
+        """
+        Returns:
+            Optional[pygame.Rect]: the area of the screen entirely hidden by the opaque part of the background of
+            the infoBox, None if its position is not known yet or if its background is not opaque.
+        """
+        if self.position is None or self.__opaque_area is None:
+            return None
+        return self.__opaque_area.move(self.position)
+
+    def mark_occluded(self) -> None:
+        """
+        Forget the changes of the infoBox instead of displaying it, since it is entirely hidden by other menus.
+        """
+        self.__is_fully_invalidated = False
+        self.__invalidated_elements.clear()
+
     def init_render(
-        self, screen: pygame.Surface, close_button_callback: Callable = None
+        self,
+        screen: Union[pygame.Surface, RenderBackend],
+        close_button_callback: Callable = None,
+        to_menu_position: Optional[Callable[[Position], Position]] = None,
     ) -> None:
         """
         Initialize the rendering of the popup.
@@ -143,23 +366,154 @@ class InfoBox:
         Compute it size and its position according to the given screen.
         Determine the position of each component.
 
+        The layout and the background are only computed the first time, they are reused when the
+        rendering is initialized again, for example when the infoBox is opened again.
+        This can be done outside the main thread, see finalize.
+        The duration of the initialization is measured by the instrumentation under the name "init_render".
+
         Keyword arguments:
-            screen (pygame.Surface): the screen on which the popup is
+            screen (Union[pygame.Surface, RenderBackend]): the screen on which the popup is
             close_button_callback (Callable): the callback that should be executed when clicking on
                 the close button if there is any
+            to_menu_position (Optional[Callable[[Position], Position]]): the function transforming a position
+                on the window to the coordinates of the screen given, used to find the button under the mouse
+                when the screen is not the window, the positions are used as is if not provided
         """
-        if self.has_close_button:
-            self.__elements[-1].elements[0].callback = close_button_callback
-        self.__resize_elements()
-        height: int = self.__determine_height()
-        self.__size = (self.__size[0], height)
-        if not self.__is_position_static:
-            self.position = self.determine_position(screen)
-        if self.position is not None:
-            self.determine_elements_position()
-        self.buttons = self.find_buttons()
-        self.sprite = pygame.transform.scale(self.sprite.convert_alpha(), self.__size)
-        self.__separator["height"] += height
+        with instrumentation.measure("init_render", menu=self.identifier):
+            self.__to_menu_position = to_menu_position
+            if self.has_close_button:
+                self.__elements[-1].elements[0].callback = close_button_callback
+            self.invalidate()
+            if not self.__is_layout_computed:
+                self.__compute_layout()
+                self.__is_layout_computed = True
+            self.__screen_size = screen.get_size()
+            if not self.__is_position_static:
+                self.position = self.determine_position(screen)
+            if self.position is not None:
+                self.determine_elements_position()
+            self.buttons = self.find_buttons()
+
+    def __compute_layout(self) -> None:
+        """
+        Compute the layout of the elements, or restore it from the layout cache if possible,
+        and render the background at the size of the infoBox.
+        """
+        cached_layout = (
+            self.__layout_cache.get(self.__layout_cache_key)
+            if self.__layout_cache is not None
+            else None
+        )
+        if cached_layout is None or not self.apply_layout(cached_layout):
+            self.__resize_elements()
+            self.__determine_layout()
+            if self.__layout_cache is not None:
+                self.__layout_cache.store(self.__layout_cache_key, self.export_layout())
+        self.__update_separator()
+        self.sprite = _load_or_render(
+            lambda: (
+                type(self).__name__,
+                _get_file_signature(self.__background_path),
+                self.__size,
+            ),
+            lambda: pygame.transform.scale(_convert_alpha(self.sprite), self.__size),
+        )
+        self.__opaque_area = compute_opaque_rect(self.sprite)
+        self.__is_background_finalized = is_display_available()
+
+    def finalize(self) -> None:
+        """
+        Convert the surfaces of the infoBox and its elements rendered while the display was not available
+        to the pixel format of the display, to make their drawing faster.
+
+        The construction of an infoBox and of its elements, and the initialization of its rendering,
+        can be done in a worker thread since they don't need the display: only this cheap conversion
+        has to be done in the main thread, once the display mode is set.
+        It is done by MenuManager when the infoBox is opened.
+        """
+        if (
+            not self.__is_background_finalized
+            and not self.are_render_resources_released
+        ):
+            self.sprite = _finalize_surface(self.sprite)
+            self.__is_background_finalized = True
+            self.__draw_list = None
+        for row in self.__elements:
+            for element in row.elements:
+                element.finalize()
+
+    def set_layout_cache(self, layout_cache: LayoutCache, key: str) -> None:
+        """
+        Use the given cache to skip the computation of the layout when rendering is initialized,
+        the computed layout being stored in the cache if it is not present yet.
+
+        Keyword arguments:
+            layout_cache (LayoutCache): the cache in which layouts are stored
+            key (str): the key identifying the layout of this infoBox in the cache, it should change whenever
+                anything having an impact on the layout changes
+        """
+        self.__layout_cache = layout_cache
+        self.__layout_cache_key = key
+
+    def export_layout(self) -> dict[str, Any]:
+        """
+        Describe the computed layout of the infoBox in a serializable way.
+
+        Should only be called once the rendering has been initialized.
+
+        Returns:
+            dict[str, Any]: the height of the infoBox, and for each row its height and for each of its elements its
+            position relative to the infoBox and the text lines if it is a text element.
+        """
+        return {
+            "height": self.__size[1],
+            "rows": [
+                {
+                    "height": row.height,
+                    "elements": [
+                        {
+                            "offset": list(offset),
+                            "lines": (
+                                element.lines
+                                if isinstance(element, TextElement)
+                                else None
+                            ),
+                        }
+                        for element, offset in zip(row.elements, row.element_offsets)
+                    ],
+                }
+                for row in self.__elements
+            ],
+        }
+
+    def apply_layout(self, layout: dict[str, Any]) -> bool:
+        """
+        Restore a layout previously exported, avoiding to compute it again.
+
+        Text elements are rendered following the line breaks described in the layout.
+
+        Returns:
+            bool: whether the layout has been applied, it is not if it doesn't match the elements of the infoBox.
+
+        Keyword arguments:
+            layout (dict[str, Any]): the layout, as exported by export_layout
+        """
+        if len(layout["rows"]) != len(self.__elements) or any(
+            len(row_layout["elements"]) != len(row.elements)
+            for row, row_layout in zip(self.__elements, layout["rows"])
+        ):
+            return False
+        container_widths = iter(self.__compute_text_container_widths())
+        for row, row_layout in zip(self.__elements, layout["rows"]):
+            row.height = row_layout["height"]
+            row.element_offsets = []
+            for element, element_layout in zip(row.elements, row_layout["elements"]):
+                container_width = next(container_widths)
+                if isinstance(element, TextElement) and element_layout["lines"]:
+                    element.set_lines(element_layout["lines"], container_width)
+                row.element_offsets.append(tuple(element_layout["offset"]))
+        self.__size = (self.__size[0], layout["height"])
+        return True
 
     def init_elements(self) -> list[_Row]:
         """
@@ -195,53 +549,109 @@ class InfoBox:
                     ]
                 )
             )
+        for row in elements:
+            for element in row.elements:
+                element._invalidation_listener = self.__on_element_invalidated
         return elements
 
-    def __determine_height(self) -> int:
+    def __gather_grid_metrics(self, with_sizes: bool = True) -> GridMetrics:
         """
-        Compute the total height of the infoBox, defined according
-        to the height of each element in it.
+        Gather the metrics of all the elements of the infoBox in flat sequences, row after row.
 
         Returns:
-             int: the computed height.
+            GridMetrics: the metrics of the elements.
+
+        Keyword arguments:
+            with_sizes (bool): whether the sizes of the elements are needed, defaults to True
         """
-        # Margin to be added at begin and at end
-        height: int = MARGIN_BOX * 2
-        self.__separator["height"] -= height
-        self.__separator["vertical_position"] += height
+        elements = [element for row in self.__elements for element in row.elements]
+        column_spans = [element.column_span for element in elements]
+        if self.grid_layout is not None:
+            # Title and close button are spanning the whole infoBox
+            column_spans[0] = len(self.grid_layout)
+            if self.has_close_button:
+                column_spans[-1] = len(self.grid_layout)
+        return GridMetrics(
+            [len(row.elements) for row in self.__elements],
+            column_spans,
+            [element.get_width() for element in elements] if with_sizes else (),
+            [element.get_height() for element in elements] if with_sizes else (),
+            [element.get_margin_top() for element in elements] if with_sizes else (),
+            [
+                element.get_margin_left() + element.get_margin_right()
+                for element in elements
+            ],
+        )
 
-        for row in self.__elements:
-            max_height: int = 0
-            for element in row.elements:
-                el_height = element.get_height() + DEFAULT_MARGIN_TOP
-                if el_height > max_height:
-                    max_height = el_height
-            height += max_height
-            row.height = max_height
+    def __determine_layout(self) -> None:
+        """
+        Compute the height of each row, the total height of the infoBox defined according
+        to the height of each element in it, and the position of each element relatively
+        to the top left corner of the infoBox.
+        """
+        if self.grid_layout is not None:
+            row_heights, offsets, height = self.grid_layout.compute(
+                self.__gather_grid_metrics(),
+                self.__size[0],
+                DEFAULT_MARGIN_TOP,
+                MARGIN_BOX,
+                MARGIN_BOX_HORIZONTAL,
+            )
+        else:
+            row_heights, offsets, height = compute_grid_layout(
+                self.__gather_grid_metrics(),
+                self.__size[0],
+                DEFAULT_MARGIN_TOP,
+                MARGIN_BOX,
+            )
+        element_index = 0
+        for row, row_height in zip(self.__elements, row_heights):
+            row.height = row_height
+            row.element_offsets = offsets[
+                element_index : element_index + len(row.elements)
+            ]
+            element_index += len(row.elements)
+        self.__size = (self.__size[0], height)
 
+    def __update_separator(self) -> None:
+        """
+        Update the vertical boundaries of the separator according to the computed height of the infoBox.
+        """
+        self.__separator["vertical_position"] += MARGIN_BOX * 2
+        self.__separator["height"] += self.__size[1] - MARGIN_BOX * 2
         if self.has_close_button:
             self.__separator["height"] -= self.__elements[-1].height
 
-        return height
-
     def __resize_elements(self) -> None:
         """
         Resize elements according to the current width of the infoBox
         """
-        for row in self.__elements:
-            for element in row.elements:
-                number_columns = row.compute_number_columns()
-                if isinstance(element, TextElement):
-                    element.content = element._verify_rendered_text_size(
-                        element.content,
-                        element._text,
-                        (self.__size[0] - 20) // number_columns * element.column_span
-                        - element.get_margin_left()
-                        - element.get_margin_right(),
-                    )
-                    element.size = element.content.get_size()
-
-    def determine_position(self, screen: pygame.Surface) -> Optional[Position]:
+        elements = [element for row in self.__elements for element in row.elements]
+        for element, container_width in zip(
+            elements, self.__compute_text_container_widths()
+        ):
+            if isinstance(element, TextElement):
+                element.wrap(container_width)
+
+    def __compute_text_container_widths(self) -> list[int]:
+        """
+        Returns:
+            list[int]: the width available for the content of each element, row after row.
+        """
+        if self.grid_layout is not None:
+            return self.grid_layout.compute_text_container_widths(
+                self.__gather_grid_metrics(with_sizes=False),
+                self.__size[0],
+                MARGIN_BOX_HORIZONTAL,
+            )
+        return compute_text_container_widths(
+            self.__gather_grid_metrics(with_sizes=False),
+            self.__size[0] - 2 * MARGIN_BOX_HORIZONTAL,
+        )
+
+    def determine_position(
+        self, screen: Union[pygame.Surface, RenderBackend]
+    ) -> Optional[Position]:
         """
         Compute the position of the infoBox to be beside the linked element.
 
@@ -252,26 +662,122 @@ class InfoBox:
              Optional[Position]: the computed position.
 
         Keyword arguments:
-            screen (pygame.Surface): The screen on which the infoBox is rendered.
+            screen (Union[pygame.Surface, RenderBackend]): The screen on which the infoBox is rendered.
         """
         if self.element_linked:
-            position: Position = pygame.Vector2(
-                self.element_linked.x
-                + self.element_linked.width
-                + MARGIN_LINKED_ELEMENT,
-                self.element_linked.y
-                + self.element_linked.height // 2
-                - self.__size[1] // 2,
-            )
-            if position.y < 0:
-                position.y = 0
-            elif position.y + self.__size[1] > screen.get_height():
-                position.y = screen.get_height() - self.__size[1]
-            if position.x + self.__size[0] > screen.get_width():
-                position.x = self.element_linked.x - self.__size[0]
-            return position
+            return self.__compute_linked_position(screen.get_size())
         return None
 
+    def __compute_linked_position(self, screen_size: tuple[int, int]) -> Position:
+        """
+        Compute the position of the infoBox to be beside the linked element, staying inside the screen.
+
+        Returns:
+            Position: the computed position.
+
+        Keyword arguments:
+            screen_size (tuple[int, int]): the size of the screen on which the infoBox is rendered
+        """
+        self.__last_element_linked_rect = pygame.Rect(self.element_linked)
+        position: Position = pygame.Vector2(
+            self.element_linked.x + self.element_linked.width + MARGIN_LINKED_ELEMENT,
+            self.element_linked.y
+            + self.element_linked.height // 2
+            - self.__size[1] // 2,
+        )
+        if position.x + self.__size[0] > screen_size[0]:
+            position.x = self.element_linked.x - self.__size[0]
+        return self.__clamp_to_screen(position, screen_size)
+
+    def __clamp_to_screen(
+        self, position: Position, screen_size: tuple[int, int]
+    ) -> pygame.Vector2:
+        """
+        Returns:
+            pygame.Vector2: the closest position to the given one keeping the infoBox inside the screen,
+            the top left corner being kept visible if the infoBox is larger than the screen.
+
+        Keyword arguments:
+            position (Position): the wanted position of the top left corner of the infoBox
+            screen_size (tuple[int, int]): the size of the screen on which the infoBox is rendered
+        """
+        position = pygame.Vector2(position)
+        position.x = max(0, min(position.x, screen_size[0] - self.__size[0]))
+        position.y = max(0, min(position.y, screen_size[1] - self.__size[1]))
+        return position
+
+    def adapt_to_screen(self, screen: Union[pygame.Surface, RenderBackend]) -> None:
+        """
+        Reposition the infoBox after the screen on which it is rendered has been resized.
+
+        The infoBox is only translated: centered infoBoxes are centered again, infoBoxes linked to an element
+        are kept inside the new screen boundaries, and infoBoxes with a static position don't move.
+        The layout, text wrapping and background rendering are reused since they don't depend on the screen.
+
+        Keyword arguments:
+            screen (Union[pygame.Surface, RenderBackend]): the resized screen
+        """
+        self.__screen_size = screen.get_size()
+        if self.__is_position_static or self.position is None:
+            return
+        if self.element_linked:
+            self.move_to(self.__compute_linked_position(self.__screen_size))
+        else:
+            self.move_to(
+                (
+                    self.__screen_size[0] // 2 - self.__size[0] // 2,
+                    self.__screen_size[1] // 2 - self.__size[1] // 2,
+                )
+            )
+
+    def move_to(self, position: Position) -> None:
+        """
+        Move the infoBox to the given position by translating its elements,
+        without computing its layout again.
+        The position is clamped so that the infoBox stays inside the screen.
+
+        Should only be called once the rendering has been initialized.
+
+        Keyword arguments:
+            position (Position): the new position of the top left corner of the infoBox
+        """
+        position = self.__clamp_to_screen(position, self.__screen_size)
+        if self.position is None:
+            self.position = position
+            self.determine_elements_position()
+            return
+        offset = position - self.position
+        if offset.x == 0 and offset.y == 0:
+            return
+        self.position = position
+        for row in self.__elements:
+            for element in row.elements:
+                element.position = pygame.Vector2(element.position) + offset
+        self.invalidate()
+
+    def follow_element_linked(
+        self, element_linked: Optional[pygame.Rect] = None
+    ) -> None:
+        """
+        Move the infoBox beside its linked element, staying inside the screen,
+        after the linked element moved or after it has been replaced by the given one.
+
+        Keyword arguments:
+            element_linked (Optional[pygame.Rect]): the new element to be linked to the infoBox,
+                the current one is kept if not provided
+        """
+        if element_linked is not None:
+            self.element_linked = element_linked
+        if self.element_linked:
+            self.move_to(self.__compute_linked_position(self.__screen_size))
+
+    def update_live_elements(self) -> None:
+        """
+        Poll the value providers of the live text elements of the infoBox, redrawing those whose text changed.
+        """
+        for element in self.__live_elements:
+            element.update()
+
     def find_buttons(self) -> Sequence[Button]:
         """
         Search in all elements for buttons.
@@ -290,63 +796,261 @@ class InfoBox:
         """
         Compute the position of each element and update it if needed.
         """
-        y_coordinate: int = self.position[1] + MARGIN_BOX
+        self.invalidate()
         # Memorize mouse position in case it is over a button
         mouse_pos = pygame.mouse.get_pos()
-        # A row begins by a value identifying its height, followed by its elements
+        if self.__to_menu_position is not None:
+            mouse_pos = self.__to_menu_position(mouse_pos)
         for row in self.__elements:
-            number_columns = row.compute_number_columns()
-            column = 1
-            for element in row.elements:
-                base_x = self.position.x + (self.__size[0] // (2 * number_columns)) * (
-                    column + element.column_span - 1
-                )
-                x_coordinate = base_x - element.get_width() // 2
+            for element, offset in zip(row.elements, row.element_offsets):
                 element.position = pygame.Vector2(
-                    x_coordinate,
-                    y_coordinate + element.get_margin_top(),
+                    self.position.x + offset[0], self.position.y + offset[1]
                 )
                 if isinstance(element, Button):
                     element.set_hover(element.get_rect().collidepoint(mouse_pos))
-                column += 2 * element.column_span
-            y_coordinate += row.height
 
-    def display(self, screen: pygame.Surface) -> None:
+    def __has_element_linked_moved(self) -> bool:
+        """
+        Returns:
+            bool: whether the infoBox should follow its linked element and the element moved
+            since the last time the position has been computed.
+        """
+        return bool(
+            self.__is_following_element_linked
+            and self.element_linked
+            and self.element_linked != self.__last_element_linked_rect
+        )
+
+    def __update_tracking(self) -> None:
         """
-        Display the infoBox and all its elements.
+        Move the infoBox beside its linked element if it should follow it and if the element moved
+        since the last time the position has been computed.
+        """
+        if self.__has_element_linked_moved():
+            self.follow_element_linked()
+
+    def display(
+        self,
+        screen: Union[pygame.Surface, RenderBackend],
+        occluding_rects: Sequence[pygame.Rect] = (),
+        culling_statistics: Optional[CullingStatistics] = None,
+    ) -> None:
+        """
+        Display the infoBox and all its elements, in a single blits call.
+        The duration of the drawing is measured by the instrumentation under the name "display_batch",
+        the preparation being measured under the name "display" by get_draw_list.
 
         Keyword arguments:
-            screen (pygame.Surface): the screen on which the displaying should be done
+            screen (Union[pygame.Surface, RenderBackend]): the screen on which the displaying should be done
+            occluding_rects (Sequence[pygame.Rect]): the opaque areas that will be drawn over the infoBox,
+                the elements entirely inside one of them are not drawn
+            culling_statistics (Optional[CullingStatistics]): the counters of what has not been drawn to be updated
         """
-        if self.position is not None:
-            screen.blit(self.sprite, self.position)
-        else:
-            win_size = screen.get_size()
-            self.position = pygame.Vector2(
-                win_size[0] // 2 - self.__size[0] // 2,
-                win_size[1] // 2 - self.__size[1] // 2,
-            )
-            screen.blit(self.sprite, self.position)
-            self.determine_elements_position()
+        draw_list = self.get_draw_list(screen, occluding_rects, culling_statistics)
+        with instrumentation.measure("display_batch", menu=self.identifier):
+            blits(screen, draw_list)
+
+    def get_draw_list(
+        self,
+        screen: Union[pygame.Surface, RenderBackend],
+        occluding_rects: Sequence[pygame.Rect] = (),
+        culling_statistics: Optional[CullingStatistics] = None,
+    ) -> Sequence[Blit]:
+        """
+        Prepare the infoBox to be displayed and give the blits drawing it and all its elements,
+        to be executed in order, possibly along with the blits of other menus.
 
+        The blits are compiled once in a flat draw list, the blit of an element being updated in place
+        when it changes, for example when a button is hovered.
+        Only what is inside the clipping area of the screen is drawn: the infoBox is skipped if it is entirely
+        outside, and if it overflows, the elements entirely outside are skipped and the others are restricted
+        to the visible part of the infoBox.
+        The duration of the preparation, which doesn't include the drawing, is measured by the instrumentation
+        under the name "display".
+
+        Returns:
+            Sequence[Blit]: the (source, dest) pairs to be blitted, with the part of the source to be drawn
+            as third item if the infoBox overflows the clipping area. Should not be modified.
+
+        Keyword arguments:
+            screen (Union[pygame.Surface, RenderBackend]): the screen on which the displaying should be done
+            occluding_rects (Sequence[pygame.Rect]): the opaque areas that will be drawn over the infoBox,
+                the elements entirely inside one of them are not drawn
+            culling_statistics (Optional[CullingStatistics]): the counters of what has not been drawn to be updated
+        """
+        with instrumentation.measure("display", menu=self.identifier):
+            self.__update_tracking()
+            if self.are_render_resources_released:
+                self.rebuild_render_resources()
+            self.last_display_time = time.perf_counter()
+
+            if self.position is None:
+                win_size = screen.get_size()
+                self.position = pygame.Vector2(
+                    win_size[0] // 2 - self.__size[0] // 2,
+                    win_size[1] // 2 - self.__size[1] // 2,
+                )
+                self.determine_elements_position()
+            if self.__draw_list is None:
+                self.__compile_draw_list()
+            self.__clear_invalidations(screen)
+
+            viewport = screen.get_clip()
+            menu_rect = self.get_rect()
+            if not viewport.colliderect(menu_rect):
+                if culling_statistics is not None:
+                    culling_statistics.offscreen_menus += 1
+                return ()
+            is_overflowing = not viewport.contains(menu_rect)
+            if not is_overflowing and not occluding_rects:
+                return self.__draw_list
+
+            clip_rect = viewport.clip(menu_rect)
+            draw_list = []
+            for blit, rect in zip(self.__draw_list, self.__draw_list_rects):
+                if rect is not None:
+                    if is_overflowing and not viewport.colliderect(rect):
+                        if culling_statistics is not None:
+                            culling_statistics.offscreen_elements += 1
+                        continue
+                    if occluding_rects and is_occluded(rect, occluding_rects):
+                        if culling_statistics is not None:
+                            culling_statistics.occluded_elements += 1
+                        continue
+                if is_overflowing:
+                    blit = _clip_blit(blit, clip_rect)
+                    if blit is None:
+                        continue
+                draw_list.append(blit)
+            return draw_list
+
+    def __compile_draw_list(self) -> None:
+        """
+        Gather the blits drawing the background, every element and the separator, in drawing order.
+        """
+        self.__draw_list = [(self.sprite, self.position)]
+        self.__draw_list_rects = [None]
+        self.__draw_list_indices = {}
         for row in self.__elements:
             for element in row.elements:
-                element.display(screen)
-
+                self.__draw_list_indices[element] = len(self.__draw_list)
+                self.__draw_list.append(element.get_blit())
+                self.__draw_list_rects.append(element.get_rect())
         if self.__separator["display"]:
-            pygame.draw.line(
-                screen,
+            self.__draw_list.append(self.__get_separator_blit())
+            self.__draw_list_rects.append(None)
+
+    def __clear_invalidations(
+        self, screen: Union[pygame.Surface, RenderBackend]
+    ) -> None:
+        """
+        Mark the infoBox and its changed elements as displayed, notifying the screen of the contents
+        modified in place.
+
+        Keyword arguments:
+            screen (Union[pygame.Surface, RenderBackend]): the screen on which the infoBox is displayed
+        """
+        changed_elements = (
+            [element for row in self.__elements for element in row.elements]
+            if self.__is_fully_invalidated
+            else self.__invalidated_elements
+        )
+        for element in changed_elements:
+            element._refresh_render_target(screen)
+            element.is_dirty = False
+        self.__is_fully_invalidated = False
+        self.__invalidated_elements.clear()
+
+    def display_invalidated(
+        self,
+        screen: Union[pygame.Surface, RenderBackend],
+        culling_statistics: Optional[CullingStatistics] = None,
+    ) -> list[pygame.Rect]:
+        """
+        Redraw only the parts of the infoBox that changed since the last display.
+
+        Each changed element is redrawn over the matching area of the background of the infoBox,
+        the whole infoBox is drawn if it has never been displayed or if it has been fully invalidated.
+        If the infoBox moved, the area it previously covered is part of the updated areas.
+        Intended for screens that are not entirely redrawn at each frame.
+        Changed elements outside the clipping area of the screen are not redrawn.
+        The duration of a partial redraw is measured by the instrumentation under the name "display_invalidated".
+
+        Returns:
+            list[pygame.Rect]: the areas of the screen that have been updated.
+
+        Keyword arguments:
+            screen (Union[pygame.Surface, RenderBackend]): the screen on which the displaying should be done
+            culling_statistics (Optional[CullingStatistics]): the counters of what has not been drawn to be updated
+        """
+        previous_rect = self.get_rect()
+        self.__update_tracking()
+        if self.position is None or self.__is_fully_invalidated:
+            self.display(screen, culling_statistics=culling_statistics)
+            if previous_rect is not None and previous_rect != self.get_rect():
+                return [previous_rect, self.get_rect()]
+            return [self.get_rect()]
+
+        updated_rects: list[pygame.Rect] = []
+        viewport = screen.get_clip()
+        with instrumentation.measure("display_invalidated", menu=self.identifier):
+            for element in self.__invalidated_elements:
+                if not element.is_dirty:
+                    continue
+                dirty_area = element.get_dirty_area()
+                element_rect = element.get_rect()
+                if dirty_area is None:
+                    updated_rect = element_rect
+                else:
+                    updated_rect = dirty_area.move(element_rect.topleft)
+                if not viewport.colliderect(updated_rect):
+                    if culling_statistics is not None:
+                        culling_statistics.offscreen_elements += 1
+                    continue
+                screen.blit(
+                    self.sprite,
+                    updated_rect,
+                    updated_rect.move(-self.position.x, -self.position.y),
+                )
+                if dirty_area is None:
+                    element.display(screen)
+                else:
+                    element._refresh_render_target(screen)
+                    screen.blit(element.content, updated_rect, dirty_area)
+                    element.is_dirty = False
+                updated_rects.append(updated_rect)
+
+            if self.__separator["display"] and updated_rects:
+                # The separator may have been partially covered by a redrawn background area
+                screen.blit(*self.__get_separator_blit())
+
+            self.__invalidated_elements.clear()
+        return updated_rects
+
+    def __get_separator_blit(self) -> Blit:
+        """
+        Returns:
+            Blit: the vertical line splitting the infoBox in two parts and the position at which it should be drawn,
+            the line being rendered the first time.
+        """
+        if self.__separator_sprite is None:
+            canvas = pygame.Surface(self.__size, SRCALPHA)
+            line_area = pygame.draw.line(
+                canvas,
                 WHITE,
-                (
-                    self.position.x + self.__size[0] / 2,
-                    self.position.y + self.__separator["vertical_position"],
-                ),
-                (
-                    self.position.x + self.__size[0] / 2,
-                    self.position.y + self.__separator["height"],
-                ),
+                (self.__size[0] / 2, self.__separator["vertical_position"]),
+                (self.__size[0] / 2, self.__separator["height"]),
                 2,
             )
+            self.__separator_sprite = (
+                _convert_alpha(canvas.subsurface(line_area).copy()),
+                line_area,
+            )
+        sprite, line_area = self.__separator_sprite
+        return sprite, (
+            self.position.x + line_area.x,
+            self.position.y + line_area.y,
+        )
 
     def is_position_inside(self, position: Position) -> bool:
         """
@@ -371,12 +1075,25 @@ class InfoBox:
         Keyword arguments:
             position (Position): the position of the mouse
         """
-        for button in self.buttons:
-            if button.get_rect().collidepoint(position):
-                return button.action_triggered()
+        button = self.get_button_at(position)
+        if button is not None:
+            return button.action_triggered()
         # Return a "do nothing" callable when clicking on empty space
         return lambda: None
 
+    def get_button_at(self, position: Position) -> Optional[Button]:
+        """
+        Returns:
+            Optional[Button]: the button at the given position, None if there is no button there.
+
+        Keyword arguments:
+            position (Position): the position to be checked
+        """
+        for button in self.buttons:
+            if button.get_rect().collidepoint(position):
+                return button
+        return None
+
     def motion(self, position: Position) -> None:
         """
         Handle the triggering of a motion event.
@@ -387,4 +1104,4 @@ class InfoBox:
         """
         for button in self.buttons:
             mouse_is_on_button: bool = button.get_rect().collidepoint(position)
-            button.set_hover(mouse_is_on_button and not button.disabled)
+            button.set_mouse_over(mouse_is_on_button)
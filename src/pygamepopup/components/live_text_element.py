@@ -0,0 +1,166 @@
+"""
+Defines LiveTextElement class, a TextElement bound to a value that can change at each frame,
+such as a counter, a timer or an amount of resources.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional, Sequence, Union
+
+import pygame
+from pygame.constants import SRCALPHA
+
+from ..configuration import _default_fonts
+from ..constants import WHITE
+from ..finalization import _convert_alpha
+from .text_element import TextElement
+from ..type_definitions import Position, Margin
+
+
+class LiveTextElement(TextElement):
+    """
+    This class is representing a single line of text displaying a value, updated in place
+    each time the formatted value changes.
+
+    The value is either polled from a provider at each display of the MenuManager, or given through set_value,
+    which can be registered as the observer of the value.
+    The element keeps the same size whatever the value, so that the layout of its infoBox is never computed
+    again: the text is horizontally centered in the reserved width and clipped if it is wider.
+    Only the part of the element covered by the previous and the new text is redrawn by display_invalidated.
+    If the font is a GlyphAtlas, the text is drawn without creating any new surface.
+
+    Keyword arguments:
+        value_provider (Optional[Callable[[], Any]]): the function giving the current value, called at each
+            display, the value is only changed through set_value if not provided
+        value (Any): the initial value, ignored if a value provider is given, defaults to an empty string
+        text_format (Union[str, Callable[[Any], str]]): the format string in which the value should be inserted,
+            or the function turning the value into text, defaults to "{}"
+        width (Optional[int]): the width reserved for the text, defaults to the width of the initial text
+        position (Position): the position of the text on the screen.
+        font (pygame.font.Font): the font that should be used to render the text, a GlyphAtlas can also be given.
+        margin (Margin): a tuple containing the margins of the box,
+            should be in the form "(top_margin, right_margin, bottom_margin, left_margin)", defaults to (0, 0, 0, 0).
+        text_color (pygame.Color): the color of the rendered text, defaults to WHITE.
+        column_span (int): the number of columns the element should span, defaults to 1.
+
+    Attributes:
+        value (Any): the value currently displayed.
+    """
+
+    def __init__(
+        self,
+        value_provider: Optional[Callable[[], Any]] = None,
+        value: Any = "",
+        text_format: Union[str, Callable[[Any], str]] = "{}",
+        width: Optional[int] = None,
+        position: Position = pygame.Vector2(0, 0),
+        font: pygame.font.Font = None,
+        margin: Margin = (0, 0, 0, 0),
+        text_color: pygame.Color = WHITE,
+        column_span: int = 1,
+    ) -> None:
+        if not font:
+            font = _default_fonts["text_element_content"]
+        self.__value_provider: Optional[Callable[[], Any]] = value_provider
+        self.__text_format: Callable[[Any], str] = (
+            text_format.format if isinstance(text_format, str) else text_format
+        )
+        self.value: Any = value_provider() if value_provider is not None else value
+        text = self.__text_format(self.value)
+        self.__width: int = width if width is not None else font.size(text)[0]
+        self.__text_rect: pygame.Rect = pygame.Rect(0, 0, 0, 0)
+        super().__init__(text, position, font, margin, text_color, column_span)
+
+    def update(self) -> bool:
+        """
+        Poll the value provider, if any, and redraw the text if the formatted value changed.
+
+        Returns:
+            bool: whether the displayed text changed.
+        """
+        if self.__value_provider is None:
+            return False
+        return self.set_value(self.__value_provider())
+
+    def set_value(self, value: Any) -> bool:
+        """
+        Change the displayed value, the text being redrawn only if the formatted value changed.
+
+        Returns:
+            bool: whether the displayed text changed.
+
+        Keyword arguments:
+            value (Any): the new value
+        """
+        self.value = value
+        text = self.__text_format(value)
+        if text == self._text:
+            return False
+        self._text = text
+        self.lines = [text]
+        if self.content is not None:
+            previous_text_rect = self.__text_rect
+            self.content.fill((0, 0, 0, 0), previous_text_rect)
+            self.__text_rect = self.__draw_text(self.content, text)
+            self.invalidate(
+                previous_text_rect.union(self.__text_rect).clip(self.content.get_rect())
+            )
+        return True
+
+    def wrap(self, container_width: int) -> None:
+        """
+        Keep the text on a single line, the size of the element not depending on its container.
+
+        Keyword arguments:
+            container_width (int): the width available for the text.
+        """
+
+    def set_lines(self, lines: Sequence[str], container_width: int) -> None:
+        """
+        Keep the current text, the size of the element not depending on its container.
+
+        Keyword arguments:
+            lines (Sequence[str]): the text lines in order.
+            container_width (int): the width available for the text.
+        """
+
+    def _render_text_lines(
+        self, lines: Sequence[str], container_width: int
+    ) -> pygame.Surface:
+        """
+        Render the text on a new surface of the reserved size.
+
+        Returns:
+            pygame.Surface: the final rendered text
+
+        Keyword arguments:
+            lines (Sequence[str]): the text lines in order, only the first one being drawn.
+            container_width (int): ignored, the width of the element being reserved at its creation.
+        """
+        rendered_text = _convert_alpha(
+            pygame.Surface((self.__width, self._font.get_height()), SRCALPHA)
+        )
+        rendered_text.fill((0, 0, 0, 0))
+        self.__text_rect = self.__draw_text(rendered_text, lines[0] if lines else "")
+        return rendered_text
+
+    def __draw_text(self, target: pygame.Surface, text: str) -> pygame.Rect:
+        """
+        Draw the given text horizontally centered on the target.
+
+        Returns:
+            pygame.Rect: the area of the target covered by the text.
+
+        Keyword arguments:
+            target (pygame.Surface): the surface on which the text should be drawn
+            text (str): the text to be drawn
+        """
+        text_width = self._font.size(text)[0]
+        position = (target.get_width() // 2 - text_width // 2, 0)
+        if hasattr(self._font, "render_into"):
+            text_rect = self._font.render_into(target, text, position, self._text_color)
+        else:
+            text_rect = target.blit(
+                self._font.render(text, True, self._text_color), position
+            )
+        return text_rect.clip(target.get_rect())
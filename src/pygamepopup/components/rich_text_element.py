@@ -0,0 +1,413 @@
+"""
+Defines RichTextElement class, a TextElement permitting to mix colors, bold, italic and sizes
+in a single paragraph, and TextSpan class, describing a part of the text sharing the same style.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Optional, Sequence, Union
+
+import pygame
+from pygame.constants import SRCALPHA
+
+from ..constants import WHITE
+from ..fonts import _font_descriptions, _load_font
+from ..type_definitions import Position, Margin
+from .text_element import TextElement
+
+_MARKUP_TAG_PATTERN = re.compile(r"<(/?)(b|i|color|size)(?:=([^>]+))?>")
+_PIECE_PATTERN = re.compile(r"\S+\s*|\s+")
+
+_Style = tuple[tuple[int, int, int, int], bool, bool, Optional[int]]
+
+
+def _load_default_font(size: int) -> pygame.font.Font:
+    """
+    Returns:
+        pygame.font.Font: pygame's default font at the given size.
+
+    Keyword arguments:
+        size (int): the size of the font
+    """
+    return _load_font({"is_system_font": False, "name": None, "size": size})
+
+
+class TextSpan:
+    """
+    This class is representing a part of a rich text sharing the same style.
+
+    Keyword arguments:
+        text (str): the text of the span.
+        color (Optional[pygame.Color]): the color of the text, defaults to the color of the rich text element.
+        bold (bool): whether the text should be bold, defaults to False.
+        italic (bool): whether the text should be italic, defaults to False.
+        size (Optional[int]): the size of the font, defaults to the font of the rich text element.
+
+    Attributes:
+        text (str): the text of the span.
+        color (Optional[pygame.Color]): the color of the text.
+        bold (bool): whether the text is bold.
+        italic (bool): whether the text is italic.
+        size (Optional[int]): the size of the font.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        color: Optional[pygame.Color] = None,
+        bold: bool = False,
+        italic: bool = False,
+        size: Optional[int] = None,
+    ) -> None:
+        self.text: str = text
+        self.color: Optional[pygame.Color] = color
+        self.bold: bool = bold
+        self.italic: bool = italic
+        self.size: Optional[int] = size
+
+    def __repr__(self):
+        return f"TextSpan({self.text!r})"
+
+
+class RichTextElement(TextElement):
+    """
+    This class is representing a paragraph of text in which parts can have their own color,
+    be bold or italic or have a different size.
+
+    The text can be given as a sequence of TextSpan or with a simple markup:
+    "<b>bold</b>", "<i>italic</i>", "<color=red>colored</color>" (any name or hexadecimal value understood by
+    pygame.Color) and "<size=30>bigger</size>", tags can be nested.
+
+    The text is split in lines in a single pass, each line being horizontally centered.
+    Each run of text sharing the same span on a line is rendered separately and kept in cache,
+    so that changing the color of a span only renders again the runs of this span.
+
+    Keyword arguments:
+        text (Union[str, Sequence[TextSpan]]): the text in markup or the spans that should be rendered.
+        position (Position): the position of the text on the screen.
+        font (pygame.font.Font): the font that should be used to render the text.
+        margin (Margin): a tuple containing the margins of the box,
+            should be in the form "(top_margin, right_margin, bottom_margin, left_margin)", defaults to (0, 0, 0, 0).
+        text_color (pygame.Color): the default color of the rendered text, defaults to WHITE.
+        column_span (int): the number of columns the element should span, defaults to 1.
+        font_factory (Optional[Callable[[int], pygame.font.Font]]): the function loading a new font of the given size
+            for spans having a specific size, by default the font of the element is loaded again at that size,
+            or pygame's default font if the font of the element has not been loaded by pygamepopup.
+            Bold and italic spans are rendered with fonts of their own, the font of the element is never modified.
+
+    Attributes:
+        spans (list[TextSpan]): the spans composing the text.
+        lines (list[list[int]]): the lines in order, each one being the range of indices of the pieces of text
+            it contains.
+    """
+
+    def __init__(
+        self,
+        text: Union[str, Sequence[TextSpan]],
+        position: Position = pygame.Vector2(0, 0),
+        font: pygame.font.Font = None,
+        margin: Margin = (0, 0, 0, 0),
+        text_color: pygame.Color = WHITE,
+        column_span: int = 1,
+        font_factory: Optional[Callable[[int], pygame.font.Font]] = None,
+    ) -> None:
+        self.spans: list[TextSpan] = (
+            RichTextElement.parse_markup(text) if isinstance(text, str) else list(text)
+        )
+        self.__font_factory: Optional[Callable[[int], pygame.font.Font]] = font_factory
+        self.__fonts_by_style: dict[
+            tuple[Optional[int], bool, bool], pygame.font.Font
+        ] = {}
+        self.__rendered_runs: dict[tuple[str, _Style], pygame.Surface] = {}
+        # Span index, text and area in the content of each run currently drawn
+        self.__run_areas: list[tuple[int, str, pygame.Rect]] = []
+        self.__pieces: list[tuple[int, str]] = [
+            (span_index, piece)
+            for span_index, span in enumerate(self.spans)
+            for piece in _PIECE_PATTERN.findall(span.text)
+        ]
+        self.__piece_widths: dict[tuple[str, _Style], int] = {}
+        super().__init__(
+            "".join(span.text for span in self.spans),
+            position,
+            font,
+            margin,
+            text_color,
+            column_span,
+        )
+
+    @staticmethod
+    def parse_markup(markup: str) -> list[TextSpan]:
+        """
+        Split a text written with the simple markup in spans.
+
+        Returns:
+            list[TextSpan]: the spans in order.
+
+        Keyword arguments:
+            markup (str): the text containing tags.
+        """
+        spans: list[TextSpan] = []
+        style_stack: list[dict[str, Any]] = [{}]
+        last_index = 0
+        for tag in _MARKUP_TAG_PATTERN.finditer(markup):
+            if tag.start() > last_index:
+                spans.append(
+                    TextSpan(markup[last_index : tag.start()], **style_stack[-1])
+                )
+            is_closing, tag_name, value = tag.groups()
+            if is_closing:
+                if len(style_stack) > 1:
+                    style_stack.pop()
+            else:
+                style = dict(style_stack[-1])
+                if tag_name == "b":
+                    style["bold"] = True
+                elif tag_name == "i":
+                    style["italic"] = True
+                elif tag_name == "color":
+                    style["color"] = pygame.Color(value)
+                else:
+                    style["size"] = int(value)
+                style_stack.append(style)
+            last_index = tag.end()
+        if last_index < len(markup):
+            spans.append(TextSpan(markup[last_index:], **style_stack[-1]))
+        return spans
+
+    def set_span_color(self, span_index: int, color: pygame.Color) -> None:
+        """
+        Change the color of a span, only the runs of this span are rendered again.
+
+        Keyword arguments:
+            span_index (int): the index of the span in the spans of the element
+            color (pygame.Color): the new color of the span
+        """
+        previous_style = self.__get_style(span_index)
+        self.spans[span_index].color = color
+        if self.content is None:
+            return
+        for run_span_index, run_text, run_area in self.__run_areas:
+            if run_span_index != span_index:
+                continue
+            self.__rendered_runs.pop((run_text, previous_style), None)
+            self.content.fill((0, 0, 0, 0), run_area)
+            self.content.blit(self.__render_run(span_index, run_text), run_area)
+            self.invalidate(run_area)
+
+    def _get_unwrapped_lines(self) -> list[list[int]]:
+        """
+        Returns:
+            list[list[int]]: a single line containing all the pieces of text.
+        """
+        return [[0, len(self.__pieces)]]
+
+    def _split_text_lines(self, text: str, container_width: int) -> list[list[int]]:
+        """
+        Split the pieces of text in lines fitting in the container, in a single pass.
+
+        Returns:
+            list[list[int]]: the lines in order, each one being the range of indices of its pieces.
+
+        Keyword arguments:
+            text (str): unused, the pieces of the spans are split instead.
+            container_width (int): the width of the container.
+        """
+        lines: list[list[int]] = []
+        line_start = 0
+        line_width = 0
+        for index, (span_index, piece) in enumerate(self.__pieces):
+            piece_width = self.__get_piece_width(span_index, piece)
+            if line_width + piece_width > container_width and index > line_start:
+                lines.append([line_start, index])
+                line_start = index
+                line_width = 0
+            line_width += piece_width
+        lines.append([line_start, len(self.__pieces)])
+        return lines
+
+    def _render_text_lines(
+        self, lines: Sequence[Sequence[int]], container_width: int
+    ) -> pygame.Surface:
+        """
+        Render the given lines, each one being horizontally centered in the container.
+        Runs that were already rendered with the same style are reused.
+
+        Returns:
+            pygame.Surface: the final rendered text
+
+        Keyword arguments:
+            lines (Sequence[Sequence[int]]): the lines in order, as ranges of indices of pieces.
+            container_width (int): the width of the container, only relevant if there are many lines.
+        """
+        previous_runs = self.__rendered_runs
+        self.__rendered_runs = {}
+        rendered_lines: list[list[tuple[int, str, pygame.Surface]]] = []
+        for line_start, line_end in lines:
+            rendered_line: list[tuple[int, str, pygame.Surface]] = []
+            for span_index, run_text in self.__get_runs(line_start, line_end):
+                run_key = (run_text, self.__get_style(span_index))
+                if run_key in previous_runs:
+                    self.__rendered_runs[run_key] = previous_runs[run_key]
+                rendered_line.append(
+                    (span_index, run_text, self.__render_run(span_index, run_text))
+                )
+            rendered_lines.append(rendered_line)
+
+        line_widths = [
+            sum(rendered_run.get_width() for _, _, rendered_run in rendered_line)
+            for rendered_line in rendered_lines
+        ]
+        line_heights = [
+            max(
+                (rendered_run.get_height() for _, _, rendered_run in rendered_line),
+                default=self._font.get_height(),
+            )
+            for rendered_line in rendered_lines
+        ]
+        width = container_width if len(lines) > 1 else line_widths[0]
+        final_render = pygame.Surface((width, sum(line_heights)), SRCALPHA)
+        self.__run_areas = []
+        y_coordinate = 0
+        for rendered_line, line_width, line_height in zip(
+            rendered_lines, line_widths, line_heights
+        ):
+            x_coordinate = width // 2 - line_width // 2
+            for span_index, run_text, rendered_run in rendered_line:
+                run_area = final_render.blit(
+                    rendered_run,
+                    (
+                        x_coordinate,
+                        y_coordinate + line_height - rendered_run.get_height(),
+                    ),
+                )
+                self.__run_areas.append((span_index, run_text, run_area))
+                x_coordinate += rendered_run.get_width()
+            y_coordinate += line_height
+        return final_render
+
+    def _get_surfaces(self) -> list[Optional[pygame.Surface]]:
+        """
+        Returns:
+            list[Optional[pygame.Surface]]: all the surfaces held by the element, including the rendered runs.
+        """
+        return super()._get_surfaces() + list(self.__rendered_runs.values())
+
+    def release_render_resources(self) -> None:
+        """
+        Drop the rendered text and runs, to free memory.
+
+        The element should not be displayed until rebuild_render_resources is called.
+        """
+        super().release_render_resources()
+        self.__rendered_runs = {}
+
+    def __get_runs(self, line_start: int, line_end: int) -> list[tuple[int, str]]:
+        """
+        Returns:
+            list[tuple[int, str]]: the span index and the text of each run of consecutive pieces
+            belonging to the same span in the given range.
+
+        Keyword arguments:
+            line_start (int): the index of the first piece of the line
+            line_end (int): the index following the last piece of the line
+        """
+        runs: list[tuple[int, str]] = []
+        for span_index, piece in self.__pieces[line_start:line_end]:
+            if runs and runs[-1][0] == span_index:
+                runs[-1] = (span_index, runs[-1][1] + piece)
+            else:
+                runs.append((span_index, piece))
+        return runs
+
+    def __get_style(self, span_index: int) -> _Style:
+        """
+        Returns:
+            _Style: the color, boldness, italicness and size that should be used to render the given span.
+
+        Keyword arguments:
+            span_index (int): the index of the span
+        """
+        span = self.spans[span_index]
+        color = span.color if span.color is not None else self._text_color
+        return tuple(pygame.Color(color)), span.bold, span.italic, span.size
+
+    def __get_font(self, style: _Style) -> pygame.font.Font:
+        """
+        Returns:
+            pygame.font.Font: the font matching the size, boldness and italicness of the given style.
+
+        Keyword arguments:
+            style (_Style): the style of the text to be rendered
+        """
+        _, is_bold, is_italic, size = style
+        if size is None and not is_bold and not is_italic:
+            return self._font
+        font_key = (size, is_bold, is_italic)
+        if font_key not in self.__fonts_by_style:
+            font = self.__load_font(size)
+            font.set_bold(is_bold)
+            font.set_italic(is_italic)
+            self.__fonts_by_style[font_key] = font
+        return self.__fonts_by_style[font_key]
+
+    def __load_font(self, size: Optional[int]) -> pygame.font.Font:
+        """
+        Load again the font of the element, so that its style can be changed without altering the other
+        elements using it.
+        Sizes are given to the font factory if there is one.
+        A font that has not been loaded by pygamepopup is replaced by pygame's default font, or loaded
+        through the font factory at its point size.
+
+        Returns:
+            pygame.font.Font: a new font like the font of the element, at the given size.
+
+        Keyword arguments:
+            size (Optional[int]): the size of the font, the size of the font of the element if None
+        """
+        if self.__font_factory is not None and size is not None:
+            return self.__font_factory(size)
+        font_description = _font_descriptions.get(self._font)
+        if font_description is not None:
+            if size is not None:
+                font_description = {**font_description, "size": size}
+            return _load_font(font_description)
+        font_factory = (
+            self.__font_factory
+            if self.__font_factory is not None
+            else _load_default_font
+        )
+        return font_factory(size if size is not None else self._font.point_size)
+
+    def __get_piece_width(self, span_index: int, piece: str) -> int:
+        """
+        Returns:
+            int: the width of the given piece of text once rendered with the style of its span.
+
+        Keyword arguments:
+            span_index (int): the index of the span containing the piece
+            piece (str): the piece of text
+        """
+        style = self.__get_style(span_index)
+        key = (piece, style)
+        if key not in self.__piece_widths:
+            self.__piece_widths[key] = self.__get_font(style).size(piece)[0]
+        return self.__piece_widths[key]
+
+    def __render_run(self, span_index: int, run_text: str) -> pygame.Surface:
+        """
+        Returns:
+            pygame.Surface: the rendering of the given run with the style of its span, from cache if possible.
+
+        Keyword arguments:
+            span_index (int): the index of the span containing the run
+            run_text (str): the text of the run
+        """
+        style = self.__get_style(span_index)
+        key = (run_text, style)
+        if key not in self.__rendered_runs:
+            self.__rendered_runs[key] = self.__get_font(style).render(
+                run_text, True, style[0]
+            )
+        return self.__rendered_runs[key]
@@ -5,11 +5,16 @@ be centered on an popup.
 
 from __future__ import annotations
 
+from typing import Sequence
+
 import pygame
 from pygame.constants import SRCALPHA
 
+from .. import instrumentation
 from ..configuration import _default_fonts
 from ..constants import WHITE
+from ..fonts import _get_font_signature
+from ..sprite_cache import _load_or_render
 from .box_element import BoxElement
 from ..type_definitions import Position, Margin
 
@@ -22,11 +27,15 @@ class TextElement(BoxElement):
     Keyword arguments:
         text (str): the text that should be rendered.
         position (Position): the position of the text on the screen.
-        font (pygame.font.Font): the font that should be used to render the text.
+        font (pygame.font.Font): the font that should be used to render the text, a GlyphAtlas can also be given
+            for texts changing often.
         margin (Margin): a tuple containing the margins of the box,
             should be in the form "(top_margin, right_margin, bottom_margin, left_margin)", defaults to (0, 0, 0, 0).
         text_color (pygame.Color): the color of the rendered text, defaults to WHITE.
         column_span (int): the number of columns the element should span, defaults to 1.
+
+    Attributes:
+        lines (list[str]): the text lines in order, once the text has been split to fit in its container.
     """
 
     def __init__(
@@ -43,9 +52,18 @@ class TextElement(BoxElement):
         self._font = font
         self._text = text
         self._text_color = text_color
-        rendered_text: pygame.Surface = font.render(text, True, text_color)
+        self.lines: list[str] = self._get_unwrapped_lines()
+        self._container_width: int = 0
+        rendered_text: pygame.Surface = self._render_text_lines(self.lines, 0)
         super().__init__(position, rendered_text, margin, column_span)
 
+    def _get_unwrapped_lines(self) -> list:
+        """
+        Returns:
+            list: the lines of the text before it is split to fit in a container.
+        """
+        return [self._text]
+
     def _verify_rendered_text_size(
         self, rendered_text: pygame.Surface, text: str, container_width: int
     ) -> pygame.Surface:
@@ -60,35 +78,155 @@ class TextElement(BoxElement):
             text (str): the text that would be split if necessary.
             container_width (int): the width of the container.
         """
-        final_render = rendered_text
+        if rendered_text.get_width() <= container_width:
+            return rendered_text
+        return self._render_text_lines(
+            self._split_text_lines(text, container_width), container_width
+        )
 
-        if final_render.get_width() > container_width:
-            first_part, second_part = TextElement.__divide_text(text)
-            first_part_render = self._font.render(first_part, True, self._text_color)
-            first_part_render = self._verify_rendered_text_size(
-                first_part_render, first_part, container_width
-            )
-            second_part_render = self._font.render(second_part, True, self._text_color)
-            second_part_render = self._verify_rendered_text_size(
-                second_part_render, second_part, container_width
-            )
+    def wrap(self, container_width: int) -> None:
+        """
+        Split the text of the element in as many lines as needed to fit in the given width,
+        and update the content accordingly, unless it is already split this way.
+        A single line doesn't depend on the width of its container and is never rendered again.
+        The duration of the wrapping is measured by the instrumentation under the name "wrap_text".
+
+        Keyword arguments:
+            container_width (int): the width available for the text.
+        """
+        with instrumentation.measure("wrap_text", width=container_width):
+            lines = self._split_text_lines(self._text, container_width)
+            if (
+                lines == self.lines
+                and (len(lines) == 1 or container_width == self._container_width)
+                and self.content is not None
+            ):
+                self._container_width = container_width
+                return
+            self.set_lines(lines, container_width)
+
+    def set_lines(self, lines: Sequence[str], container_width: int) -> None:
+        """
+        Render the text of the element following already known line breaks.
+
+        Keyword arguments:
+            lines (Sequence[str]): the text lines in order.
+            container_width (int): the width available for the text.
+        """
+        self.lines = list(lines)
+        self._container_width = container_width
+        self.content = self._render_text_lines(self.lines, container_width)
+        self.size = self.content.get_size()
+
+    def release_render_resources(self) -> None:
+        """
+        Drop the rendered text, to free memory.
+
+        The element should not be displayed until rebuild_render_resources is called.
+        """
+        self.content = None
+
+    def rebuild_render_resources(self) -> None:
+        """
+        Render again the text dropped by release_render_resources, if any.
+        """
+        if self.content is None:
+            self.content = self._render_text_lines(self.lines, self._container_width)
+
+    def _split_text_lines(self, text: str, container_width: int) -> list[str]:
+        """
+        Recursively divide a text in two parts until each part could fit in its container.
+
+        Returns:
+            list[str]: the text lines in order.
+
+        Keyword arguments:
+            text (str): the text that would be split if necessary.
+            container_width (int): the width of the container.
+        """
+        if self._font.size(text)[0] <= container_width:
+            return [text]
+        first_part, second_part = TextElement.__divide_text(text)
+        return self._split_text_lines(
+            first_part, container_width
+        ) + self._split_text_lines(second_part, container_width)
+
+    def _render_text_lines(
+        self, lines: Sequence[str], container_width: int
+    ) -> pygame.Surface:
+        """
+        Render the given text lines, each one being horizontally centered in the container.
+        The rendering is loaded from the sprite cache if one is configured and already contains it.
+
+        Returns:
+            pygame.Surface: the final rendered text
+
+        Keyword arguments:
+            lines (Sequence[str]): the text lines in order.
+            container_width (int): the width of the container, only relevant if there are many lines.
+        """
+        return _load_or_render(
+            lambda: (
+                type(self).__name__,
+                tuple(lines),
+                tuple(self._text_color),
+                _get_font_signature(self._font),
+                container_width if len(lines) > 1 else None,
+            ),
+            lambda: self.__render_text_lines(lines, container_width),
+        )
+
+    def __render_text_lines(
+        self, lines: Sequence[str], container_width: int
+    ) -> pygame.Surface:
+        """
+        If the font is a GlyphAtlas and there are many lines, the lines are drawn directly on the final rendering.
+
+        Returns:
+            pygame.Surface: the given text lines rendered one below the other, horizontally centered.
+
+        Keyword arguments:
+            lines (Sequence[str]): the text lines in order.
+            container_width (int): the width of the container.
+        """
+        if len(lines) > 1 and hasattr(self._font, "render_into"):
+            line_height = self._font.get_height()
             final_render = pygame.Surface(
-                (
-                    container_width,
-                    first_part_render.get_height() + second_part_render.get_height(),
-                ),
-                SRCALPHA,
-            )
-            first_part_x = (
-                final_render.get_width() // 2 - first_part_render.get_width() // 2
-            )
-            final_render.blit(first_part_render, (first_part_x, 0))
-            second_part_x = (
-                final_render.get_width() // 2 - second_part_render.get_width() // 2
+                (container_width, line_height * len(lines)), SRCALPHA
             )
+            for index, line in enumerate(lines):
+                self._font.render_into(
+                    final_render,
+                    line,
+                    (
+                        container_width // 2 - self._font.size(line)[0] // 2,
+                        index * line_height,
+                    ),
+                    self._text_color,
+                )
+            return final_render
+        rendered_lines = [
+            self._font.render(line, True, self._text_color) for line in lines
+        ]
+        if len(rendered_lines) == 1:
+            return rendered_lines[0]
+        final_render = pygame.Surface(
+            (
+                container_width,
+                sum(rendered_line.get_height() for rendered_line in rendered_lines),
+            ),
+            SRCALPHA,
+        )
+        y_coordinate = 0
+        for rendered_line in rendered_lines:
             final_render.blit(
-                second_part_render, (second_part_x, first_part_render.get_height())
+                rendered_line,
+                (
+                    final_render.get_width() // 2 - rendered_line.get_width() // 2,
+                    y_coordinate,
+                ),
             )
+            y_coordinate += rendered_line.get_height()
         return final_render
 
     @staticmethod
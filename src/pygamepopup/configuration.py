@@ -6,13 +6,16 @@ from __future__ import annotations
 
 import os
 from os.path import abspath
-from typing import Union
+from typing import Any, Union, Optional, TYPE_CHECKING
 
 from importlib import resources
 import pygame
 
 from .constants import WHITE
 
+if TYPE_CHECKING:
+    from .sprite_cache import SpriteCache
+
 resource_package = __package__
 
 _default_sprites: dict[str, Union[dict[str, str], str]] = {
@@ -27,7 +30,7 @@ _default_sprites: dict[str, Union[dict[str, str], str]] = {
     "info_box_background": resources.files(resource_package) / 'images' / 'default_box.png',
 }
 
-_default_fonts_description: dict[str, dict[str, any]] = {
+_default_fonts_description: dict[str, dict[str, Any]] = {
     "button_title": {"is_system_font": True, "size": 20, "is_bold": True},
     "dynamic_button_title": {"is_system_font": True, "size": 20, "is_bold": True},
     "text_element_content": {"is_system_font": True, "size": 20, "is_bold": True},
@@ -42,6 +45,8 @@ _default_colors: dict[str, dict[str, pygame.Color]] = {
     "button_text_color": {"inactive": WHITE, "active": WHITE}
 }
 
+_caches: dict[str, Any] = {"sprites": None}
+
 
 def set_button_background(
     button_background_path: str, button_hovered_background_path: str
@@ -149,3 +154,14 @@ def set_button_text_color(color: pygame.Color, hover_color: pygame.color) -> Non
     """
     _default_colors["button_text_color"]["inactive"] = color
     _default_colors["button_text_color"]["active"] = hover_color
+
+
+def set_sprite_cache(sprite_cache: Optional[SpriteCache]) -> None:
+    """
+    Set the disk cache in which rendered sprites of buttons, texts and infoboxes are stored
+    and from which they are loaded back instead of being rendered again.
+
+    Keyword Args:
+        sprite_cache (Optional[SpriteCache]): the cache to be used, or None to disable caching.
+    """
+    _caches["sprites"] = sprite_cache
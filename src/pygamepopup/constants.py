@@ -10,11 +10,13 @@ import pygame
 WHITE = pygame.Color("white")
 BLACK = pygame.Color("black")
 MIDNIGHT_BLUE = pygame.Color("midnightblue")
+FOREST_GREEN = pygame.Color("forestgreen")
 
 # Display parameters
 CLOSE_BUTTON_MARGIN_TOP = 20
 DEFAULT_MARGIN_TOP = 10
 MARGIN_BOX = 20
+MARGIN_BOX_HORIZONTAL = 10
 MARGIN_LINKED_ELEMENT = 20
 DEFAULT_POPUP_WIDTH = 400
 
@@ -22,3 +24,8 @@ DEFAULT_POPUP_WIDTH = 400
 BUTTON_SIZE = (200, 60)
 IMAGE_BUTTON_SIZE = (250, 60)
 CLOSE_BUTTON_SIZE = (150, 50)
+GAUGE_SIZE = (200, 30)
+
+# Gauge parameters
+GAUGE_FRAME_BORDER = 8
+GAUGE_PADDING = 6
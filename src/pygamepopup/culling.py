@@ -0,0 +1,103 @@
+"""
+Defines the tools permitting to skip drawing what would not be visible on the screen:
+the analysis of the opaque part of sprites, and the counters of what has been culled.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import pygame
+from pygame.constants import SRCALPHA
+
+OPAQUE_ALPHA_THRESHOLD = 254
+
+
+def compute_opaque_rect(surface: pygame.Surface) -> Optional[pygame.Rect]:
+    """
+    Find an area of the surface in which every pixel is fully opaque, keeping the same distance to
+    each side of the surface, so that rounded or shadowed borders are excluded.
+
+    Returns:
+        Optional[pygame.Rect]: the largest such area relative to the top left corner of the surface,
+        None if there is none once a quarter of the smallest dimension of the surface is removed from each side.
+
+    Keyword arguments:
+        surface (pygame.Surface): the surface to be analyzed
+    """
+    surface_alpha = surface.get_alpha()
+    if surface_alpha is not None and surface_alpha < 255:
+        return None
+    surface_rect = surface.get_rect()
+    if not surface.get_flags() & SRCALPHA and surface.get_colorkey() is None:
+        return surface_rect
+    opaque_mask = pygame.mask.from_surface(surface, OPAQUE_ALPHA_THRESHOLD)
+
+    def is_opaque(inset: int) -> bool:
+        area = surface_rect.inflate(-2 * inset, -2 * inset)
+        return (
+            opaque_mask.overlap_area(
+                pygame.mask.Mask(area.size, fill=True), area.topleft
+            )
+            == area.width * area.height
+        )
+
+    # An area fully opaque stays fully opaque once reduced, so the smallest inset is found by bisection
+    lowest_inset, highest_inset = 0, min(surface_rect.size) // 4
+    if (
+        not surface_rect.width
+        or not surface_rect.height
+        or not is_opaque(highest_inset)
+    ):
+        return None
+    while lowest_inset < highest_inset:
+        middle_inset = (lowest_inset + highest_inset) // 2
+        if is_opaque(middle_inset):
+            highest_inset = middle_inset
+        else:
+            lowest_inset = middle_inset + 1
+    return surface_rect.inflate(-2 * lowest_inset, -2 * lowest_inset)
+
+
+def is_occluded(rect: pygame.Rect, occluding_rects: Sequence[pygame.Rect]) -> bool:
+    """
+    Returns:
+        bool: whether the given area is entirely inside one of the occluding areas.
+
+    Keyword arguments:
+        rect (pygame.Rect): the area to be checked
+        occluding_rects (Sequence[pygame.Rect]): the opaque areas drawn over it
+    """
+    return any(occluding_rect.contains(rect) for occluding_rect in occluding_rects)
+
+
+class CullingStatistics:
+    """
+    This class counts what has not been drawn because it would not have been visible,
+    to verify the saving made by culling.
+
+    Attributes:
+        occluded_menus (int): the number of times a menu has not been drawn because it was entirely
+            covered by an opaque menu
+        occluded_elements (int): the number of times an element has not been drawn because it was entirely
+            covered by an opaque menu
+        offscreen_menus (int): the number of times a menu has not been drawn because it was entirely outside
+            the clipping area of the screen
+        offscreen_elements (int): the number of times an element has not been drawn because it was entirely
+            outside the clipping area of the screen
+    """
+
+    def __init__(self) -> None:
+        self.occluded_menus: int = 0
+        self.occluded_elements: int = 0
+        self.offscreen_menus: int = 0
+        self.offscreen_elements: int = 0
+
+    def reset(self) -> None:
+        """
+        Set all the counters back to zero.
+        """
+        self.occluded_menus = 0
+        self.occluded_elements = 0
+        self.offscreen_menus = 0
+        self.offscreen_elements = 0
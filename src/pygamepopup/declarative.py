@@ -0,0 +1,269 @@
+"""
+Defines the declarative format of menus, permitting to describe an InfoBox and its elements
+with plain data (a dict, a JSON or a TOML file) instead of building it in Python.
+
+A menu definition is a dict with the following keys, only "title" being mandatory:
+
+- "title", "width", "position", "has_close_button", "title_color", "background_path", "close_button_text",
+  "close_button_background_path", "close_button_background_hover_path", "visible_on_background",
+  "has_vertical_separator" and "identifier": the arguments of the InfoBox
+- "element_grid": a list of rows, each row being a list of element definitions
+- "styles": a dict of named sets of arguments, that elements can reuse through their "style" key
+- "columns" and "column_spacing": the column definitions of the GridLayout the element grid should follow,
+  each column being a width (e.g. 120, "auto" or "2fr") or a dict with "width" and "alignment" keys
+
+An element definition is a dict with a "type" key among "text", "button", "dynamic_button" and
+"image_button", the other keys being the arguments of the matching component.
+The "callback" of buttons is the name of a function given at compilation time,
+colors can be given by name or as a list of components and fonts as a description like the ones used by
+the configuration (e.g. {"is_system_font": true, "size": 20, "is_bold": true}).
+
+The layout computed for a compiled menu can be stored in a LayoutCache, keyed by a hash of
+the definition and of the default fonts, so that unchanged menus skip the layout computation at the next startup.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tomllib
+from typing import Any, Callable, Mapping, Optional, Union
+
+import pygame
+
+from .configuration import _default_fonts, _default_sprites
+from .components import Button, DynamicButton, ImageButton, InfoBox, TextElement
+from .components.box_element import BoxElement
+from .fonts import _get_font_signature, _load_font
+from .layout import Column, GridLayout
+
+LAYOUT_FORMAT_VERSION = 1
+
+_ELEMENT_TYPES: dict[str, type[BoxElement]] = {
+    "text": TextElement,
+    "button": Button,
+    "dynamic_button": DynamicButton,
+    "image_button": ImageButton,
+}
+
+_COLOR_ARGUMENTS = ("text_color", "text_hover_color", "title_color")
+_FONT_ARGUMENTS = ("font", "font_hover")
+_TUPLE_ARGUMENTS = ("size", "margin", "position")
+
+
+class LayoutCache:
+    """
+    This class represents a store of the layouts computed for menus, that can be persisted on disk
+    in a JSON file to be reused at the next startup.
+
+    Keyword arguments:
+        path (Optional[str]): the path to the JSON file where layouts are persisted, layouts are only kept in
+            memory if not provided
+
+    Attributes:
+        path (Optional[str]): the path to the JSON file where layouts are persisted
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path: Optional[str] = path
+        self.__layouts: dict[str, dict[str, Any]] = {}
+        self.__has_changed: bool = False
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as layouts_file:
+                self.__layouts = json.load(layouts_file)
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Returns:
+            Optional[dict[str, Any]]: the layout stored for the given key, None if there is none.
+
+        Keyword arguments:
+            key (str): the key identifying the layout
+        """
+        return self.__layouts.get(key)
+
+    def store(self, key: str, layout: dict[str, Any]) -> None:
+        """
+        Store the given layout.
+
+        Keyword arguments:
+            key (str): the key identifying the layout
+            layout (dict[str, Any]): the layout, as exported by InfoBox.export_layout
+        """
+        self.__layouts[key] = layout
+        self.__has_changed = True
+
+    def save(self) -> None:
+        """
+        Write the stored layouts in the JSON file if any has been added since the cache was loaded.
+        """
+        if not self.path or not self.__has_changed:
+            return
+        with open(self.path, "w", encoding="utf-8") as layouts_file:
+            json.dump(self.__layouts, layouts_file)
+        self.__has_changed = False
+
+    def __len__(self) -> int:
+        return len(self.__layouts)
+
+
+def load_menu_definition(path: str) -> dict[str, Any]:
+    """
+    Load a menu definition from a JSON or a TOML file, according to the file extension.
+
+    Returns:
+        dict[str, Any]: the loaded menu definition.
+
+    Keyword arguments:
+        path (str): the path to the file containing the definition
+    """
+    if path.endswith(".toml"):
+        with open(path, "rb") as definition_file:
+            return tomllib.load(definition_file)
+    with open(path, "r", encoding="utf-8") as definition_file:
+        return json.load(definition_file)
+
+
+def compute_layout_key(definition: Mapping[str, Any]) -> str:
+    """
+    Compute the key identifying the layout of a menu, changing whenever the definition of the menu
+    or the default fonts change.
+
+    Returns:
+        str: the computed key.
+
+    Keyword arguments:
+        definition (Mapping[str, Any]): the definition of the menu
+    """
+    theme = {
+        "fonts": {
+            font_name: _get_font_signature(font)
+            for font_name, font in _default_fonts.items()
+        },
+        "sprites": str(_default_sprites),
+    }
+    content = json.dumps(
+        [LAYOUT_FORMAT_VERSION, definition, theme], sort_keys=True, default=str
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def compile_menu(
+    definition: Mapping[str, Any],
+    callbacks: Optional[Mapping[str, Callable]] = None,
+    layout_cache: Optional[LayoutCache] = None,
+) -> InfoBox:
+    """
+    Build the InfoBox described by the given definition.
+
+    Returns:
+        InfoBox: the built menu, ready to be opened.
+
+    Keyword arguments:
+        definition (Mapping[str, Any]): the definition of the menu
+        callbacks (Optional[Mapping[str, Callable]]): the functions that can be referred by their name
+            in the definition of the buttons
+        layout_cache (Optional[LayoutCache]): the cache in which the layout of the menu should be looked for
+            and stored
+    """
+    if callbacks is None:
+        callbacks = {}
+    styles: Mapping[str, Mapping[str, Any]] = definition.get("styles", {})
+    element_grid = [
+        [
+            _compile_element(element_definition, styles, callbacks)
+            for element_definition in row
+        ]
+        for row in definition.get("element_grid", [])
+    ]
+    menu_arguments = {
+        argument_name: _convert_argument(argument_name, value)
+        for argument_name, value in definition.items()
+        if argument_name not in ("element_grid", "styles", "columns", "column_spacing")
+    }
+    if "columns" in definition:
+        menu_arguments["grid_layout"] = GridLayout(
+            [
+                Column(**column) if isinstance(column, Mapping) else column
+                for column in definition["columns"]
+            ],
+            definition.get("column_spacing", 0),
+        )
+    menu = InfoBox(element_grid=element_grid, **menu_arguments)
+    if layout_cache is not None:
+        menu.set_layout_cache(layout_cache, compute_layout_key(definition))
+    return menu
+
+
+def _compile_element(
+    element_definition: Mapping[str, Any],
+    styles: Mapping[str, Mapping[str, Any]],
+    callbacks: Mapping[str, Callable],
+) -> BoxElement:
+    """
+    Build the component described by the given definition.
+
+    Returns:
+        BoxElement: the built component.
+
+    Keyword arguments:
+        element_definition (Mapping[str, Any]): the definition of the component
+        styles (Mapping[str, Mapping[str, Any]]): the named styles of the menu
+        callbacks (Mapping[str, Callable]): the functions that can be referred by their name
+    """
+    arguments = dict(element_definition)
+    if "style" in arguments:
+        style_name = arguments.pop("style")
+        if style_name not in styles:
+            raise ValueError(f"Unknown style '{style_name}' in menu definition")
+        arguments = {**styles[style_name], **arguments}
+    element_type = arguments.pop("type", "text")
+    if element_type not in _ELEMENT_TYPES:
+        raise ValueError(f"Unknown element type '{element_type}' in menu definition")
+    if "callback" in arguments:
+        callback_name = arguments["callback"]
+        if callback_name not in callbacks:
+            raise ValueError(f"Unknown callback '{callback_name}' in menu definition")
+        arguments["callback"] = callbacks[callback_name]
+    return _ELEMENT_TYPES[element_type](
+        **{
+            argument_name: _convert_argument(argument_name, value)
+            for argument_name, value in arguments.items()
+        }
+    )
+
+
+def _convert_argument(argument_name: str, value: Any) -> Any:
+    """
+    Convert a value from its plain data form to the type expected by the components.
+
+    Returns:
+        Any: the converted value.
+
+    Keyword arguments:
+        argument_name (str): the name of the argument
+        value (Any): the value in its plain data form
+    """
+    if value is None:
+        return None
+    if argument_name in _COLOR_ARGUMENTS:
+        return _convert_color(value)
+    if argument_name in _FONT_ARGUMENTS:
+        return _load_font(value)
+    if argument_name in _TUPLE_ARGUMENTS:
+        return tuple(value)
+    return value
+
+
+def _convert_color(value: Union[str, list[int]]) -> pygame.Color:
+    """
+    Returns:
+        pygame.Color: the color matching the given name or components.
+
+    Keyword arguments:
+        value (Union[str, list[int]]): the name of the color or its components
+    """
+    if isinstance(value, str):
+        return pygame.Color(value)
+    return pygame.Color(*value)
@@ -0,0 +1,70 @@
+"""
+Defines the helpers permitting to build menus outside the main thread.
+
+Converting a surface to the pixel format of the display requires the display, which should only be
+accessed from the main thread.
+When a component is built while the display is not available (in a worker thread or before
+pygame.display.set_mode), its images are kept in a display-independent format with per-pixel alpha,
+and the conversion is deferred to its finalize method.
+Images decoding, fonts rendering and layout computation can then be done in a worker thread,
+only the cheap finalization being left to the main thread:
+
+    menu = InfoBox(...)  # in a worker thread
+    menu.init_render(screen)  # optional, also in the worker thread
+    menu.finalize()  # in the main thread, done by MenuManager.open_menu
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+import pygame
+from pygame.constants import SRCALPHA
+
+
+def is_display_available() -> bool:
+    """
+    Returns:
+        bool: whether surfaces can be converted to the pixel format of the display,
+        which requires to be on the main thread and the display mode to be set.
+    """
+    return (
+        threading.current_thread() is threading.main_thread()
+        and pygame.display.get_surface() is not None
+    )
+
+
+def _convert_alpha(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Convert the given surface to the pixel format of the display with per-pixel alpha if the display is available,
+    or to a display-independent format with per-pixel alpha otherwise.
+
+    Returns:
+        pygame.Surface: the converted surface, it may be the given one if no conversion is needed.
+
+    Keyword arguments:
+        surface (pygame.Surface): the surface to be converted
+    """
+    if is_display_available():
+        return surface.convert_alpha()
+    if surface.get_flags() & SRCALPHA:
+        return surface
+    converted_surface = pygame.Surface(surface.get_size(), SRCALPHA)
+    converted_surface.blit(surface, (0, 0))
+    return converted_surface
+
+
+def _finalize_surface(surface: Optional[pygame.Surface]) -> Optional[pygame.Surface]:
+    """
+    Convert a surface built while the display was not available to the pixel format of the display.
+
+    Returns:
+        Optional[pygame.Surface]: the converted surface, None if no surface is given.
+
+    Keyword arguments:
+        surface (Optional[pygame.Surface]): the surface to be converted
+    """
+    if surface is None:
+        return None
+    return surface.convert_alpha()
@@ -4,9 +4,26 @@ The init_fonts function should be called at the beginning of the application
 after pygame initialization.
 """
 
+import hashlib
+import weakref
+from typing import Any
+
 import pygame
 
 from .configuration import _default_fonts_description, _default_fonts
+from .sprite_cache import _get_file_signature
+
+FINGERPRINT_TEXT = "Aa0@"
+
+# Signature of the source of each font: its file and the size it has been loaded with,
+# or a fingerprint of its glyphs if it has been created by the game
+_font_sources: weakref.WeakKeyDictionary[pygame.font.Font, str] = (
+    weakref.WeakKeyDictionary()
+)
+# Description each font has been loaded from, so that it can be loaded again with another style
+_font_descriptions: weakref.WeakKeyDictionary[pygame.font.Font, dict[str, Any]] = (
+    weakref.WeakKeyDictionary()
+)
 
 
 def _init() -> None:
@@ -16,11 +33,57 @@ def _init() -> None:
     These fonts will be available in all modules by importing the fonts dictionary.
     """
     for font_name, font in _default_fonts_description.items():
-        if font["is_system_font"]:
-            # Use pygame's default font
-            is_bold = font["is_bold"] if "is_bold" in font else False
-            _default_fonts[font_name] = pygame.font.SysFont(
-                "arial", font["size"], is_bold
-            )
-        else:
-            _default_fonts[font_name] = pygame.font.Font(font["name"], font["size"])
+        _default_fonts[font_name] = _load_font(font)
+
+
+def _load_font(font_description: dict[str, Any]) -> pygame.font.Font:
+    """
+    Load the font matching the given description.
+
+    Returns:
+        pygame.font.Font: the loaded font.
+
+    Keyword arguments:
+        font_description (dict[str, Any]): the description of the font, containing its size, whether it is a system
+            font or not, its name if it is not and optionally whether it is bold
+    """
+    if font_description["is_system_font"]:
+        # Use pygame's default font
+        is_bold = (
+            font_description["is_bold"] if "is_bold" in font_description else False
+        )
+        font = pygame.font.SysFont("arial", font_description["size"], is_bold)
+        path = pygame.font.match_font("arial", is_bold)
+    else:
+        font = pygame.font.Font(font_description["name"], font_description["size"])
+        path = font_description["name"]
+    _font_sources[font] = (
+        f"{_get_file_signature(path) if path else 'default'}|{font_description['size']}"
+    )
+    _font_descriptions[font] = dict(font_description)
+    return font
+
+
+def _get_font_signature(font: pygame.font.Font) -> str:
+    """
+    The font is identified by the file and the size it has been loaded with if it has been loaded by pygamepopup,
+    by a hash of the rendering of a few glyphs otherwise, since pygame does not expose the file of a font.
+
+    Returns:
+        str: a string identifying the given font and its style, suitable to be part of a cache key.
+
+    Keyword arguments:
+        font (pygame.font.Font): the font to be identified
+    """
+    source = _font_sources.get(font)
+    if source is None:
+        rendered_text = font.render(FINGERPRINT_TEXT, True, (255, 255, 255))
+        source = (
+            f"{getattr(font, 'name', '')}|{getattr(font, 'point_size', '')}|"
+            + hashlib.sha256(
+                pygame.image.tobytes(rendered_text, "RGBA")
+                + repr(rendered_text.get_size()).encode("utf-8")
+            ).hexdigest()
+        )
+        _font_sources[font] = source
+    return f"{source}|{font.get_height()}|{font.get_bold()}|{font.get_italic()}"
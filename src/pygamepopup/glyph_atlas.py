@@ -0,0 +1,433 @@
+"""
+Defines GlyphAtlas class, a text renderer composing strings from glyphs rasterized once in an atlas,
+intended for texts changing often such as counters, timers or frame rates.
+
+A GlyphAtlas can be given as font to TextElement and Button, in place of a pygame.font.Font.
+The glyphs are either rendered from a font or loaded from a BMFont file (text format, single page).
+Strings are drawn by blitting parts of the atlas, render_into permitting to draw them on an existing
+surface without creating any new surface.
+Button and multiline TextElement draw their text straight onto their final sprite through render_into.
+Only LiveTextElement changes its text without creating any new surface: the other components render
+a new sprite when their text changes.
+Kerning is not applied between glyphs.
+
+The memory held by all the atlases in use is reported as the "glyph_atlases" shared cache,
+see memory.get_shared_caches_memory_usage.
+"""
+
+from __future__ import annotations
+
+import os
+import shlex
+import string
+import weakref
+from typing import Optional, Sequence
+
+import pygame
+from pygame.constants import BLEND_RGBA_MULT, SRCALPHA
+
+from .configuration import _default_fonts
+from .constants import WHITE
+from .finalization import _convert_alpha
+from .memory import get_surfaces_memory_usage, register_shared_cache
+from .sprite_cache import _load_image
+from .type_definitions import Position
+
+DEFAULT_CHARACTERS = string.ascii_letters + string.digits + string.punctuation + " "
+ATLAS_MAX_WIDTH = 1024
+FALLBACK_CHARACTER = "?"
+
+# Atlases in use, shared by the components they have been given to
+_atlases: weakref.WeakSet[GlyphAtlas] = weakref.WeakSet()
+
+
+class _Glyph:
+    """
+    The location of a glyph in an atlas and the way it should be placed on a line of text.
+
+    Keyword arguments:
+        area (pygame.Rect): the part of the atlas containing the glyph
+        offset (tuple[int, int]): the position of the glyph relatively to the pen position
+        advance (int): the horizontal move of the pen once the glyph has been drawn
+    """
+
+    __slots__ = ("area", "offset", "advance")
+
+    def __init__(
+        self, area: pygame.Rect, offset: tuple[int, int], advance: int
+    ) -> None:
+        self.area: pygame.Rect = area
+        self.offset: tuple[int, int] = offset
+        self.advance: int = advance
+
+
+class GlyphAtlas:
+    """
+    This class represents a set of glyphs rasterized once in a single surface, following the subset of the
+    pygame.font.Font interface used by the components (render, size, get_height...).
+
+    The glyphs are rasterized in white, the atlas being tinted once for each other color used.
+    Characters missing from the atlas are added to it when they are first used if it has been built from a font,
+    only the new glyphs being rasterized and placed after the others, they are replaced by a question mark otherwise.
+
+    Keyword arguments:
+        font (pygame.font.Font): the font from which the glyphs should be rendered, defaults to the font
+            of the content of text elements
+        characters (str): the characters that should be rasterized up front, defaults to DEFAULT_CHARACTERS
+        antialias (bool): whether the glyphs should be rendered with antialiasing, defaults to True
+
+    Attributes:
+        name (str): the name identifying the atlas, used to distinguish renderings in the sprite cache
+    """
+
+    def __init__(
+        self,
+        font: pygame.font.Font = None,
+        characters: str = DEFAULT_CHARACTERS,
+        antialias: bool = True,
+    ) -> None:
+        if not font:
+            font = _default_fonts["text_element_content"]
+        self.__initialize(
+            font,
+            antialias,
+            {},
+            pygame.Surface((0, 0), SRCALPHA),
+            font.get_height(),
+            f"atlas|{getattr(font, 'name', '')}|{antialias}",
+        )
+        self.__add_characters(characters)
+
+    def __initialize(
+        self,
+        font: Optional[pygame.font.Font],
+        antialias: bool,
+        glyphs: dict[str, _Glyph],
+        atlas: pygame.Surface,
+        height: int,
+        name: str,
+    ) -> None:
+        """
+        Set up the state of the atlas and register it among the atlases in use.
+
+        Keyword arguments:
+            font (Optional[pygame.font.Font]): the font from which missing glyphs should be rendered, None if
+                the glyphs cannot be completed
+            antialias (bool): whether the glyphs are rendered with antialiasing
+            glyphs (dict[str, _Glyph]): the glyphs already present in the atlas
+            atlas (pygame.Surface): the surface containing the glyphs
+            height (int): the height of a line of text
+            name (str): the name identifying the atlas
+        """
+        self.__font: Optional[pygame.font.Font] = font
+        self.__antialias: bool = antialias
+        self.__characters: str = "".join(glyphs)
+        self.__glyphs: dict[str, _Glyph] = glyphs
+        self.__atlas: pygame.Surface = atlas
+        self.__tinted_atlases: dict[tuple[int, int, int, int], pygame.Surface] = {}
+        self.__height: int = height
+        # Position of the next glyph to be packed and height of the current row of glyphs
+        self.__packing_cursor: tuple[int, int, int] = (0, atlas.get_height(), 0)
+        self.name: str = name
+        _atlases.add(self)
+
+    @classmethod
+    def _from_glyphs(
+        cls,
+        glyphs: dict[str, _Glyph],
+        atlas: pygame.Surface,
+        height: int,
+        name: str,
+    ) -> GlyphAtlas:
+        """
+        Build an atlas from already rasterized glyphs, characters missing from it cannot be added.
+
+        Returns:
+            GlyphAtlas: the built atlas.
+
+        Keyword arguments:
+            glyphs (dict[str, _Glyph]): the location of each glyph in the atlas
+            atlas (pygame.Surface): the surface containing the glyphs
+            height (int): the height of a line of text
+            name (str): the name identifying the atlas
+        """
+        glyph_atlas = cls.__new__(cls)
+        glyph_atlas.__initialize(None, True, glyphs, atlas, height, name)
+        return glyph_atlas
+
+    @staticmethod
+    def load_bmfont(path: str) -> GlyphAtlas:
+        """
+        Load an atlas from a BMFont descriptor in text format, the page image being next to it.
+
+        Returns:
+            GlyphAtlas: the loaded atlas.
+
+        Keyword arguments:
+            path (str): the path to the .fnt file
+        """
+        glyphs: dict[str, _Glyph] = {}
+        pages: list[str] = []
+        height = 0
+        with open(path, "r", encoding="utf-8") as descriptor:
+            for line in descriptor:
+                tokens = shlex.split(line)
+                if not tokens:
+                    continue
+                values = dict(token.split("=", 1) for token in tokens[1:])
+                if tokens[0] == "common":
+                    height = int(values["lineHeight"])
+                elif tokens[0] == "page":
+                    pages.append(values["file"])
+                elif tokens[0] == "char":
+                    glyphs[chr(int(values["id"]))] = _Glyph(
+                        pygame.Rect(
+                            int(values["x"]),
+                            int(values["y"]),
+                            int(values["width"]),
+                            int(values["height"]),
+                        ),
+                        (int(values["xoffset"]), int(values["yoffset"])),
+                        int(values["xadvance"]),
+                    )
+        if len(pages) != 1:
+            raise ValueError(
+                f"Only BMFont files with a single page are supported, '{path}' has {len(pages)}"
+            )
+        return GlyphAtlas._from_glyphs(
+            glyphs,
+            _convert_alpha(_load_image(os.path.join(os.path.dirname(path), pages[0]))),
+            height,
+            f"bmfont|{os.path.abspath(path)}",
+        )
+
+    def __add_characters(self, characters: str) -> None:
+        """
+        Rasterize the given characters from the font and pack them after the glyphs already in the atlas,
+        the atlas being enlarged if they don't fit in it.
+
+        Keyword arguments:
+            characters (str): the characters to be added
+        """
+        new_characters = "".join(
+            dict.fromkeys(
+                character for character in characters if character not in self.__glyphs
+            )
+        )
+        if not new_characters:
+            return
+        self.__characters += new_characters
+        rendered_glyphs = [
+            self.__font.render(character, self.__antialias, WHITE)
+            for character in new_characters
+        ]
+        areas = self.__pack(
+            [rendered_glyph.get_size() for rendered_glyph in rendered_glyphs]
+        )
+        atlas_size = (
+            max(self.__atlas.get_width(), *(area.right for area in areas)),
+            max(self.__atlas.get_height(), *(area.bottom for area in areas)),
+        )
+        atlas = self.__atlas
+        if atlas_size != atlas.get_size():
+            atlas = pygame.Surface(atlas_size, SRCALPHA)
+            atlas.blit(self.__atlas, (0, 0))
+        for character, rendered_glyph, area in zip(
+            new_characters, rendered_glyphs, areas
+        ):
+            atlas.blit(rendered_glyph, area)
+            self.__glyphs[character] = _Glyph(area, (0, 0), area.width)
+        self.__atlas = _convert_alpha(atlas)
+        self.__tinted_atlases.clear()
+
+    def __pack(self, sizes: Sequence[tuple[int, int]]) -> list[pygame.Rect]:
+        """
+        Place rectangles of the given sizes in rows no wider than ATLAS_MAX_WIDTH, after the rectangles
+        already placed.
+
+        Returns:
+            list[pygame.Rect]: the area of each rectangle, in the same order as the sizes.
+
+        Keyword arguments:
+            sizes (Sequence[tuple[int, int]]): the sizes of the rectangles
+        """
+        areas = []
+        x_coordinate, y_coordinate, row_height = self.__packing_cursor
+        for width, height in sizes:
+            if x_coordinate + width > ATLAS_MAX_WIDTH and x_coordinate > 0:
+                x_coordinate, y_coordinate = 0, y_coordinate + row_height
+                row_height = 0
+            areas.append(pygame.Rect(x_coordinate, y_coordinate, width, height))
+            x_coordinate += width
+            row_height = max(row_height, height)
+        self.__packing_cursor = (x_coordinate, y_coordinate, row_height)
+        return areas
+
+    def __get_glyphs(self, text: str) -> list[_Glyph]:
+        """
+        Returns:
+            list[_Glyph]: the glyphs to be drawn for the given text, in order.
+
+        Keyword arguments:
+            text (str): the text to be drawn
+        """
+        glyphs = self.__glyphs
+        if self.__font is not None and any(
+            character not in glyphs for character in text
+        ):
+            self.__add_characters(text)
+        fallback_glyph = glyphs.get(FALLBACK_CHARACTER)
+        return [
+            glyph
+            for glyph in (glyphs.get(character, fallback_glyph) for character in text)
+            if glyph is not None
+        ]
+
+    def __get_atlas(self, color: pygame.Color) -> pygame.Surface:
+        """
+        Returns:
+            pygame.Surface: the atlas with its glyphs in the given color, tinted the first time the color is used.
+
+        Keyword arguments:
+            color (pygame.Color): the color of the text
+        """
+        color = tuple(pygame.Color(color))
+        if color == tuple(WHITE):
+            return self.__atlas
+        tinted_atlas = self.__tinted_atlases.get(color)
+        if tinted_atlas is None:
+            tinted_atlas = self.__atlas.copy()
+            tinted_atlas.fill(color, special_flags=BLEND_RGBA_MULT)
+            self.__tinted_atlases[color] = tinted_atlas
+        return tinted_atlas
+
+    def size(self, text: str) -> tuple[int, int]:
+        """
+        Returns:
+            tuple[int, int]: the size that the given text would take once rendered.
+
+        Keyword arguments:
+            text (str): the text to be measured
+        """
+        return (
+            sum(glyph.advance for glyph in self.__get_glyphs(text)),
+            self.__height,
+        )
+
+    def render(
+        self,
+        text: str,
+        antialias: bool = True,
+        color: pygame.Color = WHITE,
+        background: Optional[pygame.Color] = None,
+    ) -> pygame.Surface:
+        """
+        Render the given text on a new surface, as pygame.font.Font.render does.
+
+        Returns:
+            pygame.Surface: the rendered text.
+
+        Keyword arguments:
+            text (str): the text to be rendered
+            antialias (bool): ignored, the antialiasing being chosen when the glyphs are rasterized
+            color (pygame.Color): the color of the text, defaults to WHITE
+            background (Optional[pygame.Color]): the color filling the surface behind the text, transparent by default
+        """
+        rendered_text = pygame.Surface(self.size(text), SRCALPHA)
+        if background is not None:
+            rendered_text.fill(background)
+        self.render_into(rendered_text, text, (0, 0), color)
+        return rendered_text
+
+    def render_into(
+        self,
+        target: pygame.Surface,
+        text: str,
+        position: Position,
+        color: pygame.Color = WHITE,
+    ) -> pygame.Rect:
+        """
+        Draw the given text on an existing surface, without creating any new surface once the color
+        has already been used.
+
+        Returns:
+            pygame.Rect: the area of the target covered by the text.
+
+        Keyword arguments:
+            target (pygame.Surface): the surface on which the text should be drawn
+            text (str): the text to be drawn
+            position (Position): the position of the top left corner of the text on the target
+            color (pygame.Color): the color of the text, defaults to WHITE
+        """
+        atlas = self.__get_atlas(color)
+        x_coordinate, y_coordinate = int(position[0]), int(position[1])
+        pen_position = x_coordinate
+        blit_sequence = []
+        for glyph in self.__get_glyphs(text):
+            blit_sequence.append(
+                (
+                    atlas,
+                    (pen_position + glyph.offset[0], y_coordinate + glyph.offset[1]),
+                    glyph.area,
+                )
+            )
+            pen_position += glyph.advance
+        target.blits(blit_sequence, doreturn=False)
+        return pygame.Rect(
+            x_coordinate, y_coordinate, pen_position - x_coordinate, self.__height
+        )
+
+    def get_height(self) -> int:
+        """
+        Returns:
+            int: the height of a line of text.
+        """
+        return self.__height
+
+    def get_linesize(self) -> int:
+        """
+        Returns:
+            int: the height of a line of text.
+        """
+        return self.__height
+
+    def get_bold(self) -> bool:
+        """
+        Returns:
+            bool: whether the glyphs have been rendered from a bold font.
+        """
+        return self.__font is not None and self.__font.get_bold()
+
+    def get_italic(self) -> bool:
+        """
+        Returns:
+            bool: whether the glyphs have been rendered from an italic font.
+        """
+        return self.__font is not None and self.__font.get_italic()
+
+    def get_characters(self) -> str:
+        """
+        Returns:
+            str: the characters currently present in the atlas.
+        """
+        return self.__characters
+
+    def get_memory_usage(self) -> int:
+        """
+        Returns:
+            int: the number of bytes taken by the atlas and its tinted copies.
+        """
+        return get_surfaces_memory_usage(
+            [self.__atlas, *self.__tinted_atlases.values()]
+        )
+
+
+def _get_atlases_memory_usage() -> int:
+    """
+    Returns:
+        int: the number of bytes taken by all the atlases in use and their tinted copies.
+    """
+    return sum(atlas.get_memory_usage() for atlas in list(_atlases))
+
+
+register_shared_cache("glyph_atlases", _get_atlases_memory_usage)
@@ -0,0 +1,181 @@
+"""
+Defines the instrumentation of pygamepopup, measuring the duration of its costly operations
+(rendering initialization, text wrapping, display of menus...).
+
+Instrumentation is disabled by default and has a negligible cost until enable is called.
+Measures are kept by name and can also be forwarded to listeners, for example to export them
+to an external profiling tool.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Any, Callable, Optional, Sequence
+
+Listener = Callable[[str, float, float, dict[str, Any]], None]
+"""Function called for each measure with its name, start time, duration (in seconds) and arguments"""
+
+_enabled: bool = False
+_timings: dict[str, list[float]] = {}
+_listeners: list[Listener] = []
+
+
+class _Measure:
+    """
+    Context manager measuring the duration of the operation it surrounds.
+
+    Keyword arguments:
+        name (str): the name of the measured operation
+        arguments (dict[str, Any]): the details about the operation that should be given to listeners
+    """
+
+    __slots__ = ("name", "arguments", "start")
+
+    def __init__(self, name: str, arguments: dict[str, Any]) -> None:
+        self.name: str = name
+        self.arguments: dict[str, Any] = arguments
+        self.start: float = 0
+
+    def __enter__(self) -> _Measure:
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        record(self.name, self.start, time.perf_counter() - self.start, self.arguments)
+
+
+class _NoMeasure:
+    """
+    Context manager doing nothing, used when instrumentation is disabled.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exception_info) -> None:
+        return None
+
+
+_NO_MEASURE = _NoMeasure()
+
+
+def enable() -> None:
+    """
+    Start measuring the operations of pygamepopup.
+    """
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """
+    Stop measuring the operations of pygamepopup, already recorded measures are kept.
+    """
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """
+    Returns:
+        bool: whether the operations of pygamepopup are currently measured.
+    """
+    return _enabled
+
+
+def measure(name: str, **arguments: Any) -> _Measure | _NoMeasure:
+    """
+    Measure the duration of the operation surrounded by the returned context manager,
+    if instrumentation is enabled.
+
+    Returns:
+        _Measure | _NoMeasure: the context manager to be used in a with statement.
+
+    Keyword arguments:
+        name (str): the name of the measured operation
+        arguments (Any): the details about the operation that should be given to listeners
+    """
+    if not _enabled:
+        return _NO_MEASURE
+    return _Measure(name, arguments)
+
+
+def record(
+    name: str, start: float, duration: float, arguments: Optional[dict] = None
+) -> None:
+    """
+    Record the duration of an operation measured by other means, if instrumentation is enabled.
+
+    Keyword arguments:
+        name (str): the name of the measured operation
+        start (float): the moment the operation started, in seconds as given by time.perf_counter
+        duration (float): the duration of the operation in seconds
+        arguments (Optional[dict]): the details about the operation that should be given to listeners
+    """
+    if not _enabled:
+        return
+    _timings.setdefault(name, []).append(duration)
+    for listener in _listeners:
+        listener(name, start, duration, arguments or {})
+
+
+def get_timings() -> dict[str, list[float]]:
+    """
+    Returns:
+        dict[str, list[float]]: all the recorded durations in seconds, by operation name.
+    """
+    return _timings
+
+
+def reset() -> None:
+    """
+    Forget all the recorded durations.
+    """
+    _timings.clear()
+
+
+def add_listener(listener: Listener) -> None:
+    """
+    Register a function to be called for each new measure.
+
+    Keyword arguments:
+        listener (Listener): the function to be called
+    """
+    _listeners.append(listener)
+
+
+def remove_listener(listener: Listener) -> None:
+    """
+    Stop calling the given function for new measures.
+
+    Keyword arguments:
+        listener (Listener): the function that was registered
+    """
+    _listeners.remove(listener)
+
+
+def compute_percentiles(
+    values: Sequence[float], percentiles: Sequence[float] = (50, 95, 99)
+) -> dict[str, float]:
+    """
+    Compute percentiles of the given values with the nearest-rank method.
+
+    Returns:
+        dict[str, float]: the value of each percentile, keyed by names such as "p50", empty if there is no value.
+
+    Keyword arguments:
+        values (Sequence[float]): the values, for example durations
+        percentiles (Sequence[float]): the percentiles to be computed, defaults to (50, 95, 99)
+    """
+    if not values:
+        return {}
+    sorted_values = sorted(values)
+    return {
+        f"p{percentile:g}": sorted_values[
+            max(0, math.ceil(percentile / 100 * len(sorted_values)) - 1)
+        ]
+        for percentile in percentiles
+    }
@@ -0,0 +1,587 @@
+"""
+Defines the computation of the layout of the element grid of an InfoBox.
+
+The sizes, column spans and margins of all the elements are gathered in flat sequences,
+and the column widths, row heights and positions are computed in bulk from them.
+When NumPy is installed, grids having many elements are computed with arrays instead of Python loops.
+
+By default, the width of the InfoBox is split evenly between the elements of each row.
+A GridLayout can be given instead to follow column definitions with fixed, automatic or fractional widths.
+"""
+
+from __future__ import annotations
+
+from itertools import accumulate
+from typing import Any, Optional, Sequence, Union
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - depends on the environment
+    numpy = None
+
+VECTORIZATION_THRESHOLD = 256
+"""Number of elements from which the layout is computed with NumPy, if it is installed"""
+
+
+class GridMetrics:
+    """
+    This class is gathering the metrics of the elements of a grid in flat sequences, row after row.
+
+    Keyword arguments:
+        row_lengths (Sequence[int]): the number of elements in each row
+        column_spans (Sequence[int]): the number of columns spanned by each element
+        widths (Sequence[int]): the width of each element, margins included
+        heights (Sequence[int]): the height of each element, margins included
+        margins_top (Sequence[int]): the top margin of each element
+        margins_horizontal (Sequence[int]): the sum of the left and right margins of each element
+
+    Attributes:
+        row_lengths (Sequence[int]): the number of elements in each row
+        column_spans (Sequence[int]): the number of columns spanned by each element
+        widths (Sequence[int]): the width of each element, margins included
+        heights (Sequence[int]): the height of each element, margins included
+        margins_top (Sequence[int]): the top margin of each element
+        margins_horizontal (Sequence[int]): the sum of the left and right margins of each element
+    """
+
+    def __init__(
+        self,
+        row_lengths: Sequence[int],
+        column_spans: Sequence[int],
+        widths: Sequence[int] = (),
+        heights: Sequence[int] = (),
+        margins_top: Sequence[int] = (),
+        margins_horizontal: Sequence[int] = (),
+    ) -> None:
+        self.row_lengths: Sequence[int] = row_lengths
+        self.column_spans: Sequence[int] = column_spans
+        self.widths: Sequence[int] = widths
+        self.heights: Sequence[int] = heights
+        self.margins_top: Sequence[int] = margins_top
+        self.margins_horizontal: Sequence[int] = margins_horizontal
+
+    def __len__(self) -> int:
+        return len(self.column_spans)
+
+
+def is_vectorization_available() -> bool:
+    """
+    Returns:
+        bool: whether NumPy is installed and can be used to compute large layouts.
+    """
+    return numpy is not None
+
+
+def _should_vectorize(metrics: GridMetrics, vectorize: Optional[bool]) -> bool:
+    """
+    Returns:
+        bool: whether the layout of the given grid should be computed with NumPy.
+
+    Keyword arguments:
+        metrics (GridMetrics): the metrics of the elements of the grid
+        vectorize (Optional[bool]): the choice of the caller, decided according to the size of the grid if None
+    """
+    if numpy is None:
+        return False
+    if vectorize is None:
+        return len(metrics) >= VECTORIZATION_THRESHOLD
+    return vectorize
+
+
+def compute_text_container_widths(
+    metrics: GridMetrics, inner_width: int, vectorize: Optional[bool] = None
+) -> list[int]:
+    """
+    Compute the width available for the content of each element, the width being split evenly
+    between the columns of each row.
+
+    Returns:
+        list[int]: the available width of each element.
+
+    Keyword arguments:
+        metrics (GridMetrics): the metrics of the elements of the grid, widths and heights are not needed
+        inner_width (int): the width available for the elements of a row
+        vectorize (Optional[bool]): whether NumPy should be used, decided according to the size of the grid by default
+    """
+    if _should_vectorize(metrics, vectorize):
+        return _compute_text_container_widths_vectorized(metrics, inner_width)
+    container_widths: list[int] = []
+    element_index = 0
+    for row_length in metrics.row_lengths:
+        row_spans = metrics.column_spans[element_index : element_index + row_length]
+        column_width = inner_width // sum(row_spans) if row_length else 0
+        for column_span, margin in zip(
+            row_spans,
+            metrics.margins_horizontal[element_index : element_index + row_length],
+        ):
+            container_widths.append(column_width * column_span - margin)
+        element_index += row_length
+    return container_widths
+
+
+def compute_grid_layout(
+    metrics: GridMetrics,
+    width: int,
+    row_spacing: int,
+    padding: int,
+    vectorize: Optional[bool] = None,
+) -> tuple[list[int], list[tuple[int, int]], int]:
+    """
+    Compute the height of each row and the offset of each element relatively to the top left corner of the grid.
+
+    The width is split evenly between the columns of each row and each element is horizontally centered in the
+    columns it spans.
+    Each row is as high as its highest element plus the row spacing.
+
+    Returns:
+        tuple[list[int], list[tuple[int, int]], int]: the height of each row, the offset of each element
+        and the total height of the grid.
+
+    Keyword arguments:
+        metrics (GridMetrics): the metrics of the elements of the grid
+        width (int): the width of the grid
+        row_spacing (int): the space added above the highest element of each row
+        padding (int): the space at the top and the bottom of the grid
+        vectorize (Optional[bool]): whether NumPy should be used, decided according to the size of the grid by default
+    """
+    if _should_vectorize(metrics, vectorize):
+        return _compute_grid_layout_vectorized(metrics, width, row_spacing, padding)
+    row_heights: list[int] = []
+    offsets: list[tuple[int, int]] = []
+    y_coordinate = padding
+    element_index = 0
+    for row_length in metrics.row_lengths:
+        row_end = element_index + row_length
+        row_spans = metrics.column_spans[element_index:row_end]
+        half_column_width = width // (2 * sum(row_spans)) if row_length else 0
+        for previous_span, column_span, element_width, margin_top in zip(
+            accumulate(row_spans, initial=0),
+            row_spans,
+            metrics.widths[element_index:row_end],
+            metrics.margins_top[element_index:row_end],
+        ):
+            offsets.append(
+                (
+                    half_column_width * (2 * previous_span + column_span)
+                    - element_width // 2,
+                    y_coordinate + margin_top,
+                )
+            )
+        row_height = max(
+            (height + row_spacing for height in metrics.heights[element_index:row_end]),
+            default=0,
+        )
+        row_heights.append(row_height)
+        y_coordinate += row_height
+        element_index = row_end
+    return row_heights, offsets, y_coordinate + padding
+
+
+def _get_row_indices_and_spans(metrics: GridMetrics) -> tuple[Any, Any, Any]:
+    """
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: the row of each element, the column spans of the elements
+        and the total number of columns of each row.
+
+    Keyword arguments:
+        metrics (GridMetrics): the metrics of the elements of the grid
+    """
+    row_lengths = numpy.asarray(metrics.row_lengths, dtype=numpy.int64)
+    row_indices = numpy.repeat(numpy.arange(len(row_lengths)), row_lengths)
+    column_spans = numpy.asarray(metrics.column_spans, dtype=numpy.int64)
+    row_columns = numpy.bincount(
+        row_indices, weights=column_spans, minlength=len(row_lengths)
+    ).astype(numpy.int64)
+    return row_indices, column_spans, row_columns
+
+
+def _compute_text_container_widths_vectorized(
+    metrics: GridMetrics, inner_width: int
+) -> list[int]:
+    """
+    Array-based implementation of compute_text_container_widths.
+
+    Returns:
+        list[int]: the available width of each element.
+
+    Keyword arguments:
+        metrics (GridMetrics): the metrics of the elements of the grid
+        inner_width (int): the width available for the elements of a row
+    """
+    row_indices, column_spans, row_columns = _get_row_indices_and_spans(metrics)
+    column_widths = inner_width // numpy.maximum(row_columns, 1)
+    return (
+        column_widths[row_indices] * column_spans
+        - numpy.asarray(metrics.margins_horizontal, dtype=numpy.int64)
+    ).tolist()
+
+
+def _compute_grid_layout_vectorized(
+    metrics: GridMetrics, width: int, row_spacing: int, padding: int
+) -> tuple[list[int], list[tuple[int, int]], int]:
+    """
+    Array-based implementation of compute_grid_layout.
+
+    Returns:
+        tuple[list[int], list[tuple[int, int]], int]: the height of each row, the offset of each element
+        and the total height of the grid.
+
+    Keyword arguments:
+        metrics (GridMetrics): the metrics of the elements of the grid
+        width (int): the width of the grid
+        row_spacing (int): the space added above the highest element of each row
+        padding (int): the space at the top and the bottom of the grid
+    """
+    row_indices, column_spans, row_columns = _get_row_indices_and_spans(metrics)
+    half_column_widths = width // (2 * numpy.maximum(row_columns, 1))
+
+    # Number of columns spanned by the previous elements of the same row
+    cumulated_spans = numpy.cumsum(column_spans) - column_spans
+    row_first_spans = numpy.cumsum(row_columns) - row_columns
+    previous_spans = cumulated_spans - row_first_spans[row_indices]
+
+    row_heights = numpy.zeros(len(row_columns), dtype=numpy.int64)
+    numpy.maximum.at(
+        row_heights,
+        row_indices,
+        numpy.asarray(metrics.heights, dtype=numpy.int64) + row_spacing,
+    )
+    row_y_coordinates = padding + numpy.cumsum(row_heights) - row_heights
+
+    x_coordinates = (
+        half_column_widths[row_indices] * (2 * previous_spans + column_spans)
+        - numpy.asarray(metrics.widths, dtype=numpy.int64) // 2
+    )
+    y_coordinates = row_y_coordinates[row_indices] + numpy.asarray(
+        metrics.margins_top, dtype=numpy.int64
+    )
+    return (
+        row_heights.tolist(),
+        list(zip(x_coordinates.tolist(), y_coordinates.tolist())),
+        int(row_heights.sum()) + 2 * padding,
+    )
+
+
+_ALIGNMENT_FACTORS: dict[str, float] = {"left": 0, "center": 0.5, "right": 1}
+
+
+class Column:
+    """
+    This class is defining a column of a GridLayout.
+
+    Keyword arguments:
+        width (Union[int, str]): the width of the column, either a number of pixels, "auto" to be as wide as
+            the widest element occupying only this column, or a fraction of the remaining width such as "1fr"
+            or "2fr", defaults to "1fr"
+        alignment (str): the horizontal alignment of the elements in the column, "left", "center" or "right",
+            defaults to "center"
+
+    Attributes:
+        width (Union[int, str]): the width of the column
+        alignment (str): the horizontal alignment of the elements in the column
+    """
+
+    def __init__(self, width: Union[int, str] = "1fr", alignment: str = "center"):
+        if not isinstance(width, int) and width != "auto" and not _is_fraction(width):
+            raise ValueError(f"Invalid column width '{width}'")
+        if alignment not in _ALIGNMENT_FACTORS:
+            raise ValueError(f"Invalid column alignment '{alignment}'")
+        self.width: Union[int, str] = width
+        self.alignment: str = alignment
+
+    def __repr__(self):
+        return f"Column({self.width!r}, {self.alignment!r})"
+
+
+def _is_fraction(width: Any) -> bool:
+    """
+    Returns:
+        bool: whether the given column width is a fraction of the remaining width, such as "2fr".
+
+    Keyword arguments:
+        width (Any): the column width
+    """
+    if not isinstance(width, str) or not width.endswith("fr"):
+        return False
+    try:
+        return float(width[:-2]) > 0
+    except ValueError:
+        return False
+
+
+class GridLayout:
+    """
+    This class is defining a layout of the element grid of an InfoBox following column definitions,
+    instead of splitting the width evenly between the elements of each row.
+
+    Each element takes the next columns of its row according to its column span,
+    rows can have fewer columns than defined.
+    The widths of the columns are computed once per available width and column spacing and kept in cache.
+    A single instance can be given to several InfoBox: automatic widths are then measured on the elements
+    of all of them so that their columns are aligned.
+    Texts in a column having an automatic width are wrapped to the widest the column could be,
+    and measured once wrapped.
+
+    Keyword arguments:
+        columns (Sequence[Union[Column, int, str]]): the columns in order, a width can be given instead of a
+            Column to use the default alignment
+        column_spacing (int): the space between two columns, defaults to 0
+
+    Attributes:
+        columns (list[Column]): the columns in order
+        column_spacing (int): the space between two columns
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[Union[Column, int, str]],
+        column_spacing: int = 0,
+    ) -> None:
+        if not columns:
+            raise ValueError("A grid layout should have at least one column")
+        self.columns: list[Column] = [
+            column if isinstance(column, Column) else Column(column)
+            for column in columns
+        ]
+        self.column_spacing: int = column_spacing
+        self.__measured_widths: list[int] = [0] * len(self.columns)
+        self.__column_widths_cache: dict[tuple[int, int], list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __get_columns_indices(self, metrics: GridMetrics) -> list[int]:
+        """
+        Returns:
+            list[int]: the index of the first column taken by each element.
+
+        Keyword arguments:
+            metrics (GridMetrics): the metrics of the elements of the grid
+        """
+        first_columns: list[int] = []
+        element_index = 0
+        for row_length in metrics.row_lengths:
+            row_spans = metrics.column_spans[element_index : element_index + row_length]
+            if sum(row_spans) > len(self.columns):
+                raise ValueError(
+                    f"A row spans {sum(row_spans)} columns but the layout only has {len(self.columns)}"
+                )
+            if row_length:
+                first_columns.extend(accumulate(row_spans[:-1], initial=0))
+            element_index += row_length
+        return first_columns
+
+    def measure(self, metrics: GridMetrics) -> None:
+        """
+        Take into account the widths of the given elements for the columns having an automatic width.
+
+        Texts should already be wrapped to the widths given by compute_text_container_widths.
+
+        Keyword arguments:
+            metrics (GridMetrics): the metrics of the elements of a grid laid out with this layout
+        """
+        has_changed = False
+        for first_column, column_span, width in zip(
+            self.__get_columns_indices(metrics), metrics.column_spans, metrics.widths
+        ):
+            if (
+                column_span == 1
+                and self.columns[first_column].width == "auto"
+                and width > self.__measured_widths[first_column]
+            ):
+                self.__measured_widths[first_column] = width
+                has_changed = True
+        if has_changed:
+            self.__column_widths_cache.clear()
+
+    def compute_column_widths(self, available_width: int) -> list[int]:
+        """
+        Compute the width of each column, fixed and automatic widths being subtracted from the available width
+        before sharing what remains between fractional columns.
+
+        Returns:
+            list[int]: the width of each column.
+
+        Keyword arguments:
+            available_width (int): the width available for all the columns and the spaces between them
+        """
+        cache_key = (available_width, self.column_spacing)
+        if cache_key in self.__column_widths_cache:
+            return self.__column_widths_cache[cache_key]
+        column_widths = [
+            (
+                column.width
+                if isinstance(column.width, int)
+                else measured_width if column.width == "auto" else 0
+            )
+            for column, measured_width in zip(self.columns, self.__measured_widths)
+        ]
+        remaining_width = max(
+            0,
+            available_width
+            - sum(column_widths)
+            - self.column_spacing * (len(self.columns) - 1),
+        )
+        fractions = [
+            float(column.width[:-2]) if _is_fraction(column.width) else 0
+            for column in self.columns
+        ]
+        total_fractions = sum(fractions)
+        if total_fractions:
+            for index, fraction in enumerate(fractions):
+                if fraction:
+                    column_widths[index] = int(
+                        remaining_width * fraction / total_fractions
+                    )
+        self.__column_widths_cache[cache_key] = column_widths
+        return column_widths
+
+    def __compute_automatic_width_limit(
+        self, column_index: int, available_width: int
+    ) -> int:
+        """
+        Returns:
+            int: the widest the given column having an automatic width could be, once the fixed widths,
+            the widths measured for the other automatic columns and the spaces between columns are subtracted.
+
+        Keyword arguments:
+            column_index (int): the index of the column
+            available_width (int): the width available for all the columns and the spaces between them
+        """
+        other_widths = sum(
+            (
+                column.width
+                if isinstance(column.width, int)
+                else measured_width if column.width == "auto" else 0
+            )
+            for index, (column, measured_width) in enumerate(
+                zip(self.columns, self.__measured_widths)
+            )
+            if index != column_index
+        )
+        return max(
+            0,
+            available_width
+            - other_widths
+            - self.column_spacing * (len(self.columns) - 1),
+        )
+
+    def __compute_cells(
+        self, metrics: GridMetrics, available_width: int, horizontal_padding: int
+    ) -> list[tuple[int, int]]:
+        """
+        Returns:
+            list[tuple[int, int]]: the horizontal position and the width of the cell of each element.
+
+        Keyword arguments:
+            metrics (GridMetrics): the metrics of the elements of the grid
+            available_width (int): the width available for all the columns
+            horizontal_padding (int): the space at the left and the right of the grid
+        """
+        column_widths = self.compute_column_widths(available_width)
+        column_positions = list(
+            accumulate(
+                (width + self.column_spacing for width in column_widths[:-1]),
+                initial=horizontal_padding,
+            )
+        )
+        cells: list[tuple[int, int]] = []
+        for first_column, column_span in zip(
+            self.__get_columns_indices(metrics), metrics.column_spans
+        ):
+            last_column = first_column + column_span - 1
+            cells.append(
+                (
+                    column_positions[first_column],
+                    column_positions[last_column]
+                    + column_widths[last_column]
+                    - column_positions[first_column],
+                )
+            )
+        return cells
+
+    def compute_text_container_widths(
+        self, metrics: GridMetrics, width: int, horizontal_padding: int
+    ) -> list[int]:
+        """
+        Compute the width available for the content of each element.
+
+        An element occupying only a column having an automatic width can take the widest the column could be,
+        instead of the width measured so far.
+
+        Returns:
+            list[int]: the available width of each element.
+
+        Keyword arguments:
+            metrics (GridMetrics): the metrics of the elements of the grid, heights are not needed
+            width (int): the width of the grid
+            horizontal_padding (int): the space at the left and the right of the grid
+        """
+        available_width = width - 2 * horizontal_padding
+        container_widths: list[int] = []
+        for (_, cell_width), first_column, column_span, margin in zip(
+            self.__compute_cells(metrics, available_width, horizontal_padding),
+            self.__get_columns_indices(metrics),
+            metrics.column_spans,
+            metrics.margins_horizontal,
+        ):
+            if column_span == 1 and self.columns[first_column].width == "auto":
+                cell_width = self.__compute_automatic_width_limit(
+                    first_column, available_width
+                )
+            container_widths.append(cell_width - margin)
+        return container_widths
+
+    def compute(
+        self,
+        metrics: GridMetrics,
+        width: int,
+        row_spacing: int,
+        padding: int,
+        horizontal_padding: int,
+    ) -> tuple[list[int], list[tuple[int, int]], int]:
+        """
+        Compute in a single pass the height of each row and the offset of each element relatively to
+        the top left corner of the grid.
+
+        Each element is aligned in its cell according to the alignment of its first column.
+        Each row is as high as its highest element plus the row spacing.
+
+        Returns:
+            tuple[list[int], list[tuple[int, int]], int]: the height of each row, the offset of each element
+            and the total height of the grid.
+
+        Keyword arguments:
+            metrics (GridMetrics): the metrics of the elements of the grid
+            width (int): the width of the grid
+            row_spacing (int): the space added above the highest element of each row
+            padding (int): the space at the top and the bottom of the grid
+            horizontal_padding (int): the space at the left and the right of the grid
+        """
+        cells = self.__compute_cells(
+            metrics, width - 2 * horizontal_padding, horizontal_padding
+        )
+        first_columns = self.__get_columns_indices(metrics)
+        row_heights: list[int] = []
+        offsets: list[tuple[int, int]] = []
+        y_coordinate = padding
+        element_index = 0
+        for row_length in metrics.row_lengths:
+            row_height = 0
+            for index in range(element_index, element_index + row_length):
+                cell_x, cell_width = cells[index]
+                alignment_factor = _ALIGNMENT_FACTORS[
+                    self.columns[first_columns[index]].alignment
+                ]
+                offsets.append(
+                    (
+                        cell_x
+                        + int((cell_width - metrics.widths[index]) * alignment_factor),
+                        y_coordinate + metrics.margins_top[index],
+                    )
+                )
+                row_height = max(row_height, metrics.heights[index] + row_spacing)
+            row_heights.append(row_height)
+            y_coordinate += row_height
+            element_index += row_length
+        return row_heights, offsets, y_coordinate + padding
@@ -0,0 +1,63 @@
+"""
+Defines utilities to account for the memory held by the surfaces rendered by pygamepopup.
+
+Caches shared by many components register themselves to be part of the report
+given by get_shared_caches_memory_usage, such as the glyph atlases ("glyph_atlases").
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable, Optional
+
+import pygame
+
+_shared_caches: dict[str, Callable[[], int]] = {}
+
+
+def get_surface_memory_usage(surface: Optional[pygame.Surface]) -> int:
+    """
+    Returns:
+        int: the number of bytes taken by the pixels of the given surface, 0 if there is no surface.
+
+    Keyword arguments:
+        surface (Optional[pygame.Surface]): the surface to be measured
+    """
+    if surface is None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+
+def get_surfaces_memory_usage(surfaces: Iterable[Optional[pygame.Surface]]) -> int:
+    """
+    Returns:
+        int: the number of bytes taken by the pixels of the given surfaces, each surface being counted
+        only once even if it is present many times.
+
+    Keyword arguments:
+        surfaces (Iterable[Optional[pygame.Surface]]): the surfaces to be measured
+    """
+    unique_surfaces = {id(surface): surface for surface in surfaces if surface}
+    return sum(
+        get_surface_memory_usage(surface) for surface in unique_surfaces.values()
+    )
+
+
+def register_shared_cache(name: str, get_memory_usage: Callable[[], int]) -> None:
+    """
+    Register a cache shared by many components to be part of the memory report.
+
+    Keyword arguments:
+        name (str): the name identifying the cache in the report
+        get_memory_usage (Callable[[], int]): the function returning the number of bytes held by the cache
+    """
+    _shared_caches[name] = get_memory_usage
+
+
+def get_shared_caches_memory_usage() -> dict[str, int]:
+    """
+    Returns:
+        dict[str, int]: the number of bytes held by each registered shared cache, by name.
+    """
+    return {
+        name: get_memory_usage() for name, get_memory_usage in _shared_caches.items()
+    }
@@ -5,13 +5,27 @@ handle the triggering of user events on the elements of the active menu
 
 from __future__ import annotations
 
-from typing import Optional, Sequence
+import asyncio
+import concurrent.futures
+import inspect
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional, Sequence, Union, TYPE_CHECKING
 
 import pygame
 
+from .components.button import Button
 from .components.info_box import InfoBox
+from . import instrumentation
+from .instrumentation import compute_percentiles
+from .culling import CullingStatistics, is_occluded
+from .render_backends import Blit, RenderBackend, blits
+from .scaling import ScaledScreen, ScalingMode
 from .type_definitions import Position
 
+if TYPE_CHECKING:
+    from .recording import InputRecorder
+
 
 class MenuManager:
     """
@@ -23,20 +37,97 @@ class MenuManager:
     Handle the triggering of user motion events and user click events on the active menu.
 
     Keyword arguments:
-        screen (pygame.Surface): the screen on which the menus should be displayed and on which the
-            user events should be handled
+        screen (Union[pygame.Surface, RenderBackend]): the screen on which the menus should be displayed and on
+            which the user events should be handled, a render backend can be given to draw the menus through
+            something else than a surface
+        memory_budget (Optional[int]): the maximum number of bytes that the surfaces of the menus should take,
+            the regenerable surfaces of the least recently displayed menus are dropped when it is exceeded and
+            rendered again when these menus are displayed, no limit if not provided
+        release_hidden_menus (bool): whether the regenerable surfaces of the menus sent to the background
+            should be dropped if they are not visible on background, they are rendered again when the menu
+            comes back to the foreground, defaults to False
+        event_loop (Optional[asyncio.AbstractEventLoop]): the event loop on which coroutine callbacks should be
+            scheduled, it can be running in another thread or be run by the game loop, the running event loop
+            of the current thread is used if not provided
+        disable_pending_buttons (bool): whether a button should be disabled while the coroutine started by its
+            callback is running, defaults to True
+        action_time_budget (Optional[float]): the maximum duration in seconds that the actions triggered by clicks
+            should take at each frame, the callbacks being queued and run at the next displays instead of
+            immediately, at least one action being run per frame; callbacks are run immediately if not provided
+        track_latency (bool): whether the delay between each click or motion event and the display showing its
+            effect should be measured, defaults to False
+        logical_resolution (Optional[tuple[int, int]]): the resolution at which the menus should be laid out and
+            drawn, the drawing being scaled to fit in the screen and the positions of user events being transformed
+            back to this resolution, the menus are drawn at the resolution of the screen if not provided
+        scaling_mode (ScalingMode): the way the menus drawn at the logical resolution should be scaled,
+            defaults to ScalingMode.INTEGER
+        occlusion_culling (bool): whether the menus and elements entirely hidden by the opaque background of
+            a menu drawn over them should be skipped, defaults to True
 
     Attributes:
-        screen (pygame.Surface): the screen on which the menus should be displayed and on which the
-            user events should be handled
+        screen (Union[pygame.Surface, RenderBackend]): the screen on which the menus should be displayed and on
+            which the user events should be handled
         active_menu (Optional[InfoBox]): the current menu in the foreground, the only one that will react to user events
         background_menus (list[InfoBox]): the ordered sequence of menus that are in the background
+        memory_budget (Optional[int]): the maximum number of bytes that the surfaces of the menus should take
+        release_hidden_menus (bool): whether the regenerable surfaces of the menus sent to the background
+            should be dropped if they are not visible on background
+        event_loop (Optional[asyncio.AbstractEventLoop]): the event loop on which coroutine callbacks are scheduled
+        disable_pending_buttons (bool): whether a button is disabled while the coroutine started by its callback
+            is running
+        action_time_budget (Optional[float]): the maximum duration in seconds that the queued actions should take
+            at each frame
+        input_recorder (Optional[InputRecorder]): the recorder of the inputs given to the manager if any,
+            set by attaching an InputRecorder
+        track_latency (bool): whether the delay between each click or motion event and the display showing its
+            effect is measured
+        scaled_screen (Optional[ScaledScreen]): the surface at the logical resolution on which the menus are drawn
+            before being scaled to the screen, if a logical resolution is given
+        occlusion_culling (bool): whether the menus and elements entirely hidden by the opaque background of
+            a menu drawn over them are skipped
+        culling_statistics (CullingStatistics): the counters of what has not been drawn since the creation
+            of the manager or the last reset of the counters
     """
 
-    def __init__(self, screen: pygame.Surface) -> None:
-        self.screen: pygame.Surface = screen
+    def __init__(
+        self,
+        screen: Union[pygame.Surface, RenderBackend],
+        memory_budget: Optional[int] = None,
+        release_hidden_menus: bool = False,
+        event_loop: Optional[asyncio.AbstractEventLoop] = None,
+        disable_pending_buttons: bool = True,
+        action_time_budget: Optional[float] = None,
+        track_latency: bool = False,
+        logical_resolution: Optional[tuple[int, int]] = None,
+        scaling_mode: ScalingMode = ScalingMode.INTEGER,
+        occlusion_culling: bool = True,
+    ) -> None:
+        self.screen: Union[pygame.Surface, RenderBackend] = screen
         self.active_menu: Optional[InfoBox] = None
         self.background_menus: list[InfoBox] = []
+        self.__is_stack_invalidated: bool = True
+        self.memory_budget: Optional[int] = memory_budget
+        self.release_hidden_menus: bool = release_hidden_menus
+        self.event_loop: Optional[asyncio.AbstractEventLoop] = event_loop
+        self.disable_pending_buttons: bool = disable_pending_buttons
+        self.__pending_callbacks: list[
+            tuple[Union[asyncio.Future, concurrent.futures.Future], Optional[Button]]
+        ] = []
+        self.action_time_budget: Optional[float] = action_time_budget
+        self.__actions: deque[Callable[[], None]] = deque()
+        self.__is_processing_actions: bool = False
+        self.__is_running_stack_change: bool = False
+        self.input_recorder: Optional[InputRecorder] = None
+        self.track_latency: bool = track_latency
+        self.__pending_latencies: list[tuple[float, str]] = []
+        self.__latencies: dict[str, list[float]] = {}
+        self.scaled_screen: Optional[ScaledScreen] = (
+            ScaledScreen(logical_resolution, screen, scaling_mode)
+            if logical_resolution is not None
+            else None
+        )
+        self.occlusion_culling: bool = occlusion_culling
+        self.culling_statistics: CullingStatistics = CullingStatistics()
 
     def open_menu(self, menu: InfoBox) -> None:
         """
@@ -45,13 +136,20 @@ class MenuManager:
 
         Previous active menu is sent to the background.
 
+        If an action time budget is set and the menu is opened by a queued action, the opening is queued
+        as a new action, so that a callback opening several menus spreads their preparation over several frames.
+
         Keyword arguments:
             menu (InfoBox): the popup that should be open
         """
+        if self.__defer_stack_change(lambda: self.open_menu(menu)):
+            return
         self._prepare_menu(menu)
         if self.active_menu:
-            self.background_menus.append(self.active_menu)
+            self._send_to_background(self.active_menu)
         self.active_menu = menu
+        self.__is_stack_invalidated = True
+        self._enforce_memory_budget()
 
     def replace_given_menu(
         self, menu_identifier: str, new_menu: InfoBox, all_occurrences: bool = False
@@ -61,15 +159,23 @@ class MenuManager:
 
         By default, only first occurrence is replaced if many menus in the manager have the given identifier.
 
+        If an action time budget is set and the menu is replaced by a queued action, the replacement is queued
+        as a new action to keep the order of the changes of the menus.
+
         Keyword arguments:
             menu_identifier (str): the identifier of the menu to be replaced
             new_menu (InfoBox): the menu that should replace the given one
             all_occurrences (bool): whether all found occurrences should be replaced or only the first one
 
         Returns:
-             bool: whether the replacement has succeeded or not
+             bool: whether the replacement has succeeded or not, True if it has been queued
         """
+        if self.__defer_stack_change(
+            lambda: self.replace_given_menu(menu_identifier, new_menu, all_occurrences)
+        ):
+            return True
         has_replacement_been_done = False
+        self.__is_stack_invalidated = True
         if self.active_menu and self.active_menu.identifier == menu_identifier:
             self._prepare_menu(new_menu)
             self.active_menu = new_menu
@@ -90,13 +196,22 @@ class MenuManager:
         Close the active menu by 'destroying' it.
 
         Take the next menu in the background to move it to foreground if there is any.
+
+        If an action time budget is set and the menu is closed by a queued action, the closing is queued
+        as a new action to keep the order of the changes of the menus.
         """
+        if self.__defer_stack_change(self.close_active_menu):
+            return
         self.active_menu = (
             self.background_menus.pop() if len(self.background_menus) != 0 else None
         )
+        self.__is_stack_invalidated = True
         if self.active_menu:
+            self.active_menu.rebuild_render_resources()
             # Trigger an irrelevant motion event to refresh the hovering of buttons on the new menu
-            self.active_menu.motion(pygame.Vector2(pygame.mouse.get_pos()))
+            self.active_menu.motion(
+                pygame.Vector2(self.__to_menu_position(pygame.mouse.get_pos()))
+            )
 
     def close_given_menu(
         self, menu_identifier: str, all_occurrences: bool = False
@@ -106,14 +221,22 @@ class MenuManager:
 
         By default, only first occurrence is closed if many menus in the manager have the given identifier.
 
+        If an action time budget is set and the menu is closed by a queued action, the closing is queued
+        as a new action to keep the order of the changes of the menus.
+
         Keyword arguments:
             menu_identifier (str): the identifier of the menu to be closed
             all_occurrences (bool): whether all found occurrences should be closed or only the first one,
                 defaults to False
 
         Returns:
-             bool: whether at least one menu has been closed or not
+             bool: whether at least one menu has been closed or not, True if the closing has been queued
         """
+        if self.__defer_stack_change(
+            lambda: self.close_given_menu(menu_identifier, all_occurrences)
+        ):
+            return True
+        self.__is_stack_invalidated = True
         if self.active_menu and self.active_menu.identifier == menu_identifier:
             self.active_menu = None
             if not all_occurrences:
@@ -131,41 +254,493 @@ class MenuManager:
     def clear_menus(self) -> None:
         """
         Close all the menus (in foreground and in background)
+
+        If an action time budget is set and the menus are closed by a queued action, the closing is queued
+        as a new action to keep the order of the changes of the menus.
         """
+        if self.__defer_stack_change(self.clear_menus):
+            return
         self.active_menu = None
         self.background_menus.clear()
+        self.__is_stack_invalidated = True
 
     def reduce_active_menu(self) -> None:
         """
         Move the active menu to the background.
+
+        If an action time budget is set and the menu is moved by a queued action, the move is queued
+        as a new action to keep the order of the changes of the menus.
         """
+        if self.__defer_stack_change(self.reduce_active_menu):
+            return
         if self.active_menu:
-            self.background_menus.append(self.active_menu)
+            self._send_to_background(self.active_menu)
             self.active_menu = None
+            self.__is_stack_invalidated = True
 
-    def display(self) -> None:
+    def __defer_stack_change(self, change: Callable[[], Any]) -> bool:
         """
-        Display all the visible menus in the background in order first, then display the active menu
+        Queue a change of the menus as a new action if it is made by a queued action and if an action time
+        budget is set, so that all the changes made by an action are run in order, one per action.
+
+        Returns:
+            bool: whether the change has been queued, it should be made immediately otherwise.
+
+        Keyword arguments:
+            change (Callable[[], Any]): the call making the change once it is run as an action
+        """
+        if (
+            self.action_time_budget is None
+            or not self.__is_processing_actions
+            or self.__is_running_stack_change
+        ):
+            return False
+
+        def run_change() -> None:
+            self.__is_running_stack_change = True
+            try:
+                change()
+            finally:
+                self.__is_running_stack_change = False
+
+        self.enqueue_action(run_change)
+        return True
+
+    def resize(self, screen: Union[pygame.Surface, RenderBackend]) -> None:
+        """
+        Handle the resizing of the window, all the menus are moved to fit in the new screen
+        without being rendered again.
+
+        Keyword arguments:
+            screen (Union[pygame.Surface, RenderBackend]): the new screen on which the menus should be displayed
         """
+        self.screen = screen
+        self.__is_stack_invalidated = True
+        if self.scaled_screen is not None:
+            # Menus stay at the logical resolution, only their scaling changes
+            self.scaled_screen.adapt_to_screen(screen)
+            return
         for menu in self.background_menus:
-            if menu.visible_on_background:
-                menu.display(self.screen)
+            menu.adapt_to_screen(screen)
         if self.active_menu:
-            self.active_menu.display(self.screen)
+            self.active_menu.adapt_to_screen(screen)
+
+    def display(self) -> None:
+        """
+        Display all the visible menus in the background in order first, then display the active menu
+
+        Queued actions are run first, within the action time budget, and the live text elements
+        of the visible menus are updated.
+
+        If a logical resolution is set, the menus are only drawn and scaled again if something changed
+        since the last display, the previous scaled drawing being drawn on the screen otherwise.
+        """
+        self.__start_frame()
+        self.__draw_frame()
+
+    def __start_frame(self) -> None:
+        """
+        Do what has to be done once per frame before drawing the menus: record the display if the inputs are
+        recorded, run the queued actions within the action time budget, handle the finished coroutine callbacks
+        and update the live text elements of the visible menus.
+        """
+        if self.input_recorder is not None:
+            self.input_recorder.record_display()
+        self.process_actions()
+        self._process_pending_callbacks()
+        self.__update_live_elements()
+
+    def __draw_frame(self) -> None:
+        """
+        Draw all the visible menus, only if something changed when a logical resolution is set.
+        """
+        has_rebuilt_menu = False
+        if self.scaled_screen is None:
+            has_rebuilt_menu = self.__display_menus(self.screen)
+        else:
+            if self.__has_visible_changes():
+                self.scaled_screen.clear()
+                has_rebuilt_menu = self.__display_menus(
+                    self.scaled_screen.logical_surface
+                )
+                self.scaled_screen.update_scaled()
+            self.scaled_screen.present(self.screen)
+        self.__is_stack_invalidated = False
+        self.__record_latencies()
+        if has_rebuilt_menu:
+            self._enforce_memory_budget()
+
+    def __display_menus(self, target: Union[pygame.Surface, RenderBackend]) -> bool:
+        """
+        Draw all the visible menus in order, the draw lists of all the menus being submitted
+        as a single batch of blits.
+
+        If occlusion culling is enabled, the menus and elements entirely hidden by the opaque background
+        of a menu drawn over them are skipped.
+        The duration of the drawing of the batch is measured by the instrumentation under the name "display_batch".
+
+        Returns:
+            bool: whether the surfaces of a displayed menu had to be rendered again.
+
+        Keyword arguments:
+            target (Union[pygame.Surface, RenderBackend]): the surface on which the menus should be drawn
+        """
+        has_rebuilt_menu = False
+        draw_list: list[Blit] = []
+        for menu, occluding_rects in self.__get_menus_to_draw():
+            has_rebuilt_menu |= menu.are_render_resources_released
+            draw_list.extend(
+                menu.get_draw_list(target, occluding_rects, self.culling_statistics)
+            )
+        with instrumentation.measure("display_batch"):
+            blits(target, draw_list)
+        return has_rebuilt_menu
+
+    def __get_menus_to_draw(
+        self,
+    ) -> list[tuple[InfoBox, Sequence[pygame.Rect]]]:
+        """
+        Determine which visible menus are not entirely hidden by the opaque menus drawn over them,
+        forgetting the changes of the hidden ones.
+
+        Returns:
+            list[tuple[InfoBox, Sequence[pygame.Rect]]]: the menus to be drawn in drawing order, with the opaque
+            areas of the menus that will be drawn over each of them.
+        """
+        visible_menus = self._get_visible_menus()
+        if not self.occlusion_culling:
+            return [(menu, ()) for menu in visible_menus]
+        menus_to_draw = []
+        occluding_rects: list[pygame.Rect] = []
+        for menu in reversed(visible_menus):
+            menu_rect = menu.get_rect()
+            if menu_rect is not None and is_occluded(menu_rect, occluding_rects):
+                menu.mark_occluded()
+                self.culling_statistics.occluded_menus += 1
+                continue
+            menus_to_draw.append((menu, tuple(occluding_rects)))
+            opaque_rect = menu.get_opaque_rect()
+            if opaque_rect is not None:
+                occluding_rects.append(opaque_rect)
+        menus_to_draw.reverse()
+        return menus_to_draw
+
+    def __has_visible_changes(self) -> bool:
+        """
+        Returns:
+            bool: whether something has to be drawn again since the last display.
+        """
+        return self.__is_stack_invalidated or any(
+            menu.is_dirty for menu in self._get_visible_menus()
+        )
+
+    def __update_live_elements(self) -> None:
+        """
+        Poll the value providers of the live text elements of the visible menus.
+        """
+        for menu in self._get_visible_menus():
+            menu.update_live_elements()
+
+    def get_memory_usage(self) -> int:
+        """
+        Returns:
+            int: the number of bytes taken by the surfaces of all the menus in the manager.
+            The caches shared by many menus, such as glyph atlases, are not included,
+            they are reported by memory.get_shared_caches_memory_usage.
+        """
+        return sum(menu.get_memory_usage() for menu in self._get_all_menus())
+
+    def _enforce_memory_budget(self) -> None:
+        """
+        Drop the regenerable surfaces of the least recently displayed menus until the memory budget is respected.
+
+        The menus that are currently visible are never released since they would have to be rendered again
+        at the next display.
+        """
+        if self.memory_budget is None:
+            return
+        memory_usage = self.get_memory_usage()
+        if memory_usage <= self.memory_budget:
+            return
+        visible_menus = self._get_visible_menus()
+        releasable_menus = sorted(
+            (
+                menu
+                for menu in self._get_all_menus()
+                if menu not in visible_menus and not menu.are_render_resources_released
+            ),
+            key=lambda menu: menu.last_display_time,
+        )
+        for menu in releasable_menus:
+            released_memory = menu.get_memory_usage()
+            menu.release_render_resources()
+            memory_usage -= released_memory - menu.get_memory_usage()
+            if memory_usage <= self.memory_budget:
+                return
+
+    def display_invalidated(self) -> list[pygame.Rect]:
+        """
+        Redraw only the parts of the visible menus that changed since the last display.
+
+        Intended for games that do not redraw the whole screen at each frame: the returned areas
+        can directly be given to pygame.display.update.
+        Everything is redrawn if a menu has been opened, closed or replaced since the last display,
+        restoring what was behind a closed menu is up to the caller.
+        A menu overlapping an area that has been redrawn is entirely redrawn to stay on top of it.
+
+        Returns:
+            list[pygame.Rect]: the areas of the screen that have been updated.
+        """
+        self.__start_frame()
+        if self.__is_stack_invalidated:
+            self.__draw_frame()
+            return [self.screen.get_rect()]
+
+        target = (
+            self.screen
+            if self.scaled_screen is None
+            else self.scaled_screen.logical_surface
+        )
+        updated_rects: list[pygame.Rect] = []
+        for menu, occluding_rects in self.__get_menus_to_draw():
+            menu_rect = menu.get_rect()
+            if (
+                menu_rect is not None
+                and updated_rects
+                and menu_rect.collidelist(updated_rects) != -1
+            ):
+                menu.display(target, occluding_rects, self.culling_statistics)
+                updated_rects.append(menu.get_rect())
+            else:
+                updated_rects.extend(
+                    menu.display_invalidated(target, self.culling_statistics)
+                )
+        if self.scaled_screen is not None and updated_rects:
+            self.scaled_screen.update_scaled(updated_rects)
+            updated_rects = self.scaled_screen.present(self.screen, updated_rects)
+        self.__record_latencies()
+        return updated_rects
 
     def click(self, button: int, position: Position) -> None:
         """
         Handle the triggering of a click event.
         Delegate this event to the active menu if there is any and if it's a left click.
 
+        If the callback of the clicked button is a coroutine function, the coroutine is scheduled on the
+        event loop instead of blocking until it is done.
+        If an action time budget is set, the callback is queued and run at the next display.
+
         Keyword arguments:
             button (int): a value representing which mouse button has been pressed
                 (1 for left button, 2 for middle button, 3 for right button)
-            position (Position): the position of the mouse
+            position (Position): the position of the mouse on the screen
         """
+        if self.input_recorder is not None:
+            self.input_recorder.record_click(button, position)
         if button == 1:
             if self.active_menu:
-                self.active_menu.click(position)()
+                position = self.__to_menu_position(position)
+                event_time = time.perf_counter()
+                menu_identifier = self.active_menu.identifier
+                clicked_button = self.active_menu.get_button_at(position)
+                callback = self.active_menu.click(position)
+                if self.action_time_budget is None:
+                    self.__run_callback(
+                        callback, clicked_button, menu_identifier=menu_identifier
+                    )
+                    self.__tag_event(event_time, menu_identifier)
+                else:
+                    self.enqueue_action(
+                        lambda: self.__run_callback(
+                            callback, clicked_button, event_time, menu_identifier
+                        )
+                    )
+
+    def __run_callback(
+        self,
+        callback: Callable,
+        clicked_button: Optional[Button],
+        event_time: Optional[float] = None,
+        menu_identifier: Optional[str] = None,
+    ) -> None:
+        """
+        Run the callback of a clicked button, scheduling the coroutine it returns if any.
+        The duration of the callback is measured by the instrumentation under the name "callback".
+
+        Keyword arguments:
+            callback (Callable): the callback of the button
+            clicked_button (Optional[Button]): the button that has been clicked
+            event_time (Optional[float]): the moment of the click if the callback has been queued, to measure
+                the latency of the change made by the callback
+            menu_identifier (Optional[str]): the identifier of the menu that has been clicked
+        """
+        with instrumentation.measure("callback", menu=menu_identifier):
+            result = callback()
+        if inspect.isawaitable(result):
+            self._schedule_callback(result, clicked_button)
+        if event_time is not None:
+            self.__tag_event(event_time, menu_identifier)
+
+    def __tag_event(self, event_time: float, menu_identifier: str) -> None:
+        """
+        Keep track of a handled event whose latency should be measured at the next display,
+        if latency tracking is enabled and something has to be drawn again after its handling.
+
+        Keyword arguments:
+            event_time (float): the moment of the event, as given by time.perf_counter
+            menu_identifier (str): the identifier of the active menu when the event occurred
+        """
+        if not self.track_latency:
+            return
+        if self.__has_visible_changes():
+            self.__pending_latencies.append((event_time, menu_identifier))
+
+    def __record_latencies(self) -> None:
+        """
+        Record the latency of the events whose effect has just been displayed.
+        """
+        if not self.__pending_latencies:
+            return
+        display_time = time.perf_counter()
+        for event_time, menu_identifier in self.__pending_latencies:
+            self.__latencies.setdefault(menu_identifier, []).append(
+                display_time - event_time
+            )
+        self.__pending_latencies.clear()
+
+    def get_latency_percentiles(
+        self, percentiles: Sequence[float] = (50, 95, 99)
+    ) -> dict[str, dict[str, float]]:
+        """
+        Give the distribution of the delays between the click and motion events and the first display
+        showing their effect, for each menu that was active when the events occurred.
+
+        Latency tracking should be enabled.
+        Events that did not change anything on screen are not measured.
+
+        Returns:
+            dict[str, dict[str, float]]: for each menu identifier, the given percentiles of the latencies
+            in seconds, keyed as "p50", "p95"...
+
+        Keyword arguments:
+            percentiles (Sequence[float]): the percentiles to be computed, defaults to (50, 95, 99)
+        """
+        return {
+            menu_identifier: compute_percentiles(latencies, percentiles)
+            for menu_identifier, latencies in self.__latencies.items()
+        }
+
+    def get_latencies(self) -> dict[str, list[float]]:
+        """
+        Returns:
+            dict[str, list[float]]: for each menu identifier, the measured latencies in seconds in order.
+        """
+        return {
+            menu_identifier: list(latencies)
+            for menu_identifier, latencies in self.__latencies.items()
+        }
+
+    def reset_latencies(self) -> None:
+        """
+        Forget all the latencies measured so far, and the events waiting for a display.
+        """
+        self.__latencies.clear()
+        self.__pending_latencies.clear()
+
+    def enqueue_action(self, action: Callable[[], None]) -> None:
+        """
+        Queue an action to be run at the next display, within the action time budget.
+
+        Keyword arguments:
+            action (Callable[[], None]): the action to be run
+        """
+        self.__actions.append(action)
+
+    def get_queued_actions_count(self) -> int:
+        """
+        Returns:
+            int: the number of actions waiting to be run.
+        """
+        return len(self.__actions)
+
+    def process_actions(self) -> None:
+        """
+        Run the queued actions in order until the action time budget is spent, at least one action being run.
+
+        All the queued actions are run if no action time budget is set.
+        Actions queued by the running actions are run in the same call if the budget allows it.
+        """
+        if not self.__actions or self.__is_processing_actions:
+            return
+        start = time.perf_counter()
+        self.__is_processing_actions = True
+        try:
+            while self.__actions:
+                self.__actions.popleft()()
+                if (
+                    self.action_time_budget is not None
+                    and time.perf_counter() - start >= self.action_time_budget
+                ):
+                    break
+        finally:
+            self.__is_processing_actions = False
+
+    def has_pending_callbacks(self) -> bool:
+        """
+        Returns:
+            bool: whether some coroutines started by button callbacks are still running.
+        """
+        return any(not future.done() for future, _ in self.__pending_callbacks)
+
+    def _schedule_callback(
+        self, awaitable: Awaitable, clicked_button: Optional[Button]
+    ) -> None:
+        """
+        Schedule the coroutine returned by a button callback on the event loop, putting the button
+        in a pending state until it is done if pending buttons should be disabled.
+
+        Keyword arguments:
+            awaitable (Awaitable): the coroutine returned by the callback
+            clicked_button (Optional[Button]): the button that has been clicked
+        """
+        event_loop = self.event_loop
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if event_loop is None or event_loop is running_loop:
+            if running_loop is None:
+                raise RuntimeError(
+                    "An event loop has to be given to the MenuManager or to be running "
+                    "to use coroutine callbacks"
+                )
+            future = asyncio.ensure_future(awaitable)
+        else:
+            future = asyncio.run_coroutine_threadsafe(
+                _as_coroutine(awaitable), event_loop
+            )
+        if self.disable_pending_buttons and clicked_button is not None:
+            clicked_button.set_pending(True)
+        self.__pending_callbacks.append((future, clicked_button))
+
+    def _process_pending_callbacks(self) -> None:
+        """
+        Restore the buttons whose coroutine is done, exceptions raised by the coroutines being raised again.
+        """
+        if not self.__pending_callbacks:
+            return
+        done_callbacks = [
+            pending_callback
+            for pending_callback in self.__pending_callbacks
+            if pending_callback[0].done()
+        ]
+        for pending_callback in done_callbacks:
+            self.__pending_callbacks.remove(pending_callback)
+            future, clicked_button = pending_callback
+            if clicked_button is not None:
+                clicked_button.set_pending(False)
+            if not future.cancelled():
+                future.result()
 
     def motion(self, position: Position) -> None:
         """
@@ -173,10 +748,39 @@ class MenuManager:
         Delegate this event to the active menu if there is any.
 
         Keyword arguments:
-            position (Position): the position of the mouse
+            position (Position): the position of the mouse on the screen
         """
+        if self.input_recorder is not None:
+            self.input_recorder.record_motion(position)
         if self.active_menu:
-            self.active_menu.motion(position)
+            event_time = time.perf_counter()
+            self.active_menu.motion(self.__to_menu_position(position))
+            self.__tag_event(event_time, self.active_menu.identifier)
+
+    def __to_menu_position(self, position: Position) -> Position:
+        """
+        Returns:
+            Position: the position in the coordinates of the menus matching the given position on the screen,
+            transformed to the logical resolution if one is set.
+
+        Keyword arguments:
+            position (Position): the position on the screen
+        """
+        if self.scaled_screen is None:
+            return position
+        return self.scaled_screen.to_logical_position(position)
+
+    def _send_to_background(self, menu: InfoBox) -> None:
+        """
+        Move the given menu to the background, releasing its regenerable surfaces if it is hidden there
+        and if hidden menus should be released.
+
+        Keyword arguments:
+            menu (InfoBox): the menu leaving the foreground
+        """
+        self.background_menus.append(menu)
+        if self.release_hidden_menus and not menu.visible_on_background:
+            menu.release_render_resources()
 
     def _prepare_menu(self, menu: InfoBox) -> None:
         """
@@ -185,7 +789,40 @@ class MenuManager:
         Keyword arguments:
             menu (InfoBox): the menu to be initialized
         """
-        menu.init_render(self.screen, close_button_callback=self.close_active_menu)
+        menu.init_render(
+            (
+                self.screen
+                if self.scaled_screen is None
+                else self.scaled_screen.logical_surface
+            ),
+            close_button_callback=self.close_active_menu,
+            to_menu_position=(
+                self.__to_menu_position if self.scaled_screen is not None else None
+            ),
+        )
+        menu.finalize()
+
+    def _get_all_menus(self) -> Sequence[InfoBox]:
+        """
+        Returns:
+            Sequence[InfoBox]: all the menus in the manager, each one being present only once
+        """
+        all_menus = list({id(menu): menu for menu in self.background_menus}.values())
+        if self.active_menu and self.active_menu not in all_menus:
+            all_menus.append(self.active_menu)
+        return all_menus
+
+    def _get_visible_menus(self) -> Sequence[InfoBox]:
+        """
+        Returns:
+            Sequence[InfoBox]: all the menus that should be displayed, in drawing order
+        """
+        visible_menus = [
+            menu for menu in self.background_menus if menu.visible_on_background
+        ]
+        if self.active_menu:
+            visible_menus.append(self.active_menu)
+        return visible_menus
 
     def _get_given_menus_from_background(
         self, menu_identifier: str
@@ -200,3 +837,14 @@ class MenuManager:
         return [
             menu for menu in self.background_menus if menu.identifier == menu_identifier
         ]
+
+
+async def _as_coroutine(awaitable: Awaitable) -> Any:
+    """
+    Returns:
+        Any: the result of the given awaitable, wrapped in a coroutine to be scheduled from another thread.
+
+    Keyword arguments:
+        awaitable (Awaitable): the awaitable returned by a callback
+    """
+    return await awaitable
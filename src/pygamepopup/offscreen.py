@@ -0,0 +1,126 @@
+"""
+Defines functions to render menus on their own surfaces instead of on a screen,
+useful to generate images of popups without any window.
+
+Batches of menus can be rendered in parallel by a pool of processes, each process initializing
+pygame and pygamepopup only once with the dummy video driver.
+"""
+
+from __future__ import annotations
+
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Optional
+
+import pygame
+
+from . import initialization
+from .components.info_box import InfoBox
+
+_worker_menu_builder: Optional[Callable[[Any], InfoBox]] = None
+
+
+def render_menu(menu: InfoBox) -> pygame.Surface:
+    """
+    Render the given menu on a new surface having exactly the size of the menu.
+
+    The menu is positioned at the top left corner of the surface, whatever its linked element or static
+    position is.
+    No display mode is needed: without one, sprites are kept in a display-independent format.
+
+    Returns:
+        pygame.Surface: the surface with per-pixel alpha on which the menu has been drawn.
+
+    Keyword arguments:
+        menu (InfoBox): the menu to be rendered
+    """
+    menu.init_render(pygame.Surface((0, 0)))
+    surface = pygame.Surface(menu.get_size(), pygame.SRCALPHA)
+    menu.position = pygame.Vector2(0, 0)
+    menu.determine_elements_position()
+    menu.display(surface)
+    return surface
+
+
+def render_menu_to_png(menu: InfoBox) -> bytes:
+    """
+    Render the given menu on its own surface and encode it as a PNG image.
+
+    Returns:
+        bytes: the content of the PNG image.
+
+    Keyword arguments:
+        menu (InfoBox): the menu to be rendered
+    """
+    image_buffer = io.BytesIO()
+    pygame.image.save(render_menu(menu), image_buffer, "menu.png")
+    return image_buffer.getvalue()
+
+
+def render_menus_in_batch(
+    menu_specs: Iterable[Any],
+    build_menu: Callable[[Any], InfoBox],
+    processes: Optional[int] = None,
+    configure: Optional[Callable[[], None]] = None,
+    chunk_size: int = 1,
+) -> list[bytes]:
+    """
+    Render many menus to PNG images, distributing the work across a pool of processes.
+
+    Menus themselves cannot be sent to other processes, each worker builds them from the given specs.
+    The build_menu and configure callables are sent once to each worker, so they should be defined at
+    the top level of a module, and the specs should be picklable (e.g. dicts or tuples).
+
+    Returns:
+        list[bytes]: the PNG images, in the same order as the given specs.
+
+    Keyword arguments:
+        menu_specs (Iterable[Any]): the descriptions of the menus to be rendered
+        build_menu (Callable[[Any], InfoBox]): the function building a menu from one of the specs
+        processes (Optional[int]): the number of worker processes, defaults to the number of CPUs
+        configure (Optional[Callable[[], None]]): a function called once in each worker after initialization,
+            to set up the pygamepopup configuration (fonts, default sprites...) if needed
+        chunk_size (int): the number of specs sent at once to a worker, defaults to 1
+    """
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialize_worker,
+        initargs=(build_menu, configure),
+    ) as executor:
+        return list(executor.map(_render_spec_to_png, menu_specs, chunksize=chunk_size))
+
+
+def _initialize_worker(
+    build_menu: Callable[[Any], InfoBox], configure: Optional[Callable[[], None]]
+) -> None:
+    """
+    Initialize pygame and pygamepopup in a worker process, without any visible window.
+    The dummy video driver is always used, whatever the video driver of the parent process is.
+
+    Keyword arguments:
+        build_menu (Callable[[Any], InfoBox]): the function building a menu from a spec
+        configure (Optional[Callable[[], None]]): the function setting up the configuration, if any
+    """
+    global _worker_menu_builder
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    if not initialization._is_initialized:
+        initialization.init()
+    if configure:
+        configure()
+    _worker_menu_builder = build_menu
+
+
+def _render_spec_to_png(menu_spec: Any) -> bytes:
+    """
+    Returns:
+        bytes: the PNG image of the menu built from the given spec in a worker process.
+
+    Keyword arguments:
+        menu_spec (Any): the description of the menu to be rendered
+    """
+    return render_menu_to_png(_worker_menu_builder(menu_spec))
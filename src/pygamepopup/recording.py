@@ -0,0 +1,257 @@
+"""
+Defines the recording of the user inputs given to a MenuManager, and their replay without any window,
+permitting to turn a recorded session into a reproducible performance test.
+
+An InputRecorder attached to a MenuManager records each click and motion with its timestamp and the
+identifiers of the menus opened at that moment, and each display delimiting the frames.
+The recording can be saved as a JSON file, and replayed with replay_recording on a MenuManager built
+the same way as in the game, under the dummy video driver if no display is set, measuring the duration
+of each frame and of each input handling.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+import pygame
+
+from .instrumentation import compute_percentiles
+from .type_definitions import Position
+
+if TYPE_CHECKING:
+    from .menu_manager import MenuManager
+
+RECORDING_FORMAT_VERSION = 1
+
+
+def _get_menu_stack(menu_manager: MenuManager) -> list[str]:
+    """
+    Returns:
+        list[str]: the identifiers of the menus in the given manager, from the deepest background menu
+        to the active menu.
+
+    Keyword arguments:
+        menu_manager (MenuManager): the manager of the menus
+    """
+    menu_stack = [menu.identifier for menu in menu_manager.background_menus]
+    if menu_manager.active_menu:
+        menu_stack.append(menu_manager.active_menu.identifier)
+    return menu_stack
+
+
+class InputRecording:
+    """
+    This class represents a recorded session of user inputs.
+
+    Each event is a dict with a "type" key being "click", "motion" or "display" and a "time" key being
+    the number of seconds since the start of the recording.
+    Click and motion events also have a "position" key, a "menus" key containing the identifiers of the opened
+    menus before the event is handled, and click events have a "button" key.
+
+    Keyword arguments:
+        screen_size (tuple[int, int]): the size of the screen on which the session has been recorded
+        events (Optional[list[dict[str, Any]]]): the recorded events in order, none by default
+
+    Attributes:
+        screen_size (tuple[int, int]): the size of the screen on which the session has been recorded
+        events (list[dict[str, Any]]): the recorded events in order
+    """
+
+    def __init__(
+        self,
+        screen_size: tuple[int, int],
+        events: Optional[list[dict[str, Any]]] = None,
+    ) -> None:
+        self.screen_size: tuple[int, int] = tuple(screen_size)
+        self.events: list[dict[str, Any]] = events if events is not None else []
+
+    def save(self, path: str) -> None:
+        """
+        Write the recording to a JSON file.
+
+        Keyword arguments:
+            path (str): the path of the file
+        """
+        with open(path, "w", encoding="utf-8") as recording_file:
+            json.dump(
+                {
+                    "version": RECORDING_FORMAT_VERSION,
+                    "screen_size": list(self.screen_size),
+                    "events": self.events,
+                },
+                recording_file,
+            )
+
+    @staticmethod
+    def load(path: str) -> InputRecording:
+        """
+        Read a recording from a JSON file written by save.
+
+        Returns:
+            InputRecording: the loaded recording.
+
+        Keyword arguments:
+            path (str): the path of the file
+        """
+        with open(path, "r", encoding="utf-8") as recording_file:
+            content = json.load(recording_file)
+        if content.get("version") != RECORDING_FORMAT_VERSION:
+            raise ValueError(f"Unsupported recording format in '{path}'")
+        return InputRecording(content["screen_size"], content["events"])
+
+
+class InputRecorder:
+    """
+    This class records the user inputs given to a MenuManager.
+
+    Keyword arguments:
+        menu_manager (MenuManager): the manager whose inputs should be recorded, the recorder is attached to it
+
+    Attributes:
+        recording (InputRecording): the session being recorded
+    """
+
+    def __init__(self, menu_manager: MenuManager) -> None:
+        self.__menu_manager: MenuManager = menu_manager
+        self.__start: float = time.perf_counter()
+        self.recording: InputRecording = InputRecording(menu_manager.screen.get_size())
+        menu_manager.input_recorder = self
+
+    def detach(self) -> None:
+        """
+        Stop recording the inputs of the menu manager.
+        """
+        if self.__menu_manager.input_recorder is self:
+            self.__menu_manager.input_recorder = None
+
+    def record_click(self, button: int, position: Position) -> None:
+        """
+        Record a click given to the menu manager, before it is handled.
+
+        Keyword arguments:
+            button (int): the mouse button that has been pressed
+            position (Position): the position of the mouse
+        """
+        self.__record_input("click", position, button=button)
+
+    def record_motion(self, position: Position) -> None:
+        """
+        Record a motion given to the menu manager, before it is handled.
+
+        Keyword arguments:
+            position (Position): the position of the mouse
+        """
+        self.__record_input("motion", position)
+
+    def record_display(self) -> None:
+        """
+        Record a display of the menus, ending the current frame.
+        """
+        self.recording.events.append(
+            {"type": "display", "time": time.perf_counter() - self.__start}
+        )
+
+    def __record_input(self, event_type: str, position: Position, **details) -> None:
+        """
+        Record an input with the current state of the menu manager.
+
+        Keyword arguments:
+            event_type (str): the type of the input
+            position (Position): the position of the mouse
+            details (Any): the other details about the input
+        """
+        self.recording.events.append(
+            {
+                "type": event_type,
+                "time": time.perf_counter() - self.__start,
+                "position": [position[0], position[1]],
+                "menus": _get_menu_stack(self.__menu_manager),
+                **details,
+            }
+        )
+
+
+class ReplayReport:
+    """
+    This class gathers the measures made while replaying a recording.
+
+    Attributes:
+        frame_durations (list[float]): the duration in seconds of each display
+        input_durations (list[float]): the duration in seconds of the handling of each input
+        mismatches (list[tuple[int, list[str], list[str]]]): for each input for which the opened menus
+            differed from the recording, the index of the event, the recorded menus and the replayed menus
+    """
+
+    def __init__(self) -> None:
+        self.frame_durations: list[float] = []
+        self.input_durations: list[float] = []
+        self.mismatches: list[tuple[int, list[str], list[str]]] = []
+
+    def get_summary(self) -> dict[str, dict[str, float]]:
+        """
+        Returns:
+            dict[str, dict[str, float]]: the percentiles and the maximum of the frame durations and of the
+            input handling durations, in seconds.
+        """
+        return {
+            name: {**compute_percentiles(durations), "max": max(durations, default=0)}
+            for name, durations in (
+                ("frames", self.frame_durations),
+                ("inputs", self.input_durations),
+            )
+        }
+
+
+def replay_recording(
+    recording: InputRecording,
+    build_menu_manager: Callable[[pygame.Surface], MenuManager],
+    respect_timing: bool = False,
+) -> ReplayReport:
+    """
+    Replay a recorded session on a new menu manager, measuring the duration of each frame and input handling.
+
+    If no display mode is set, the dummy video driver is used so that no window is opened.
+    pygame and pygamepopup should be initialized beforehand.
+
+    Returns:
+        ReplayReport: the measures made during the replay.
+
+    Keyword arguments:
+        recording (InputRecording): the session to be replayed
+        build_menu_manager (Callable[[pygame.Surface], MenuManager]): the function building the menu manager
+            on the given screen and opening the menus that were opened when the recording started
+        respect_timing (bool): whether the delays between the recorded events should be reproduced,
+            defaults to False
+    """
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != recording.screen_size:
+        if not pygame.display.get_init():
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            pygame.display.init()
+        screen = pygame.display.set_mode(recording.screen_size)
+    menu_manager = build_menu_manager(screen)
+    report = ReplayReport()
+    replay_start = time.perf_counter()
+    for index, event in enumerate(recording.events):
+        if respect_timing:
+            delay = event["time"] - (time.perf_counter() - replay_start)
+            if delay > 0:
+                time.sleep(delay)
+        if event["type"] == "display":
+            start = time.perf_counter()
+            menu_manager.display()
+            report.frame_durations.append(time.perf_counter() - start)
+            continue
+        menu_stack = _get_menu_stack(menu_manager)
+        if menu_stack != event["menus"]:
+            report.mismatches.append((index, event["menus"], menu_stack))
+        start = time.perf_counter()
+        if event["type"] == "click":
+            menu_manager.click(event["button"], event["position"])
+        else:
+            menu_manager.motion(event["position"])
+        report.input_durations.append(time.perf_counter() - start)
+    return report
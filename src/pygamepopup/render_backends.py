@@ -0,0 +1,244 @@
+"""
+Defines the render backends, the targets on which menus can be drawn.
+
+Menus are drawn on a pygame.Surface by default.
+A TextureBackend can be given instead to draw them through a pygame._sdl2 Renderer, the sprites of the
+menus being uploaded to textures once and drawn by the renderer at each frame.
+
+A render backend can be used anywhere a screen surface is expected: by a MenuManager, by the display
+methods of InfoBox and components and by InfoBox.init_render.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Optional, Sequence, Union
+
+import pygame
+from pygame._sdl2.video import Renderer, Texture
+
+from .type_definitions import Position
+
+Blit = Union[
+    tuple[pygame.Surface, Position], tuple[pygame.Surface, Position, pygame.Rect]
+]
+
+# fblits is only provided by pygame-ce
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+class RenderBackend:
+    """
+    This class is the interface of the targets on which menus can be drawn.
+
+    It follows the subset of the pygame.Surface interface used to display menus, so that a surface can be
+    used directly as the target of the displaying, without being wrapped in a SurfaceBackend.
+    """
+
+    def get_size(self) -> tuple[int, int]:
+        """
+        Returns:
+            tuple[int, int]: the size of the drawable area.
+        """
+        raise NotImplementedError
+
+    def get_rect(self) -> pygame.Rect:
+        """
+        Returns:
+            pygame.Rect: the drawable area.
+        """
+        return pygame.Rect((0, 0), self.get_size())
+
+    def get_clip(self) -> pygame.Rect:
+        """
+        Returns:
+            pygame.Rect: the area outside of which nothing is drawn, the whole drawable area by default.
+        """
+        return self.get_rect()
+
+    def blit(
+        self,
+        source: pygame.Surface,
+        dest: Position,
+        area: Optional[pygame.Rect] = None,
+    ) -> pygame.Rect:
+        """
+        Draw the given surface.
+
+        Returns:
+            pygame.Rect: the area of the target that has been drawn.
+
+        Keyword arguments:
+            source (pygame.Surface): the surface to be drawn
+            dest (Position): the position of the top left corner of the drawing on the target
+            area (Optional[pygame.Rect]): the part of the surface to be drawn, the whole surface by default
+        """
+        raise NotImplementedError
+
+    def blits(self, blit_sequence: Sequence[Blit]) -> None:
+        """
+        Draw the given surfaces in order, one after the other by default.
+
+        Keyword arguments:
+            blit_sequence (Sequence[Blit]): the (source, dest) or (source, dest, area) tuples to be drawn
+        """
+        for blit in blit_sequence:
+            self.blit(*blit)
+
+    def refresh(
+        self, source: pygame.Surface, area: Optional[pygame.Rect] = None
+    ) -> None:
+        """
+        Take into account a change of the pixels of a surface already drawn, the surface being modified in place.
+
+        Keyword arguments:
+            source (pygame.Surface): the modified surface
+            area (Optional[pygame.Rect]): the modified part of the surface, the whole surface by default
+        """
+
+
+class SurfaceBackend(RenderBackend):
+    """
+    This class is the render backend drawing on a pygame.Surface with software blitting.
+
+    Keyword arguments:
+        surface (pygame.Surface): the surface on which the menus should be drawn
+
+    Attributes:
+        surface (pygame.Surface): the surface on which the menus are drawn
+    """
+
+    def __init__(self, surface: pygame.Surface) -> None:
+        self.surface: pygame.Surface = surface
+
+    def get_size(self) -> tuple[int, int]:
+        return self.surface.get_size()
+
+    def get_clip(self) -> pygame.Rect:
+        return self.surface.get_clip()
+
+    def blit(
+        self,
+        source: pygame.Surface,
+        dest: Position,
+        area: Optional[pygame.Rect] = None,
+    ) -> pygame.Rect:
+        return self.surface.blit(source, dest, area)
+
+    def blits(self, blit_sequence: Sequence[Blit]) -> None:
+        blits(self.surface, blit_sequence)
+
+
+class TextureBackend(RenderBackend):
+    """
+    This class is the render backend drawing through a pygame._sdl2 Renderer.
+
+    Each surface is uploaded to a texture the first time it is drawn, the texture being reused
+    as long as the surface exists.
+    Surfaces modified in place are uploaded again when their change is notified through refresh,
+    which is done by InfoBox for the elements it redraws partially.
+
+    Keyword arguments:
+        renderer (pygame._sdl2.video.Renderer): the renderer through which the menus should be drawn
+
+    Attributes:
+        renderer (pygame._sdl2.video.Renderer): the renderer through which the menus are drawn
+    """
+
+    def __init__(self, renderer: Renderer) -> None:
+        self.renderer = renderer
+        self.__textures: weakref.WeakKeyDictionary[pygame.Surface, Texture] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get_size(self) -> tuple[int, int]:
+        return self.renderer.get_viewport().size
+
+    def get_texture(self, source: pygame.Surface) -> Texture:
+        """
+        Returns:
+            pygame._sdl2.video.Texture: the texture holding the pixels of the given surface,
+            created if the surface has never been drawn.
+
+        Keyword arguments:
+            source (pygame.Surface): the surface
+        """
+        texture = self.__textures.get(source)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, source)
+            self.__textures[source] = texture
+        return texture
+
+    def get_textures_count(self) -> int:
+        """
+        Returns:
+            int: the number of textures currently kept for the drawn surfaces.
+        """
+        return len(self.__textures)
+
+    def blit(
+        self,
+        source: pygame.Surface,
+        dest: Position,
+        area: Optional[pygame.Rect] = None,
+    ) -> pygame.Rect:
+        source_rect = (
+            source.get_rect()
+            if area is None
+            else pygame.Rect(area).clip(source.get_rect())
+        )
+        destination_rect = pygame.Rect((int(dest[0]), int(dest[1])), source_rect.size)
+        if source_rect.width and source_rect.height:
+            self.get_texture(source).draw(srcrect=source_rect, dstrect=destination_rect)
+        return destination_rect
+
+    def refresh(
+        self, source: pygame.Surface, area: Optional[pygame.Rect] = None
+    ) -> None:
+        texture = self.__textures.get(source)
+        if texture is None:
+            return
+        if area is None:
+            del self.__textures[source]
+            return
+        area = pygame.Rect(area).clip(source.get_rect())
+        texture.update(source.subsurface(area), area)
+
+
+def blits(
+    target: Union[pygame.Surface, RenderBackend], blit_sequence: Sequence[Blit]
+) -> None:
+    """
+    Draw the given surfaces in order on a surface or through a render backend, in a single call.
+
+    On a surface, Surface.fblits is used when available and when no blit is restricted to a part
+    of its source, Surface.blits otherwise.
+
+    Keyword arguments:
+        target (Union[pygame.Surface, RenderBackend]): the target on which the surfaces should be drawn
+        blit_sequence (Sequence[Blit]): the (source, dest) or (source, dest, area) tuples to be drawn
+    """
+    if not isinstance(target, pygame.Surface):
+        target.blits(blit_sequence)
+    elif _HAS_FBLITS and all(len(blit) == 2 for blit in blit_sequence):
+        target.fblits(blit_sequence)
+    else:
+        target.blits(blit_sequence, doreturn=False)
+
+
+def refresh(
+    target: Union[pygame.Surface, RenderBackend],
+    source: pygame.Surface,
+    area: Optional[pygame.Rect] = None,
+) -> None:
+    """
+    Notify the target that a surface already drawn has been modified in place, nothing has to be done
+    when drawing directly on a surface.
+
+    Keyword arguments:
+        target (Union[pygame.Surface, RenderBackend]): the target on which the surface is drawn
+        source (pygame.Surface): the modified surface
+        area (Optional[pygame.Rect]): the modified part of the surface, the whole surface by default
+    """
+    if not isinstance(target, pygame.Surface):
+        target.refresh(source, area)
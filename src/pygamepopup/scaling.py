@@ -0,0 +1,215 @@
+"""
+Defines ScaledScreen class, the offscreen surface on which menus are drawn at a logical resolution
+before being scaled to the screen, for games rendered at a low resolution such as pixel-art games.
+
+A MenuManager given a logical resolution lays out and draws its menus on a ScaledScreen, scales the result
+only when something changed and transforms the positions of the user events back to the logical resolution.
+"""
+
+from __future__ import annotations
+
+import math
+from enum import Enum
+from typing import Optional, Sequence, Union
+
+import pygame
+from pygame.constants import SRCALPHA
+
+from .render_backends import RenderBackend, refresh
+from .type_definitions import Position
+
+
+class ScalingMode(Enum):
+    """
+    The ways the logical surface can be scaled to the screen.
+
+    INTEGER scales by the largest integer factor fitting in the screen, without filtering, keeping pixel art sharp.
+    SMOOTH scales by the largest factor fitting in the screen, with filtering.
+    """
+
+    INTEGER = "integer"
+    SMOOTH = "smooth"
+
+
+class ScaledScreen:
+    """
+    This class represents a surface at a logical resolution, scaled and centered on a screen.
+
+    The scaled rendering is kept between frames: it is only computed again for the areas given to update_scaled,
+    and drawn as is by present otherwise.
+
+    Keyword arguments:
+        logical_resolution (tuple[int, int]): the size of the logical surface
+        screen (Union[pygame.Surface, RenderBackend]): the screen on which the logical surface should be presented
+        scaling_mode (ScalingMode): the way the logical surface should be scaled, defaults to ScalingMode.INTEGER
+
+    Attributes:
+        logical_surface (pygame.Surface): the surface at the logical resolution, on which menus are drawn
+        scaling_mode (ScalingMode): the way the logical surface is scaled
+        scale (float): the factor applied to the logical surface
+        offset (tuple[int, int]): the position of the scaled surface on the screen
+    """
+
+    def __init__(
+        self,
+        logical_resolution: tuple[int, int],
+        screen: Union[pygame.Surface, RenderBackend],
+        scaling_mode: ScalingMode = ScalingMode.INTEGER,
+    ) -> None:
+        self.logical_surface: pygame.Surface = pygame.Surface(
+            logical_resolution, SRCALPHA
+        )
+        self.scaling_mode: ScalingMode = scaling_mode
+        self.scale: float = 1
+        self.offset: tuple[int, int] = (0, 0)
+        self.__scaled_surface: pygame.Surface = self.logical_surface
+        # Part of the scaled surface modified since it has been presented
+        self.__modified_area: Optional[pygame.Rect] = None
+        self.adapt_to_screen(screen)
+
+    def adapt_to_screen(self, screen: Union[pygame.Surface, RenderBackend]) -> None:
+        """
+        Compute the scale and the position of the logical surface for the given screen,
+        and scale it again.
+
+        Keyword arguments:
+            screen (Union[pygame.Surface, RenderBackend]): the screen on which the logical surface should be
+                presented
+        """
+        screen_width, screen_height = screen.get_size()
+        logical_width, logical_height = self.logical_surface.get_size()
+        scale = min(screen_width / logical_width, screen_height / logical_height)
+        if self.scaling_mode is ScalingMode.INTEGER:
+            scale = max(1, int(scale))
+        self.scale = scale
+        scaled_size = (round(logical_width * scale), round(logical_height * scale))
+        self.offset = (
+            (screen_width - scaled_size[0]) // 2,
+            (screen_height - scaled_size[1]) // 2,
+        )
+        self.__scaled_surface = pygame.Surface(scaled_size, SRCALPHA)
+        self.__modified_area = None
+        self.update_scaled()
+
+    def get_rect(self) -> pygame.Rect:
+        """
+        Returns:
+            pygame.Rect: the area of the screen covered by the scaled surface.
+        """
+        return pygame.Rect(self.offset, self.__scaled_surface.get_size())
+
+    def clear(self) -> None:
+        """
+        Make the whole logical surface transparent.
+        """
+        self.logical_surface.fill((0, 0, 0, 0))
+
+    def to_logical_position(self, position: Position) -> tuple[int, int]:
+        """
+        Returns:
+            tuple[int, int]: the position on the logical surface matching the given position on the screen.
+
+        Keyword arguments:
+            position (Position): the position on the screen
+        """
+        return (
+            int((position[0] - self.offset[0]) // self.scale),
+            int((position[1] - self.offset[1]) // self.scale),
+        )
+
+    def update_scaled(self, areas: Optional[Sequence[pygame.Rect]] = None) -> None:
+        """
+        Scale again the given areas of the logical surface.
+        The whole surface is scaled again if no area is given or if the scaling is smooth,
+        since filtering makes scaled areas depend on their surroundings.
+
+        Keyword arguments:
+            areas (Optional[Sequence[pygame.Rect]]): the areas of the logical surface that changed
+        """
+        if areas is None or self.scaling_mode is ScalingMode.SMOOTH:
+            if self.scaling_mode is ScalingMode.SMOOTH:
+                pygame.transform.smoothscale(
+                    self.logical_surface,
+                    self.__scaled_surface.get_size(),
+                    self.__scaled_surface,
+                )
+            else:
+                pygame.transform.scale(
+                    self.logical_surface,
+                    self.__scaled_surface.get_size(),
+                    self.__scaled_surface,
+                )
+            self.__add_modified_area(self.__scaled_surface.get_rect())
+            return
+        logical_rect = self.logical_surface.get_rect()
+        for area in areas:
+            area = pygame.Rect(area).clip(logical_rect)
+            if not area.width or not area.height:
+                continue
+            scaled_area = self.__to_scaled_area(area)
+            pygame.transform.scale(
+                self.logical_surface.subsurface(area),
+                scaled_area.size,
+                self.__scaled_surface.subsurface(scaled_area),
+            )
+            self.__add_modified_area(scaled_area)
+
+    def __to_scaled_area(self, area: pygame.Rect) -> pygame.Rect:
+        """
+        Returns:
+            pygame.Rect: the area of the scaled surface covering the given area of the logical surface.
+
+        Keyword arguments:
+            area (pygame.Rect): the area of the logical surface
+        """
+        left, top = math.floor(area.left * self.scale), math.floor(
+            area.top * self.scale
+        )
+        right = math.ceil(area.right * self.scale)
+        bottom = math.ceil(area.bottom * self.scale)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def __add_modified_area(self, area: pygame.Rect) -> None:
+        """
+        Keep track of a part of the scaled surface that changed since it has been presented.
+
+        Keyword arguments:
+            area (pygame.Rect): the modified part of the scaled surface
+        """
+        self.__modified_area = (
+            area if self.__modified_area is None else self.__modified_area.union(area)
+        )
+
+    def present(
+        self,
+        screen: Union[pygame.Surface, RenderBackend],
+        areas: Optional[Sequence[pygame.Rect]] = None,
+    ) -> list[pygame.Rect]:
+        """
+        Draw the scaled surface on the screen.
+
+        Returns:
+            list[pygame.Rect]: the areas of the screen that have been drawn.
+
+        Keyword arguments:
+            screen (Union[pygame.Surface, RenderBackend]): the screen on which the scaled surface should be drawn
+            areas (Optional[Sequence[pygame.Rect]]): the areas of the logical surface that should be drawn,
+                the whole surface is drawn if not provided
+        """
+        if self.__modified_area is not None:
+            refresh(screen, self.__scaled_surface, self.__modified_area)
+            self.__modified_area = None
+        if areas is None:
+            return [screen.blit(self.__scaled_surface, self.offset)]
+        drawn_areas = []
+        scaled_rect = self.__scaled_surface.get_rect()
+        for area in areas:
+            scaled_area = self.__to_scaled_area(area).clip(scaled_rect)
+            drawn_areas.append(
+                screen.blit(
+                    self.__scaled_surface,
+                    scaled_area.move(self.offset),
+                    scaled_area,
+                )
+            )
+        return drawn_areas
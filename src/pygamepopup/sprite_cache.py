@@ -0,0 +1,266 @@
+"""
+Defines SpriteCache class, an optional disk cache of the surfaces rendered by the components,
+permitting to load them back at the next startup instead of rendering them again from fonts and images.
+
+The cache is enabled by giving an instance to configuration.set_sprite_cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pathlib
+import struct
+import tempfile
+import time
+from importlib import resources
+from importlib.abc import Traversable
+from typing import Any, Callable, Optional, Sequence, Union
+
+import pygame
+
+from . import instrumentation
+from .configuration import _caches
+from .finalization import is_display_available
+
+_HEADER_FORMAT = "<4sII"
+_HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)
+_MAGIC = b"PGPS"
+_FILE_EXTENSION = ".sprite"
+_PIXEL_FORMAT = "RGBA"
+
+
+class SpriteCache:
+    """
+    This class represents a cache of rendered surfaces stored on disk.
+
+    Each surface is stored in its own file as raw RGBA pixels preceded by its size, and is identified by a key
+    computed from everything that was used to render it (text, font, colors, background file, size...).
+    When the total size of the stored files exceeds the limit, the least recently used ones are deleted.
+
+    Keyword arguments:
+        directory (str): the directory in which the surfaces should be stored, created if it doesn't exist
+        max_size (int): the maximum number of bytes that the stored files can take, defaults to 64 MiB
+
+    Attributes:
+        directory (str): the directory in which the surfaces are stored
+        max_size (int): the maximum number of bytes that the stored files can take
+        hits (int): the number of surfaces that have been loaded from the cache
+        misses (int): the number of surfaces that were looked for but not found in the cache
+    """
+
+    def __init__(self, directory: str, max_size: int = 64 * 1024 * 1024) -> None:
+        self.directory: str = os.path.abspath(directory)
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        os.makedirs(self.directory, exist_ok=True)
+        # Size and last access time of each stored file, by key
+        self.__entries: dict[str, tuple[int, float]] = {}
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(_FILE_EXTENSION):
+                entry_stat = entry.stat()
+                self.__entries[entry.name[: -len(_FILE_EXTENSION)]] = (
+                    entry_stat.st_size,
+                    entry_stat.st_mtime,
+                )
+        self.__total_size: int = sum(size for size, _ in self.__entries.values())
+
+    @staticmethod
+    def compute_key(inputs: Sequence[Any]) -> str:
+        """
+        Returns:
+            str: a key identifying a rendering made from the given inputs.
+
+        Keyword arguments:
+            inputs (Sequence[Any]): everything that has an impact on the rendering, their text
+                representation is hashed
+        """
+        return hashlib.sha256(repr(tuple(inputs)).encode("utf-8")).hexdigest()
+
+    def get_total_size(self) -> int:
+        """
+        Returns:
+            int: the number of bytes taken by the stored files.
+        """
+        return self.__total_size
+
+    def load(self, key: str) -> Optional[pygame.Surface]:
+        """
+        Load the surface stored for the given key.
+
+        Returns:
+            Optional[pygame.Surface]: the loaded surface, converted for fast blitting if a display mode has been set,
+            None if there is no valid surface stored for the key.
+
+        Keyword arguments:
+            key (str): the key identifying the surface
+        """
+        if key not in self.__entries:
+            self.misses += 1
+            return None
+        path = self.__get_path(key)
+        try:
+            with open(path, "rb") as sprite_file:
+                data = sprite_file.read()
+            magic, width, height = struct.unpack_from(_HEADER_FORMAT, data)
+        except (OSError, struct.error):
+            magic, width, height = None, 0, 0
+        if magic != _MAGIC or len(data) != _HEADER_SIZE + width * height * 4:
+            self.__remove(key)
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+            access_time = os.path.getmtime(path)
+        except OSError:
+            # Read-only cache, or file evicted by another process since it has been read
+            access_time = time.time()
+        self.__entries[key] = (self.__entries[key][0], access_time)
+        self.hits += 1
+        surface = pygame.image.frombuffer(
+            memoryview(data)[_HEADER_SIZE:], (width, height), _PIXEL_FORMAT
+        )
+        if is_display_available():
+            return surface.convert_alpha()
+        return surface.copy()
+
+    def store(self, key: str, surface: pygame.Surface) -> None:
+        """
+        Store the given surface, evicting the least recently used ones if the size limit is exceeded.
+
+        Keyword arguments:
+            key (str): the key identifying the surface
+            surface (pygame.Surface): the surface to be stored
+        """
+        data = struct.pack(
+            _HEADER_FORMAT, _MAGIC, surface.get_width(), surface.get_height()
+        ) + pygame.image.tobytes(surface, _PIXEL_FORMAT)
+        if len(data) > self.max_size:
+            return
+        if key in self.__entries:
+            self.__remove(key)
+        path = self.__get_path(key)
+        # Processes sharing the cache may store the same key at the same time, each one writes its own file
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as sprite_file:
+            sprite_file.write(data)
+        try:
+            os.replace(sprite_file.name, path)
+        except OSError:
+            os.remove(sprite_file.name)
+            raise
+        self.__entries[key] = (len(data), os.path.getmtime(path))
+        self.__total_size += len(data)
+        self.__evict()
+
+    def clear(self) -> None:
+        """
+        Delete all the stored surfaces.
+        """
+        for key in list(self.__entries):
+            self.__remove(key)
+
+    def __evict(self) -> None:
+        """
+        Delete the least recently used surfaces until the total size is below the limit.
+        """
+        if self.__total_size <= self.max_size:
+            return
+        for key, _ in sorted(self.__entries.items(), key=lambda entry: entry[1][1]):
+            self.__remove(key)
+            if self.__total_size <= self.max_size:
+                return
+
+    def __remove(self, key: str) -> None:
+        """
+        Delete the surface stored for the given key.
+
+        Keyword arguments:
+            key (str): the key identifying the surface
+        """
+        size, _ = self.__entries.pop(key)
+        self.__total_size -= size
+        try:
+            os.remove(self.__get_path(key))
+        except FileNotFoundError:
+            pass
+
+    def __get_path(self, key: str) -> str:
+        """
+        Returns:
+            str: the path of the file in which the surface identified by the given key is stored.
+
+        Keyword arguments:
+            key (str): the key identifying the surface
+        """
+        return os.path.join(self.directory, key + _FILE_EXTENSION)
+
+
+def _as_traversable(path: Union[str, Traversable]) -> Traversable:
+    """
+    Returns:
+        Traversable: the given path, usable by importlib.resources.as_file.
+
+    Keyword arguments:
+        path (Union[str, Traversable]): a path to a file or a resource of the package
+    """
+    return pathlib.Path(path) if isinstance(path, str) else path
+
+
+def _get_file_signature(path: Optional[str]) -> Optional[str]:
+    """
+    Returns:
+        Optional[str]: a string identifying the given file and its last modification, None if no path is given.
+
+    Keyword arguments:
+        path (Optional[str]): the path to the file, it can also be a resource of the package
+    """
+    if not path:
+        return None
+    with resources.as_file(_as_traversable(path)) as file_path:
+        return f"{file_path}|{os.path.getmtime(file_path)}"
+
+
+def _load_image(path: str) -> pygame.Surface:
+    """
+    Load an image file.
+    The duration of the loading is measured by the instrumentation under the name "load_image".
+
+    Returns:
+        pygame.Surface: the loaded image.
+
+    Keyword arguments:
+        path (str): the path to the file, it can also be a resource of the package
+    """
+    with instrumentation.measure("load_image", path=str(path)):
+        with resources.as_file(_as_traversable(path)) as file_path:
+            return pygame.image.load(file_path)
+
+
+def _load_or_render(
+    key_inputs: Callable[[], Sequence[Any]], render: Callable[[], pygame.Surface]
+) -> pygame.Surface:
+    """
+    Load a rendered surface from the configured sprite cache, or render it and store it in the cache
+    if it is not present yet.
+    The surface is directly rendered if no sprite cache is configured.
+
+    Returns:
+        pygame.Surface: the rendered surface.
+
+    Keyword arguments:
+        key_inputs (Callable[[], Sequence[Any]]): the function giving everything that has an impact on the
+            rendering, only called if a sprite cache is configured
+        render (Callable[[], pygame.Surface]): the function rendering the surface
+    """
+    sprite_cache: Optional[SpriteCache] = _caches["sprites"]
+    if sprite_cache is None:
+        return render()
+    key = sprite_cache.compute_key(key_inputs())
+    surface = sprite_cache.load(key)
+    if surface is None:
+        surface = render()
+        sprite_cache.store(key, surface)
+    return surface
@@ -0,0 +1,133 @@
+"""
+Defines ChromeTraceExporter class, exporting the measures of the instrumentation as trace events
+in the Chrome trace event format, to view the costs of the menus on the same timeline as the rest of a game
+with tools such as chrome://tracing or Perfetto.
+
+The exported operations are the initialization of the rendering of menus ("init_render"), the wrapping of
+texts ("wrap_text"), the loading of images ("load_image"), the displaying of each menu ("display" and
+"display_invalidated"), the drawing of the menus displayed by a MenuManager ("display_batch"), the execution
+of button callbacks ("callback") and the rebuild of released menus ("rebuild_render_resources").
+
+The "display" operation of a menu only covers the preparation of its draw list. The drawing is measured
+separately as "display_batch": once for all the menus displayed by MenuManager.display, once per menu for
+InfoBox.display.
+
+The timestamps are given by time.perf_counter, in microseconds, so that events recorded by the game with the same
+clock are aligned with the ones of the menus.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Any, Optional
+
+from . import instrumentation
+
+TRACE_CATEGORY = "pygamepopup"
+
+
+class ChromeTraceExporter:
+    """
+    This class collects the measures of the instrumentation as complete trace events ("X" phase).
+
+    Nothing is collected until start is called, and the instrumentation keeps its negligible cost
+    as long as it is not enabled.
+
+    Keyword arguments:
+        time_origin (float): the moment in seconds, as given by time.perf_counter, that should be the zero
+            of the timestamps of the events, defaults to 0
+
+    Attributes:
+        time_origin (float): the moment in seconds that is the zero of the timestamps of the events
+        events (list[dict[str, Any]]): the collected trace events in order of completion
+    """
+
+    def __init__(self, time_origin: float = 0) -> None:
+        self.time_origin: float = time_origin
+        self.events: list[dict[str, Any]] = []
+        self.__is_started: bool = False
+        self.__has_enabled_instrumentation: bool = False
+
+    def start(self) -> None:
+        """
+        Start collecting the measures, enabling the instrumentation if it is not already enabled.
+        """
+        if self.__is_started:
+            return
+        self.__has_enabled_instrumentation = not instrumentation.is_enabled()
+        instrumentation.add_listener(self.add_measure)
+        instrumentation.enable()
+        self.__is_started = True
+
+    def stop(self) -> None:
+        """
+        Stop collecting the measures, disabling the instrumentation if it has been enabled by start.
+        The collected events are kept.
+        """
+        if not self.__is_started:
+            return
+        instrumentation.remove_listener(self.add_measure)
+        if self.__has_enabled_instrumentation:
+            instrumentation.disable()
+        self.__is_started = False
+
+    def __enter__(self) -> ChromeTraceExporter:
+        self.start()
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        self.stop()
+
+    def add_measure(
+        self,
+        name: str,
+        start: float,
+        duration: float,
+        arguments: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """
+        Add a measure as a trace event, on the current thread of the current process.
+
+        Keyword arguments:
+            name (str): the name of the measured operation
+            start (float): the moment the operation started, in seconds as given by time.perf_counter
+            duration (float): the duration of the operation in seconds
+            arguments (Optional[dict[str, Any]]): the details about the operation
+        """
+        self.events.append(
+            {
+                "name": name,
+                "cat": TRACE_CATEGORY,
+                "ph": "X",
+                "ts": (start - self.time_origin) * 1_000_000,
+                "dur": duration * 1_000_000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": {key: str(value) for key, value in (arguments or {}).items()},
+            }
+        )
+
+    def clear(self) -> None:
+        """
+        Forget all the collected events.
+        """
+        self.events.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns:
+            dict[str, Any]: the collected events in the JSON object format of the Chrome trace event format.
+        """
+        return {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+
+    def save(self, path: str) -> None:
+        """
+        Write the collected events to a JSON file that can be opened by trace viewers.
+
+        Keyword arguments:
+            path (str): the path of the file
+        """
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump(self.to_dict(), trace_file)
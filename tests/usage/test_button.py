@@ -1,4 +1,4 @@
-from src.pygamepopup.components import Button
+from src.pygamepopup.components import Button, InfoBox
 
 
 def test_standard_button_init():
@@ -24,3 +24,17 @@ def test_button_hitbox_does_not_include_margin():
         margin[1] + size[1] - 1,
     )
     assert button.get_rect().collidepoint(position_bottom_right_button_box)
+
+
+def test_hovered_button_is_highlighted_again_once_not_pending(screen):
+    button = Button(title="Save")
+    menu = InfoBox("Pending", [[button]])
+    menu.init_render(screen)
+    menu.motion(button.get_rect().center)
+
+    button.set_pending(True)
+    menu.motion(button.get_rect().center)
+    assert button.content is button.sprite
+
+    button.set_pending(False)
+    assert button.content is button.sprite_hover
@@ -0,0 +1,88 @@
+import pygame
+
+from src.pygamepopup.components import Button, InfoBox
+from src.pygamepopup.culling import compute_opaque_rect
+from src.pygamepopup.menu_manager import MenuManager
+
+
+def test_opaque_rect_excludes_transparent_corners():
+    surface = pygame.Surface((100, 60), pygame.SRCALPHA)
+    pygame.draw.rect(
+        surface, pygame.Color("white"), surface.get_rect(), border_radius=10
+    )
+
+    opaque_rect = compute_opaque_rect(surface)
+
+    assert opaque_rect.center == surface.get_rect().center
+    assert opaque_rect.width > 80
+    assert (
+        pygame.mask.from_surface(surface, 254).overlap_area(
+            pygame.mask.Mask(opaque_rect.size, fill=True), opaque_rect.topleft
+        )
+        == opaque_rect.width * opaque_rect.height
+    )
+
+
+def test_transparent_surface_has_no_opaque_rect():
+    surface = pygame.Surface((50, 50), pygame.SRCALPHA)
+    surface.fill((255, 255, 255, 128))
+
+    assert compute_opaque_rect(surface) is None
+
+
+def test_menus_hidden_behind_opaque_menu_are_not_drawn(screen):
+    menu_manager = MenuManager(screen)
+    hidden_menu = InfoBox("Hidden", [[Button(title="Hidden")]], width=200)
+    menu_manager.open_menu(hidden_menu)
+    menu_manager.open_menu(
+        InfoBox("On top", [[Button(title="A")], [Button(title="B")]], width=300)
+    )
+
+    menu_manager.display()
+    hidden_menu.move_to(
+        (
+            menu_manager.active_menu.get_rect().centerx
+            - hidden_menu.get_rect().width // 2,
+            menu_manager.active_menu.get_rect().centery
+            - hidden_menu.get_rect().height // 2,
+        )
+    )
+    menu_manager.display()
+
+    assert menu_manager.active_menu.get_opaque_rect().contains(hidden_menu.get_rect())
+    assert menu_manager.culling_statistics.occluded_menus == 1
+    assert not hidden_menu.is_dirty
+
+    menu_manager.occlusion_culling = False
+    menu_manager.culling_statistics.reset()
+    menu_manager.display()
+
+    assert menu_manager.culling_statistics.occluded_menus == 0
+
+
+def test_elements_outside_of_the_screen_are_not_drawn(screen):
+    menu_manager = MenuManager(screen)
+    menu = InfoBox(
+        "Overflowing",
+        [[Button(title=str(index))] for index in range(8)],
+        width=200,
+        position=(100, screen.get_height() - 150),
+    )
+    menu_manager.open_menu(menu)
+
+    menu_manager.display()
+
+    assert menu_manager.culling_statistics.offscreen_elements > 0
+    assert menu_manager.culling_statistics.offscreen_menus == 0
+    assert screen.get_clip() == screen.get_rect()
+
+    menu_manager.open_menu(
+        InfoBox(
+            "Outside", [[Button(title="Hidden")]], position=(screen.get_width() + 10, 0)
+        )
+    )
+    menu_manager.culling_statistics.reset()
+    menu_manager.display()
+
+    assert menu_manager.culling_statistics.offscreen_menus == 1
+    assert not menu_manager.active_menu.is_dirty
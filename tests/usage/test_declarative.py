@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from src.pygamepopup.components import Button, TextElement
+from src.pygamepopup.declarative import (
+    LayoutCache,
+    compile_menu,
+    compute_layout_key,
+    load_menu_definition,
+)
+
+MENU_DEFINITION = {
+    "title": "Declarative Menu",
+    "identifier": "declarative_menu",
+    "width": 300,
+    "styles": {"wide_button": {"size": [250, 50]}},
+    "element_grid": [
+        [
+            {
+                "type": "text",
+                "text": "A long enough text that it should be split in several lines",
+            }
+        ],
+        [
+            {
+                "type": "button",
+                "title": "Start",
+                "callback": "start",
+                "style": "wide_button",
+            }
+        ],
+    ],
+}
+
+
+def test_compile_menu_builds_described_elements():
+    menu = compile_menu(MENU_DEFINITION, callbacks={"start": lambda: "started"})
+
+    assert menu.title == "Declarative Menu"
+    assert menu.identifier == "declarative_menu"
+    assert isinstance(menu.element_grid[0][0], TextElement)
+    button = menu.element_grid[1][0]
+    assert isinstance(button, Button)
+    assert button.size == (250, 50)
+    assert button.callback() == "started"
+
+
+def test_compile_menu_with_unknown_callback_raises_value_error():
+    with pytest.raises(ValueError):
+        compile_menu(MENU_DEFINITION, callbacks={})
+
+
+def test_cached_layout_is_reused(screen):
+    layout_cache = LayoutCache()
+    callbacks = {"start": lambda: None}
+    first_menu = compile_menu(MENU_DEFINITION, callbacks, layout_cache)
+    first_menu.init_render(screen)
+    assert len(layout_cache) == 1
+
+    second_menu = compile_menu(MENU_DEFINITION, callbacks, layout_cache)
+    second_menu.init_render(screen)
+
+    assert len(layout_cache) == 1
+    assert second_menu.get_size() == first_menu.get_size()
+    assert second_menu.element_grid[0][0].lines == first_menu.element_grid[0][0].lines
+    assert len(first_menu.element_grid[0][0].lines) > 1
+    assert second_menu.export_layout() == first_menu.export_layout()
+
+
+def test_layout_cache_is_persisted(screen, tmp_path):
+    cache_path = str(tmp_path / "layouts.json")
+    layout_cache = LayoutCache(cache_path)
+    compile_menu(MENU_DEFINITION, {"start": lambda: None}, layout_cache).init_render(
+        screen
+    )
+    layout_cache.save()
+
+    reloaded_cache = LayoutCache(cache_path)
+
+    assert reloaded_cache.get(compute_layout_key(MENU_DEFINITION)) is not None
+
+
+def test_load_menu_definition_from_json(tmp_path):
+    definition_path = tmp_path / "menu.json"
+    definition_path.write_text(json.dumps(MENU_DEFINITION))
+
+    assert load_menu_definition(str(definition_path)) == MENU_DEFINITION
@@ -0,0 +1,59 @@
+import threading
+
+from src.pygamepopup.components import (
+    Button,
+    DynamicButton,
+    ImageButton,
+    InfoBox,
+    TextElement,
+)
+from src.pygamepopup.finalization import is_display_available
+from src.pygamepopup.menu_manager import MenuManager
+
+
+def build_shop_menu(screen, result):
+    buttons = [Button(title=f"Item {index}") for index in range(20)]
+    menu = InfoBox(
+        "Shop",
+        [[TextElement("Buy something")]]
+        + [[buttons[index], buttons[index + 1]] for index in range(0, 20, 2)]
+        + [
+            [
+                DynamicButton(lambda value: None, [{"label": "On"}], 0, "Sound"),
+                ImageButton(title="Image"),
+            ]
+        ],
+    )
+    menu.init_render(screen)
+    result["display_available"] = is_display_available()
+    result["menu"] = menu
+
+
+def test_menu_built_in_worker_thread_is_finalized_when_opened(screen):
+    result = {}
+    worker = threading.Thread(target=build_shop_menu, args=(screen, result))
+    worker.start()
+    worker.join()
+    menu = result["menu"]
+
+    assert not result["display_available"]
+    assert not menu.buttons[0]._are_sprites_finalized
+
+    menu_manager = MenuManager(screen)
+    menu_manager.open_menu(menu)
+    menu_manager.display()
+
+    assert all(button._are_sprites_finalized for button in menu.buttons)
+
+
+def test_layout_is_reused_when_render_is_initialized_again(screen):
+    text = TextElement("A text long enough to be split in several lines " * 3)
+    menu = InfoBox("Reopened", [[text]])
+    menu.init_render(screen)
+    layout = menu.export_layout()
+    content = text.content
+
+    menu.init_render(screen)
+
+    assert menu.export_layout() == layout
+    assert text.content is content
@@ -0,0 +1,61 @@
+import pygame
+import pytest
+
+from src.pygamepopup.components import Gauge, InfoBox
+from src.pygamepopup.components.gauge import _render_nine_slice
+from src.pygamepopup.menu_manager import MenuManager
+
+
+def test_value_change_redraws_only_fill_delta():
+    gauge = Gauge(value=0.25, size=(212, 30), padding=6)
+    content = gauge.content
+    gauge.is_dirty = False
+
+    gauge.set_value(0.5)
+
+    assert gauge.content is content
+    assert gauge.get_dirty_area() == pygame.Rect(56, 6, 50, 18)
+
+    reference = Gauge(value=0.5, size=(212, 30), padding=6)
+    for x in range(0, 212, 7):
+        for y in range(0, 30, 5):
+            assert content.get_at((x, y)) == reference.content.get_at((x, y))
+
+
+def test_value_is_clamped_and_unchanged_fill_is_not_redrawn():
+    gauge = Gauge(value=50, maximum=100)
+    gauge.set_value(150)
+    gauge.is_dirty = False
+
+    gauge.set_value(100)
+
+    assert gauge.value == 100
+    assert not gauge.is_dirty
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        Gauge(minimum=1, maximum=1)
+
+
+def test_nine_slice_keeps_corners():
+    sprite = pygame.Surface((10, 10), pygame.SRCALPHA)
+    sprite.fill(pygame.Color("red"), pygame.Rect(0, 0, 3, 3))
+
+    scaled_sprite = _render_nine_slice(sprite, (40, 20), 3)
+
+    assert scaled_sprite.get_bounding_rect() == pygame.Rect(0, 0, 3, 3)
+
+
+def test_gauge_is_redrawn_partially_by_menu_manager(screen):
+    gauge = Gauge()
+    menu_manager = MenuManager(screen)
+    menu_manager.open_menu(InfoBox("Loading", [[gauge]], has_close_button=False))
+    menu_manager.display()
+
+    gauge.set_value(0.1)
+    updated_rects = menu_manager.display_invalidated()
+
+    assert len(updated_rects) == 1
+    assert updated_rects[0].width < gauge.get_rect().width
+    assert gauge.get_rect().contains(updated_rects[0])
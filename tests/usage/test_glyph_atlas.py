@@ -0,0 +1,161 @@
+import pygame
+import pytest
+
+from src.pygamepopup import instrumentation
+from src.pygamepopup.components import Button, ImageButton, TextElement
+from src.pygamepopup.configuration import _default_sprites
+from src.pygamepopup.constants import WHITE
+from src.pygamepopup.glyph_atlas import GlyphAtlas
+from src.pygamepopup.memory import get_shared_caches_memory_usage
+
+
+@pytest.fixture
+def glyph_atlas():
+    return GlyphAtlas(pygame.font.SysFont("arial", 16))
+
+
+def test_text_is_composed_from_glyphs(glyph_atlas):
+    font = pygame.font.SysFont("arial", 16)
+    width = sum(font.size(character)[0] for character in "Gold: 42")
+
+    rendered_text = glyph_atlas.render("Gold: 42", True, WHITE)
+
+    assert rendered_text.get_size() == (width, font.get_height())
+    assert glyph_atlas.size("Gold: 42") == rendered_text.get_size()
+
+
+def test_missing_characters_are_added(glyph_atlas):
+    assert "é" not in glyph_atlas.get_characters()
+
+    glyph_atlas.render("é", True, WHITE)
+
+    assert "é" in glyph_atlas.get_characters()
+
+
+class RenderCountingFont(pygame.font.Font):
+    def __init__(self, *arguments):
+        super().__init__(*arguments)
+        self.rendered_texts = []
+
+    def render(self, text, *arguments):
+        self.rendered_texts.append(text)
+        return super().render(text, *arguments)
+
+
+def test_only_missing_characters_are_rendered():
+    font = RenderCountingFont(None, 20)
+    glyph_atlas = GlyphAtlas(font, "0123456789" * 30)
+    rendered_digits = pygame.image.tobytes(glyph_atlas.render("0123456789"), "RGBA")
+    font.rendered_texts.clear()
+
+    glyph_atlas.render("9é", True, WHITE)
+
+    assert font.rendered_texts == ["é"]
+    assert (
+        pygame.image.tobytes(glyph_atlas.render("0123456789"), "RGBA")
+        == rendered_digits
+    )
+
+
+def test_render_into_existing_surface(glyph_atlas):
+    target = pygame.Surface((100, 30), pygame.SRCALPHA)
+
+    covered_area = glyph_atlas.render_into(target, "88", (10, 5), pygame.Color("red"))
+
+    assert covered_area.topleft == (10, 5)
+    assert covered_area.size == glyph_atlas.size("88")
+    assert target.get_bounding_rect().colliderect(covered_area)
+    red_pixels = [
+        target.get_at((x, y))
+        for x in range(covered_area.left, covered_area.right)
+        for y in range(covered_area.top, covered_area.bottom)
+        if target.get_at((x, y)).a == 255
+    ]
+    assert red_pixels and all(pixel.g == 0 and pixel.b == 0 for pixel in red_pixels)
+
+
+def test_atlas_can_be_used_by_components(glyph_atlas):
+    text_element = TextElement("Time left: 10", font=glyph_atlas)
+    button = Button(title="Score: 12", font=glyph_atlas)
+
+    assert text_element.size == glyph_atlas.size("Time left: 10")
+    assert button.size[0] > 0
+
+
+def test_components_draw_glyphs_on_their_final_sprite(glyph_atlas, monkeypatch):
+    button = Button(title="Score: 12", font=glyph_atlas)
+    text_element = TextElement("Time left: 10 seconds", font=glyph_atlas)
+    expected_sprite = button.render_sprite(
+        _default_sprites["button_background"]["inactive"],
+        Button.render_text_lines(["Score: 12"], WHITE, glyph_atlas),
+    )
+    monkeypatch.setattr(
+        GlyphAtlas,
+        "render",
+        lambda *args: pytest.fail("Text lines should be drawn on the final sprite"),
+    )
+
+    drawn_button = Button(title="Score: 12", font=glyph_atlas)
+    text_element.wrap(glyph_atlas.size("Time left:")[0] + 10)
+
+    assert pygame.image.tobytes(drawn_button.sprite, "RGBA") == pygame.image.tobytes(
+        expected_sprite, "RGBA"
+    )
+    assert len(text_element.lines) > 1
+
+
+def test_load_bmfont(tmp_path):
+    page = pygame.Surface((8, 8), pygame.SRCALPHA)
+    page.fill(WHITE, pygame.Rect(0, 0, 4, 8))
+    pygame.image.save(page, str(tmp_path / "page.png"))
+    (tmp_path / "font.fnt").write_text(
+        'info face="Test" size=8\n'
+        "common lineHeight=10 base=8 scaleW=8 scaleH=8 pages=1\n"
+        'page id=0 file="page.png"\n'
+        "chars count=1\n"
+        "char id=49 x=0 y=0 width=4 height=8 xoffset=1 yoffset=2 xadvance=6 page=0\n",
+        encoding="utf-8",
+    )
+
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        glyph_atlas = GlyphAtlas.load_bmfont(str(tmp_path / "font.fnt"))
+    finally:
+        instrumentation.disable()
+    rendered_text = glyph_atlas.render("11")
+
+    assert "load_image" in instrumentation.get_timings()
+
+    assert rendered_text.get_size() == (12, 10)
+    assert rendered_text.get_at((1, 2)).a == 255
+    assert rendered_text.get_at((0, 2)).a == 0
+    assert glyph_atlas.size("x1") == (6, 10)
+
+
+def test_atlases_are_reported_as_shared_cache(glyph_atlas):
+    shared_caches = get_shared_caches_memory_usage()
+
+    assert shared_caches["glyph_atlases"] >= glyph_atlas.get_memory_usage() > 0
+
+
+def get_text_position(font):
+    button = ImageButton(title="Inventory", font=font)
+    untitled_button = ImageButton(font=font)
+    changed_pixels = [
+        (x, y)
+        for x in range(button.size[0])
+        for y in range(button.size[1])
+        if button.sprite.get_at((x, y)) != untitled_button.sprite.get_at((x, y))
+    ]
+    return min(x for x, _ in changed_pixels), min(y for _, y in changed_pixels)
+
+
+def test_image_button_draws_atlas_text_next_to_its_frame():
+    font = pygame.font.SysFont("arial", 16)
+
+    atlas_x, atlas_y = get_text_position(GlyphAtlas(font))
+    font_x, font_y = get_text_position(font)
+
+    assert atlas_x == font_x
+    assert abs(atlas_y - font_y) <= 1
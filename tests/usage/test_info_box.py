@@ -1,3 +1,4 @@
+import pygame
 import pytest
 
 from src.pygamepopup.components import InfoBox, Button
@@ -65,3 +66,91 @@ def test_is_position_inside_when_position_is_outside_info_box(screen, static_men
 def test_is_position_inside_when_position_is_inside_info_box(screen, static_menu):
     inside_position = (20, 20)
     assert static_menu.is_position_inside(inside_position)
+
+
+@pytest.mark.parametrize("static_menu", [(0, 0)], indirect=True)
+def test_displayed_menu_is_not_dirty(screen, static_menu):
+    assert not static_menu.is_dirty
+    assert static_menu.display_invalidated(screen) == []
+
+
+@pytest.mark.parametrize("static_menu", [(0, 0)], indirect=True)
+def test_hovering_button_only_invalidates_button(screen, static_menu):
+    button = static_menu.buttons[0]
+    static_menu.motion(button.get_rect().center)
+
+    assert static_menu.is_dirty
+    assert static_menu.display_invalidated(screen) == [button.get_rect()]
+    assert not static_menu.is_dirty
+
+
+@pytest.mark.parametrize("static_menu", [(0, 0)], indirect=True)
+def test_invalidated_menu_is_entirely_redrawn(screen, static_menu):
+    static_menu.invalidate()
+
+    assert static_menu.display_invalidated(screen) == [static_menu.get_rect()]
+
+
+@pytest.mark.parametrize("static_menu", [(0, 0)], indirect=True)
+def test_move_to_translates_elements(screen, static_menu):
+    button = static_menu.buttons[0]
+    button_position = pygame.Vector2(button.position)
+
+    static_menu.move_to((30, 40))
+
+    assert static_menu.position == (30, 40)
+    assert button.position == button_position + pygame.Vector2(30, 40)
+    assert static_menu.is_dirty
+
+
+def test_menu_follows_moving_linked_element(screen):
+    linked_element = pygame.Rect(10, 100, 20, 20)
+    menu = InfoBox(
+        title="Tooltip",
+        element_grid=[],
+        has_close_button=False,
+        element_linked=linked_element,
+        follow_element_linked=True,
+    )
+    menu.init_render(screen)
+    menu.display(screen)
+    initial_position = pygame.Vector2(menu.position)
+
+    linked_element.move_ip(5, 7)
+    updated_rects = menu.display_invalidated(screen)
+
+    assert menu.position == initial_position + pygame.Vector2(5, 7)
+    assert len(updated_rects) == 2
+
+
+@pytest.mark.parametrize("static_menu", [(0, 0)], indirect=True)
+def test_released_render_resources_are_rebuilt_on_display(screen, static_menu):
+    memory_usage = static_menu.get_memory_usage()
+    assert memory_usage > 0
+
+    static_menu.release_render_resources()
+    assert static_menu.get_memory_usage() == 0
+
+    static_menu.display(screen)
+    assert static_menu.get_memory_usage() == memory_usage
+
+
+@pytest.mark.parametrize("static_menu", [(0, 0)], indirect=True)
+def test_draw_list_is_updated_in_place_on_hover(screen, static_menu):
+    button = static_menu.buttons[0]
+    draw_list = static_menu.get_draw_list(screen)
+    assert (button.sprite, button.get_blit()[1]) in draw_list
+
+    static_menu.motion(button.get_rect().center)
+
+    assert static_menu.get_draw_list(screen) is draw_list
+    assert (button.sprite_hover, button.get_blit()[1]) in draw_list
+    assert (button.sprite, button.get_blit()[1]) not in draw_list
+
+
+@pytest.mark.parametrize("static_menu", [(0, 0)], indirect=True)
+def test_move_to_keeps_menu_inside_screen(screen, static_menu):
+    static_menu.move_to((screen.get_width(), -50))
+
+    assert screen.get_rect().contains(static_menu.get_rect())
+    assert static_menu.get_rect().topright == (screen.get_width(), 0)
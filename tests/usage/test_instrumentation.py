@@ -0,0 +1,41 @@
+import pytest
+
+from src.pygamepopup import instrumentation
+
+
+@pytest.fixture
+def enabled_instrumentation():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_nothing_is_recorded_when_disabled():
+    instrumentation.reset()
+    with instrumentation.measure("operation"):
+        pass
+
+    assert instrumentation.get_timings() == {}
+
+
+def test_measures_are_recorded_and_forwarded(enabled_instrumentation):
+    received_measures = []
+
+    def listener(name, start, duration, arguments):
+        received_measures.append((name, arguments))
+
+    instrumentation.add_listener(listener)
+    with instrumentation.measure("operation", detail="value"):
+        pass
+    instrumentation.remove_listener(listener)
+
+    assert len(instrumentation.get_timings()["operation"]) == 1
+    assert received_measures == [("operation", {"detail": "value"})]
+
+
+def test_compute_percentiles():
+    percentiles = instrumentation.compute_percentiles(list(range(1, 101)))
+
+    assert percentiles == {"p50": 50, "p95": 95, "p99": 99}
@@ -0,0 +1,144 @@
+import pytest
+
+from src.pygamepopup import layout
+from src.pygamepopup.components import InfoBox, TextElement
+from src.pygamepopup.constants import MARGIN_BOX_HORIZONTAL
+
+
+def build_metrics():
+    return layout.GridMetrics(
+        row_lengths=[1, 3, 0, 2],
+        column_spans=[1, 1, 2, 1, 1, 3],
+        widths=[120, 40, 60, 30, 80, 100],
+        heights=[30, 20, 45, 25, 10, 50],
+        margins_top=[10, 0, 5, 0, 0, 2],
+        margins_horizontal=[0, 10, 0, 4, 0, 6],
+    )
+
+
+def test_grid_layout_splits_width_evenly_between_columns():
+    row_heights, offsets, height = layout.compute_grid_layout(
+        build_metrics(), 400, 5, 20, vectorize=False
+    )
+
+    assert row_heights == [35, 50, 0, 55]
+    assert offsets[0] == (200 - 60, 20 + 10)
+    assert offsets[1:4] == [(50 - 20, 55), (200 - 30, 55 + 5), (350 - 15, 55)]
+    assert offsets[4:] == [(50 - 40, 105), (250 - 50, 105 + 2)]
+    assert height == 20 + 35 + 50 + 55 + 20
+
+
+def test_vectorized_layout_matches_python_layout():
+    pytest.importorskip("numpy")
+    metrics = build_metrics()
+
+    assert layout.compute_grid_layout(
+        metrics, 400, 5, 20, vectorize=True
+    ) == layout.compute_grid_layout(metrics, 400, 5, 20, vectorize=False)
+    assert layout.compute_text_container_widths(
+        metrics, 380, vectorize=True
+    ) == layout.compute_text_container_widths(metrics, 380, vectorize=False)
+
+
+def test_large_grid_is_laid_out_row_after_row(screen):
+    grid = [
+        [TextElement(f"Cell {row}:{column}") for column in range(4)]
+        for row in range(100)
+    ]
+    menu = InfoBox("Large grid", grid, width=800)
+
+    menu.init_render(screen)
+
+    first_row_y = grid[0][0].position[1]
+    second_row_y = grid[1][0].position[1]
+    assert all(element.position[1] == first_row_y for element in grid[0])
+    assert grid[-1][0].position[1] == first_row_y + 99 * (second_row_y - first_row_y)
+
+
+def test_grid_layout_columns_widths():
+    grid_layout = layout.GridLayout(
+        [100, layout.Column("auto"), "1fr", "3fr"], column_spacing=10
+    )
+    grid_layout.measure(
+        layout.GridMetrics(
+            [2, 2], [1, 1, 1, 3], widths=[50, 70, 40, 300], margins_horizontal=[0] * 4
+        )
+    )
+
+    assert grid_layout.compute_column_widths(500) == [100, 70, 75, 225]
+    assert grid_layout.compute_column_widths(500) is grid_layout.compute_column_widths(
+        500
+    )
+
+    grid_layout.column_spacing = 20
+    assert grid_layout.compute_column_widths(500) == [100, 70, 67, 202]
+
+
+def test_automatic_column_is_measured_once_text_is_wrapped(screen):
+    grid_layout = layout.GridLayout(["auto", 100])
+    long_text = TextElement("A very long description " * 10)
+    unwrapped_width = long_text.get_width()
+    menu = InfoBox(
+        "Wrapped",
+        [[long_text, TextElement("Value")]],
+        width=400,
+        grid_layout=grid_layout,
+    )
+
+    menu.init_render(screen)
+
+    assert len(long_text.lines) > 1
+    automatic_width = grid_layout.compute_column_widths(
+        400 - 2 * MARGIN_BOX_HORIZONTAL
+    )[0]
+    assert automatic_width == long_text.get_width() < unwrapped_width
+
+
+def test_grid_layout_alignment():
+    grid_layout = layout.GridLayout(
+        [layout.Column(100, "left"), layout.Column(100, "right"), 100]
+    )
+    metrics = layout.GridMetrics(
+        [3, 1],
+        [1, 1, 1, 3],
+        widths=[20, 20, 20, 50],
+        heights=[10, 30, 10, 10],
+        margins_top=[0, 0, 0, 0],
+        margins_horizontal=[0, 0, 0, 0],
+    )
+
+    row_heights, offsets, height = grid_layout.compute(metrics, 320, 5, 20, 10)
+
+    assert row_heights == [35, 15]
+    assert offsets == [(10, 20), (190, 20), (250, 20), (10, 55)]
+    assert height == 90
+
+
+def test_menus_sharing_grid_layout_have_aligned_columns(screen):
+    grid_layout = layout.GridLayout(["auto", "1fr"])
+    first_menu = InfoBox(
+        "First",
+        [[TextElement("Name"), TextElement("Value")]],
+        grid_layout=grid_layout,
+    )
+    second_menu = InfoBox(
+        "Second",
+        [[TextElement("Much longer name"), TextElement("Value")]],
+        grid_layout=grid_layout,
+    )
+
+    first_menu.init_render(screen)
+    second_menu.init_render(screen)
+
+    first_value_offset = first_menu.export_layout()["rows"][1]["elements"][1]["offset"]
+    second_value_offset = second_menu.export_layout()["rows"][1]["elements"][1][
+        "offset"
+    ]
+    assert first_value_offset[0] == second_value_offset[0]
+
+
+def test_row_spanning_too_many_columns_is_rejected():
+    grid_layout = layout.GridLayout(["1fr", "1fr"])
+
+    with pytest.raises(ValueError):
+        grid_layout.measure(layout.GridMetrics([3], [1, 1, 1], widths=[10, 10, 10]))
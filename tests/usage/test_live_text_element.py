@@ -0,0 +1,53 @@
+import pygame
+
+from src.pygamepopup.components import InfoBox, LiveTextElement
+from src.pygamepopup.menu_manager import MenuManager
+
+
+def test_text_is_rendered_again_only_on_change():
+    gold = {"amount": 5}
+    live_text = LiveTextElement(
+        lambda: gold["amount"], text_format="Gold: {}", width=120
+    )
+    content = live_text.content
+    live_text.is_dirty = False
+
+    assert not live_text.update()
+    assert not live_text.is_dirty
+
+    gold["amount"] = 1200
+    assert live_text.update()
+    assert live_text.content is content
+    assert live_text.size == (120, content.get_height())
+    assert live_text.is_dirty
+    assert live_text.get_dirty_area() is not None
+
+
+def test_value_can_be_notified():
+    live_text = LiveTextElement(value=3, text_format=lambda value: f"{value} s")
+
+    assert live_text.set_value(2)
+    assert live_text.lines == ["2 s"]
+    assert not live_text.set_value(2)
+
+
+def test_menu_manager_redraws_only_changed_text(screen):
+    frames = {"count": 0}
+    live_text = LiveTextElement(
+        lambda: frames["count"], text_format="FPS: {}", width=200
+    )
+    menu = InfoBox("Stats", [[live_text]], has_close_button=False)
+    menu_manager = MenuManager(screen)
+    menu_manager.open_menu(menu)
+    menu_manager.display()
+    size = live_text.size
+
+    assert menu_manager.display_invalidated() == []
+
+    frames["count"] = 60
+    updated_rects = menu_manager.display_invalidated()
+
+    assert len(updated_rects) == 1
+    assert live_text.get_rect().contains(updated_rects[0])
+    assert live_text.size == size
+    assert pygame.Rect(updated_rects[0]).width < live_text.get_rect().width
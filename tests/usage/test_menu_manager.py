@@ -1,5 +1,9 @@
+import asyncio
+
+import pygame
 import pytest
 
+from src.pygamepopup import instrumentation
 from src.pygamepopup.components import InfoBox, Button
 from src.pygamepopup.menu_manager import MenuManager
 
@@ -225,3 +229,228 @@ def test_close_all_occurrences(sample_menu_manager, sample_menu, menu_with_ident
 
     assert has_closing_been_done
     assert sample_menu_manager.background_menus == [sample_menu, sample_menu]
+
+
+def test_display_invalidated_redraws_everything_after_opening_menu(
+    sample_menu_manager, sample_menu
+):
+    sample_menu_manager.open_menu(sample_menu)
+
+    assert sample_menu_manager.display_invalidated() == [
+        sample_menu_manager.screen.get_rect()
+    ]
+
+
+def test_display_invalidated_redraws_nothing_when_nothing_changed(
+    sample_menu_manager, sample_menu
+):
+    sample_menu_manager.open_menu(sample_menu)
+    sample_menu_manager.display()
+
+    assert sample_menu_manager.display_invalidated() == []
+
+
+def test_resize_centers_menus_on_new_screen(sample_menu_manager, sample_menu):
+    sample_menu_manager.open_menu(sample_menu)
+    sample_menu_manager.display()
+    resized_screen = pygame.Surface((800, 600))
+
+    sample_menu_manager.resize(resized_screen)
+
+    assert sample_menu_manager.screen == resized_screen
+    menu_width, menu_height = sample_menu.get_size()
+    assert sample_menu.position == (400 - menu_width // 2, 300 - menu_height // 2)
+
+
+def test_memory_budget_releases_least_recently_displayed_menus(screen):
+    hidden_menus = [
+        InfoBox(
+            title=f"Hidden menu {index}",
+            element_grid=[[Button(title="A sample button")]],
+            visible_on_background=False,
+        )
+        for index in range(3)
+    ]
+    menu_manager = MenuManager(screen)
+    for menu in hidden_menus[:2]:
+        menu_manager.open_menu(menu)
+        menu_manager.display()
+    menu_manager.memory_budget = menu_manager.get_memory_usage()
+
+    menu_manager.open_menu(hidden_menus[2])
+
+    assert hidden_menus[0].are_render_resources_released
+    assert not hidden_menus[1].are_render_resources_released
+    assert menu_manager.get_memory_usage() <= menu_manager.memory_budget
+
+
+def test_hidden_background_menus_are_released_and_rebuilt(screen):
+    hidden_menu = InfoBox(
+        title="Hidden menu",
+        element_grid=[[Button(title="A sample button")]],
+        visible_on_background=False,
+    )
+    menu_manager = MenuManager(screen, release_hidden_menus=True)
+    menu_manager.open_menu(hidden_menu)
+    menu_manager.display()
+    instrumentation.reset()
+    instrumentation.enable()
+
+    menu_manager.open_menu(
+        InfoBox(title="Foreground menu", element_grid=[[Button(title="Other")]])
+    )
+    assert hidden_menu.are_render_resources_released
+    assert hidden_menu.get_memory_usage() == 0
+
+    menu_manager.close_active_menu()
+    instrumentation.disable()
+
+    assert not hidden_menu.are_render_resources_released
+    assert len(instrumentation.get_timings()["rebuild_render_resources"]) == 1
+
+
+def test_coroutine_callback_is_scheduled_on_event_loop(screen):
+    event_loop = asyncio.new_event_loop()
+    calls = []
+
+    async def save_game():
+        await asyncio.sleep(0)
+        calls.append("saved")
+
+    save_button = Button(title="Save", callback=save_game)
+    menu_manager = MenuManager(screen, event_loop=event_loop)
+    menu_manager.open_menu(InfoBox("Save menu", [[save_button]]))
+    menu_manager.display()
+
+    menu_manager.click(1, save_button.get_rect().center)
+
+    assert save_button.is_pending and save_button.disabled
+    assert menu_manager.has_pending_callbacks()
+    assert calls == []
+
+    event_loop.run_until_complete(asyncio.sleep(0.01))
+    menu_manager.display()
+
+    assert calls == ["saved"]
+    assert not save_button.is_pending and not save_button.disabled
+    assert not menu_manager.has_pending_callbacks()
+    event_loop.close()
+
+
+def test_coroutine_callback_uses_running_event_loop(screen):
+    async def load_level():
+        return "loaded"
+
+    load_button = Button(title="Load", callback=load_level)
+    menu_manager = MenuManager(screen, disable_pending_buttons=False)
+    menu_manager.open_menu(InfoBox("Load menu", [[load_button]]))
+    menu_manager.display()
+
+    async def game_loop():
+        menu_manager.click(1, load_button.get_rect().center)
+        assert not load_button.disabled
+        while menu_manager.has_pending_callbacks():
+            await asyncio.sleep(0)
+            menu_manager.display()
+
+    asyncio.run(game_loop())
+
+
+def test_queued_actions_are_spread_over_frames(screen, other_menu):
+    third_menu = InfoBox("Third menu", [[Button(title="Nested")]])
+    menu_manager = MenuManager(screen, action_time_budget=0)
+
+    def open_nested_menus():
+        menu_manager.open_menu(other_menu)
+        menu_manager.open_menu(third_menu)
+
+    open_button = Button(title="Open", callback=open_nested_menus)
+    menu_manager.open_menu(InfoBox("Start", [[open_button]]))
+    menu_manager.display()
+
+    menu_manager.click(1, open_button.get_rect().center)
+    assert menu_manager.get_queued_actions_count() == 1
+
+    menu_manager.display()
+    assert menu_manager.get_queued_actions_count() == 2
+    menu_manager.display()
+    assert menu_manager.active_menu == other_menu
+    menu_manager.display()
+    assert menu_manager.active_menu == third_menu
+    assert menu_manager.get_queued_actions_count() == 0
+
+
+def test_queued_actions_within_budget_are_run_in_same_frame(screen):
+    menu_manager = MenuManager(screen, action_time_budget=60)
+    calls = []
+    for index in range(3):
+        menu_manager.enqueue_action(lambda index=index: calls.append(index))
+
+    menu_manager.display()
+
+    assert calls == [0, 1, 2]
+
+
+def test_latency_is_measured_per_menu(screen, sample_menu, other_menu):
+    menu_manager = MenuManager(screen, track_latency=True)
+    open_button = Button(
+        title="Open", callback=lambda: menu_manager.open_menu(other_menu)
+    )
+    menu_manager.open_menu(InfoBox("Start", [[open_button]], identifier="Start"))
+    menu_manager.display()
+
+    menu_manager.click(1, open_button.get_rect().center)
+    menu_manager.display()
+    menu_manager.motion((0, 0))
+    menu_manager.display()
+
+    latencies = menu_manager.get_latencies()
+    assert list(latencies) == ["Start"]
+    assert len(latencies["Start"]) == 1
+    percentiles = menu_manager.get_latency_percentiles()
+    assert set(percentiles["Start"]) == {"p50", "p95", "p99"}
+    assert percentiles["Start"]["p99"] >= 0
+
+    menu_manager.reset_latencies()
+    assert menu_manager.get_latency_percentiles() == {}
+
+
+def test_latency_is_not_measured_by_default(screen, sample_menu):
+    menu_manager = MenuManager(screen)
+    menu_manager.open_menu(sample_menu)
+    menu_manager.display()
+    menu_manager.click(1, (0, 0))
+    menu_manager.display()
+
+    assert menu_manager.get_latencies() == {}
+
+
+def test_queued_actions_are_run_once_per_partial_display(screen, sample_menu):
+    menu_manager = MenuManager(screen, action_time_budget=0)
+    calls = []
+    for index in range(2):
+        menu_manager.enqueue_action(lambda index=index: calls.append(index))
+    menu_manager.open_menu(sample_menu)
+
+    menu_manager.display_invalidated()
+
+    assert calls == [0]
+
+
+def test_menu_changes_of_queued_action_keep_their_order(screen, other_menu):
+    menu_manager = MenuManager(screen, action_time_budget=0)
+
+    def open_and_close():
+        menu_manager.open_menu(other_menu)
+        menu_manager.close_active_menu()
+
+    start_menu = InfoBox("Start", [[Button(title="Open", callback=open_and_close)]])
+    menu_manager.open_menu(start_menu)
+    menu_manager.display()
+    menu_manager.click(1, start_menu.buttons[0].get_rect().center)
+
+    while menu_manager.get_queued_actions_count():
+        menu_manager.display()
+
+    assert menu_manager.active_menu == start_menu
+    assert menu_manager.background_menus == []
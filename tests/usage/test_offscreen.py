@@ -0,0 +1,60 @@
+import os
+
+from src.pygamepopup.components import InfoBox, Button, TextElement
+from src.pygamepopup.offscreen import (
+    render_menu,
+    render_menu_to_png,
+    render_menus_in_batch,
+)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def build_item_card(item_name):
+    return InfoBox(
+        title=item_name,
+        element_grid=[[TextElement(f"A description of {item_name}")]],
+        has_close_button=False,
+    )
+
+
+def test_render_menu_on_surface_of_menu_size():
+    menu = InfoBox(
+        title="My Test Menu",
+        element_grid=[[Button(title="A sample button", callback=lambda: None)]],
+    )
+
+    surface = render_menu(menu)
+
+    assert surface.get_size() == menu.get_size()
+    assert menu.get_rect().topleft == (0, 0)
+
+
+def test_render_menu_to_png():
+    assert render_menu_to_png(build_item_card("Sword")).startswith(PNG_SIGNATURE)
+
+
+def test_render_menus_in_batch_keeps_order():
+    item_names = ["Sword", "A shield with a much longer name"]
+
+    images = render_menus_in_batch(item_names, build_item_card, processes=2)
+
+    assert len(images) == len(item_names)
+    assert all(image.startswith(PNG_SIGNATURE) for image in images)
+    assert images[0] != images[1]
+
+
+def build_item_card_on_dummy_driver(item_name):
+    if os.environ["SDL_VIDEODRIVER"] != "dummy":
+        raise RuntimeError("Workers should use the dummy video driver")
+    return build_item_card(item_name)
+
+
+def test_workers_use_dummy_video_driver(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "offscreen")
+
+    images = render_menus_in_batch(
+        ["Sword"], build_item_card_on_dummy_driver, processes=1
+    )
+
+    assert images[0].startswith(PNG_SIGNATURE)
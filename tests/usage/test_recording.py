@@ -0,0 +1,63 @@
+from src.pygamepopup.components import Button, InfoBox
+from src.pygamepopup.menu_manager import MenuManager
+from src.pygamepopup.recording import InputRecorder, InputRecording, replay_recording
+
+
+def build_menu_manager(screen):
+    menu_manager = MenuManager(screen)
+
+    def open_options():
+        menu_manager.open_menu(
+            InfoBox("Options", [[Button(title="Sound")]], identifier="options")
+        )
+
+    menu_manager.open_menu(
+        InfoBox(
+            "Main menu",
+            [[Button(title="Options", callback=open_options)]],
+            identifier="main",
+        )
+    )
+    menu_manager.display()
+    return menu_manager
+
+
+def record_session(screen):
+    menu_manager = build_menu_manager(screen)
+    recorder = InputRecorder(menu_manager)
+    options_button = menu_manager.active_menu.buttons[0]
+    menu_manager.motion(options_button.get_rect().center)
+    menu_manager.display()
+    menu_manager.click(1, options_button.get_rect().center)
+    menu_manager.display()
+    menu_manager.motion((0, 0))
+    menu_manager.display()
+    recorder.detach()
+    return recorder.recording
+
+
+def test_recorder_captures_inputs_and_menu_stack(screen):
+    recording = record_session(screen)
+
+    assert [event["type"] for event in recording.events] == [
+        "motion",
+        "display",
+        "click",
+        "display",
+        "motion",
+        "display",
+    ]
+    assert recording.events[2]["menus"] == ["main"]
+    assert recording.events[4]["menus"] == ["main", "options"]
+
+
+def test_saved_recording_is_replayed_identically(screen, tmp_path):
+    record_session(screen).save(tmp_path / "session.json")
+    recording = InputRecording.load(tmp_path / "session.json")
+
+    report = replay_recording(recording, build_menu_manager)
+
+    assert report.mismatches == []
+    assert len(report.frame_durations) == 3
+    assert len(report.input_durations) == 3
+    assert set(report.get_summary()["frames"]) == {"p50", "p95", "p99", "max"}
@@ -0,0 +1,75 @@
+import pygame
+import pytest
+
+from src.pygamepopup.components import InfoBox, RichTextElement, TextElement
+from src.pygamepopup.menu_manager import MenuManager
+from src.pygamepopup.render_backends import SurfaceBackend, TextureBackend
+
+video = pytest.importorskip("pygame._sdl2.video")
+
+
+@pytest.fixture
+def renderer():
+    window = video.Window("Render backend test", size=(500, 500), hidden=True)
+    yield video.Renderer(window, accelerated=0)
+    window.destroy()
+
+
+def build_menu():
+    return InfoBox(
+        "Render backend",
+        [[TextElement("Drawn through textures")]],
+        has_vertical_separator=True,
+    )
+
+
+def test_texture_backend_draws_like_surface_backend(screen, renderer):
+    surface = pygame.Surface(screen.get_size())
+    surface_menu_manager = MenuManager(SurfaceBackend(surface))
+    surface_menu_manager.open_menu(build_menu())
+    surface_menu_manager.display()
+
+    texture_menu_manager = MenuManager(TextureBackend(renderer))
+    texture_menu_manager.open_menu(build_menu())
+    renderer.draw_color = (0, 0, 0, 255)
+    renderer.clear()
+    texture_menu_manager.display()
+    rendered = renderer.to_surface()
+
+    menu_rect = texture_menu_manager.active_menu.get_rect()
+    assert menu_rect == surface_menu_manager.active_menu.get_rect()
+    for point in (menu_rect.center, (menu_rect.x + 30, menu_rect.y + 30)):
+        assert rendered.get_at(point) == surface.get_at(point)
+
+
+def test_textures_are_uploaded_once(renderer):
+    backend = TextureBackend(renderer)
+    menu_manager = MenuManager(backend)
+    menu_manager.open_menu(build_menu())
+
+    menu_manager.display()
+    textures_count = backend.get_textures_count()
+    menu_manager.display()
+
+    assert textures_count > 0
+    assert backend.get_textures_count() == textures_count
+
+
+def test_content_modified_in_place_is_uploaded_again(renderer):
+    backend = TextureBackend(renderer)
+    rich_text = RichTextElement("<color=white>Text</color>")
+    menu_manager = MenuManager(backend)
+    menu_manager.open_menu(InfoBox("Rich", [[rich_text]]))
+    menu_manager.display()
+
+    rich_text.set_span_color(0, pygame.Color("red"))
+    renderer.clear()
+    menu_manager.display()
+    rendered = renderer.to_surface()
+
+    rect = rich_text.get_rect()
+    assert any(
+        rendered.get_at((x, y)) == pygame.Color("red")
+        for x in range(rect.left, rect.right)
+        for y in range(rect.top, rect.bottom)
+    )
@@ -0,0 +1,90 @@
+import os
+
+import pygame
+
+from src.pygamepopup.components import InfoBox, RichTextElement, TextSpan
+from src.pygamepopup.constants import WHITE
+from src.pygamepopup.fonts import _load_font
+
+HIGHLIGHT_COLOR = pygame.Color("red")
+
+
+def test_parse_markup_with_nested_tags():
+    spans = RichTextElement.parse_markup(
+        "Deals <b><color=red>12</color> damage</b> per <i>turn</i>"
+    )
+
+    assert [span.text for span in spans] == [
+        "Deals ",
+        "12",
+        " damage",
+        " per ",
+        "turn",
+    ]
+    assert spans[1].bold and spans[1].color == HIGHLIGHT_COLOR
+    assert spans[2].bold and spans[2].color is None
+    assert spans[4].italic and not spans[4].bold
+
+
+def test_rich_text_is_wrapped_in_menu(screen):
+    rich_text = RichTextElement(
+        [TextSpan("A rather long sentence that "), TextSpan("must", bold=True)]
+        + [TextSpan(" be split in several lines to fit in the menu.")]
+    )
+    menu = InfoBox("Rich text", [[rich_text]], width=200)
+
+    menu.init_render(screen)
+
+    assert len(rich_text.lines) > 1
+    assert rich_text.get_width() <= 200
+
+
+def test_changing_span_color_only_invalidates_its_runs():
+    rich_text = RichTextElement("Gold: <color=white>150</color> coins")
+    rich_text.is_dirty = False
+
+    rich_text.set_span_color(1, HIGHLIGHT_COLOR)
+
+    dirty_area = rich_text.get_dirty_area()
+    assert rich_text.is_dirty
+    assert dirty_area is not None
+    assert dirty_area.width < rich_text.size[0]
+
+
+class StyleRecordingFont(pygame.font.Font):
+    def __init__(self, *arguments):
+        super().__init__(*arguments)
+        self.style_changes = []
+
+    def set_bold(self, value):
+        self.style_changes.append(("bold", value))
+        super().set_bold(value)
+
+    def set_italic(self, value):
+        self.style_changes.append(("italic", value))
+        super().set_italic(value)
+
+
+def test_styled_spans_do_not_modify_the_font_of_the_element():
+    font = StyleRecordingFont(None, 20)
+    regular_text = RichTextElement("Regular", font=font)
+
+    RichTextElement("Plain <b>bold</b> and <i>italic</i>", font=font)
+
+    assert font.style_changes == []
+    assert (
+        regular_text.content.get_size()
+        == font.render("Regular", True, WHITE).get_size()
+    )
+
+
+def test_sized_spans_keep_font_of_element():
+    font_path = os.path.join(os.path.dirname(pygame.__file__), "freesansbold.ttf")
+    font = _load_font({"is_system_font": False, "name": font_path, "size": 16})
+
+    rich_text = RichTextElement("<size=30>Big</size>", font=font)
+
+    assert (
+        rich_text.content.get_size()
+        == pygame.font.Font(font_path, 30).render("Big", True, WHITE).get_size()
+    )
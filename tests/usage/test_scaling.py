@@ -0,0 +1,106 @@
+import pygame
+
+from src.pygamepopup.components import Button, InfoBox, Gauge
+from src.pygamepopup.menu_manager import MenuManager
+from src.pygamepopup.scaling import ScaledScreen, ScalingMode
+
+
+def test_integer_scaling_is_centered():
+    screen = pygame.Surface((700, 400))
+    scaled_screen = ScaledScreen((320, 180), screen)
+
+    assert scaled_screen.scale == 2
+    assert scaled_screen.get_rect() == pygame.Rect(30, 20, 640, 360)
+    assert scaled_screen.to_logical_position((31, 23)) == (0, 1)
+
+
+def test_smooth_scaling_fills_screen():
+    screen = pygame.Surface((800, 450))
+    scaled_screen = ScaledScreen((320, 180), screen, ScalingMode.SMOOTH)
+
+    assert scaled_screen.scale == 2.5
+    assert scaled_screen.get_rect() == screen.get_rect()
+
+
+def test_menus_are_drawn_at_logical_resolution():
+    screen = pygame.Surface((640, 360))
+    clicks = []
+    button = Button(title="Go", size=(60, 20), callback=lambda: clicks.append(1))
+    menu_manager = MenuManager(screen, logical_resolution=(320, 180))
+    menu_manager.open_menu(InfoBox("Menu", [[button]], width=200))
+    menu_manager.display()
+
+    assert menu_manager.active_menu.get_rect().width == 200
+    center = button.get_rect().center
+    menu_manager.click(1, (center[0] * 2, center[1] * 2))
+
+    assert clicks == [1]
+
+
+def test_scaled_drawing_is_reused_when_nothing_changed(monkeypatch):
+    screen = pygame.Surface((640, 360))
+    gauge = Gauge(size=(100, 12), padding=2)
+    menu_manager = MenuManager(screen, logical_resolution=(320, 180))
+    menu_manager.open_menu(InfoBox("Menu", [[gauge]], has_close_button=False))
+    menu_manager.display()
+    scalings = []
+    original_scale = pygame.transform.scale
+    monkeypatch.setattr(
+        pygame.transform,
+        "scale",
+        lambda *args: scalings.append(args[1]) or original_scale(*args),
+    )
+
+    menu_manager.display()
+    assert scalings == []
+
+    gauge.set_value(0.5)
+    updated_rects = menu_manager.display_invalidated()
+
+    assert len(scalings) == 1
+    assert updated_rects[0].size == scalings[0]
+
+
+def test_scaled_tooltip_follows_linked_element():
+    screen = pygame.Surface((640, 360))
+    linked_element = pygame.Rect(10, 60, 20, 20)
+    tooltip = InfoBox(
+        "Tooltip",
+        [],
+        width=100,
+        has_close_button=False,
+        element_linked=linked_element,
+        follow_element_linked=True,
+    )
+    menu_manager = MenuManager(screen, logical_resolution=(320, 180))
+    menu_manager.open_menu(tooltip)
+    menu_manager.display()
+    initial_position = pygame.Vector2(tooltip.position)
+
+    linked_element.move_ip(40, 0)
+    menu_manager.display()
+
+    assert tooltip.position == initial_position + pygame.Vector2(40, 0)
+
+
+def test_hover_is_refreshed_at_logical_position(monkeypatch):
+    screen = pygame.Surface((640, 360))
+    menu_manager = MenuManager(screen, logical_resolution=(320, 180))
+    background_button = Button(title="Background", size=(60, 20))
+    menu_manager.open_menu(
+        InfoBox("Background", [[background_button]], width=200, position=(100, 0))
+    )
+    button = Button(title="Hovered", size=(60, 20))
+    menu = InfoBox("Menu", [[button]], width=90, position=(0, 0))
+    menu_manager.open_menu(menu)
+    menu_manager.close_active_menu()
+
+    center = button.get_rect().center
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: (center[0] * 2, center[1] * 2))
+    menu_manager.open_menu(menu)
+    assert button._is_hovered
+
+    center = background_button.get_rect().center
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: (center[0] * 2, center[1] * 2))
+    menu_manager.close_active_menu()
+    assert background_button._is_hovered
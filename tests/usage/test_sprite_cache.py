@@ -0,0 +1,109 @@
+import os
+import shutil
+
+import pygame
+import pytest
+
+from src.pygamepopup import configuration
+from src.pygamepopup.components import Button, TextElement
+from src.pygamepopup.fonts import _get_font_signature, _load_font
+from src.pygamepopup.sprite_cache import SpriteCache
+
+
+@pytest.fixture
+def sprite_cache(tmp_path):
+    sprite_cache = SpriteCache(str(tmp_path / "sprites"))
+    configuration.set_sprite_cache(sprite_cache)
+    yield sprite_cache
+    configuration.set_sprite_cache(None)
+
+
+def test_store_and_load_surface(tmp_path):
+    sprite_cache = SpriteCache(str(tmp_path))
+    surface = pygame.Surface((4, 3), pygame.SRCALPHA)
+    surface.fill((10, 20, 30, 40))
+
+    sprite_cache.store("key", surface)
+    loaded_surface = sprite_cache.load("key")
+
+    assert loaded_surface.get_size() == (4, 3)
+    assert loaded_surface.get_at((1, 1)) == pygame.Color(10, 20, 30, 40)
+
+
+def test_cache_is_persisted_across_instances(tmp_path):
+    SpriteCache(str(tmp_path)).store("key", pygame.Surface((2, 2)))
+
+    assert SpriteCache(str(tmp_path)).load("key") is not None
+
+
+def test_least_recently_used_surfaces_are_evicted(tmp_path):
+    surface = pygame.Surface((10, 10))
+    sprite_size = len(pygame.image.tobytes(surface, "RGBA")) + 12
+    sprite_cache = SpriteCache(str(tmp_path), max_size=sprite_size * 2)
+
+    sprite_cache.store("first", surface)
+    sprite_cache.store("second", surface)
+    sprite_cache.store("third", surface)
+
+    assert sprite_cache.get_total_size() <= sprite_size * 2
+    assert sprite_cache.load("first") is None
+    assert sprite_cache.load("third") is not None
+
+
+def test_components_sprites_are_loaded_from_cache(sprite_cache):
+    Button(title="A cached button")
+    TextElement("A cached text")
+    stored_sprites_count = sprite_cache.misses
+    assert stored_sprites_count > 0
+
+    button = Button(title="A cached button")
+    TextElement("A cached text")
+
+    assert sprite_cache.hits == stored_sprites_count
+    assert button.sprite.get_size() == button.size
+
+
+def test_store_does_not_overwrite_temporary_file_of_other_process(tmp_path):
+    sprite_cache = SpriteCache(str(tmp_path))
+    other_temporary_file = tmp_path / "key.sprite.tmp"
+    other_temporary_file.write_bytes(b"being written")
+
+    sprite_cache.store("key", pygame.Surface((2, 2)))
+
+    assert other_temporary_file.read_bytes() == b"being written"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "key.sprite",
+        "key.sprite.tmp",
+    ]
+
+
+def test_load_from_read_only_cache(tmp_path, monkeypatch):
+    sprite_cache = SpriteCache(str(tmp_path))
+    sprite_cache.store("key", pygame.Surface((2, 2)))
+
+    def raise_permission_error(*args):
+        raise PermissionError
+
+    monkeypatch.setattr(os, "utime", raise_permission_error)
+
+    assert sprite_cache.load("key") is not None
+
+
+def test_fonts_from_different_files_have_different_signatures(tmp_path):
+    fonts = []
+    for directory_name in ("first", "second"):
+        font_path = tmp_path / directory_name / pygame.font.get_default_font()
+        font_path.parent.mkdir()
+        shutil.copyfile(
+            os.path.join(
+                os.path.dirname(pygame.__file__), pygame.font.get_default_font()
+            ),
+            font_path,
+        )
+        fonts.append(
+            _load_font({"is_system_font": False, "name": str(font_path), "size": 20})
+        )
+
+    assert fonts[0].name == fonts[1].name
+    assert fonts[0].get_height() == fonts[1].get_height()
+    assert _get_font_signature(fonts[0]) != _get_font_signature(fonts[1])
@@ -0,0 +1,21 @@
+from src.pygamepopup.components import TextElement
+
+
+def test_single_line_is_not_rendered_again_when_wrapped():
+    text_element = TextElement("Short text")
+    rendered_text = text_element.content
+
+    text_element.wrap(300)
+
+    assert text_element.lines == ["Short text"]
+    assert text_element.content is rendered_text
+
+
+def test_text_is_rendered_again_when_split():
+    text_element = TextElement("A text that does not fit")
+    rendered_text = text_element.content
+
+    text_element.wrap(text_element.size[0] // 2)
+
+    assert len(text_element.lines) > 1
+    assert text_element.content is not rendered_text
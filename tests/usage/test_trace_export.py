@@ -0,0 +1,54 @@
+import json
+
+from src.pygamepopup import instrumentation
+from src.pygamepopup.components import InfoBox, Button, TextElement
+from src.pygamepopup.menu_manager import MenuManager
+from src.pygamepopup.trace_export import ChromeTraceExporter
+
+
+def test_menu_operations_are_exported_as_trace_events(screen, tmp_path):
+    menu_manager = MenuManager(screen)
+
+    with ChromeTraceExporter() as exporter:
+        button = Button(title="Run", callback=lambda: None)
+        menu = InfoBox(
+            "Traced menu",
+            [[TextElement("Some text to be wrapped")], [button]],
+            identifier="Traced",
+        )
+        menu_manager.open_menu(menu)
+        menu_manager.display()
+        menu_manager.click(1, button.get_rect().center)
+
+    assert not instrumentation.is_enabled()
+    names = {event["name"] for event in exporter.events}
+    assert {
+        "init_render",
+        "wrap_text",
+        "load_image",
+        "display",
+        "display_batch",
+        "callback",
+    } <= names
+    display_event = next(
+        event for event in exporter.events if event["name"] == "display"
+    )
+    assert display_event["ph"] == "X"
+    assert display_event["args"] == {"menu": "Traced"}
+    assert display_event["dur"] >= 0
+
+    trace_path = tmp_path / "trace.json"
+    exporter.save(str(trace_path))
+    with open(trace_path, encoding="utf-8") as trace_file:
+        assert len(json.load(trace_file)["traceEvents"]) == len(exporter.events)
+    instrumentation.reset()
+
+
+def test_nothing_is_exported_once_stopped(screen):
+    exporter = ChromeTraceExporter()
+    exporter.start()
+    exporter.stop()
+
+    MenuManager(screen).open_menu(InfoBox("Menu", [[Button(title="Button")]]))
+
+    assert exporter.events == []